@@ -0,0 +1,56 @@
+"""keyset pagination indexes
+
+Revision ID: 20261019_0002
+Revises: 20260207_0001
+Create Date: 2026-10-19 09:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0002"
+down_revision: Union[str, None] = "20260207_0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f("ix_users_created_at_id"), "users", ["created_at", "id"], unique=False)
+    op.create_index(op.f("ix_classes_created_at_id"), "classes", ["created_at", "id"], unique=False)
+    op.create_index(op.f("ix_sessions_starts_at_id"), "sessions", ["starts_at", "id"], unique=False)
+    op.create_index(
+        op.f("ix_announcements_created_at_id"),
+        "announcements",
+        ["created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_qna_questions_created_at_id"),
+        "qna_questions",
+        ["created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_qna_replies_question_id_created_at_id"),
+        "qna_replies",
+        ["question_id", "created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_quarterly_plans_created_at_id"),
+        "quarterly_plans",
+        ["created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_quarterly_plans_created_at_id"), table_name="quarterly_plans")
+    op.drop_index(op.f("ix_qna_replies_question_id_created_at_id"), table_name="qna_replies")
+    op.drop_index(op.f("ix_qna_questions_created_at_id"), table_name="qna_questions")
+    op.drop_index(op.f("ix_announcements_created_at_id"), table_name="announcements")
+    op.drop_index(op.f("ix_sessions_starts_at_id"), table_name="sessions")
+    op.drop_index(op.f("ix_classes_created_at_id"), table_name="classes")
+    op.drop_index(op.f("ix_users_created_at_id"), table_name="users")
@@ -0,0 +1,52 @@
+"""question tags
+
+Revision ID: 20261019_0004
+Revises: 20261019_0003
+Create Date: 2026-10-19 13:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0004"
+down_revision: Union[str, None] = "20261019_0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "question_tags",
+        sa.Column("question_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("tag", sa.String(length=50), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["question_id"],
+            ["qna_questions.id"],
+            name=op.f("fk_question_tags_question_id_qna_questions"),
+        ),
+        sa.PrimaryKeyConstraint("question_id", "tag", name=op.f("pk_question_tags")),
+    )
+    op.create_index(
+        op.f("ix_question_tags_tag_question_id"),
+        "question_tags",
+        ["tag", "question_id"],
+        unique=False,
+    )
+    op.execute(
+        """
+        INSERT INTO question_tags (question_id, tag)
+        SELECT DISTINCT q.id, left(lower(trim(t.tag)), 50)
+        FROM qna_questions AS q
+        CROSS JOIN LATERAL json_array_elements_text(q.tags) AS t(tag)
+        WHERE q.is_deleted IS false AND trim(t.tag) <> ''
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_question_tags_tag_question_id"), table_name="question_tags")
+    op.drop_table("question_tags")
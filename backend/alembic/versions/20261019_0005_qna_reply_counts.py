@@ -0,0 +1,68 @@
+"""qna reply counts and activity
+
+Revision ID: 20261019_0005
+Revises: 20261019_0004
+Create Date: 2026-10-19 15:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0005"
+down_revision: Union[str, None] = "20261019_0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "qna_questions",
+        sa.Column("reply_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+    op.add_column(
+        "qna_questions",
+        sa.Column(
+            "last_activity_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+    )
+    op.execute(
+        """
+        UPDATE qna_questions AS q
+        SET reply_count = r.reply_count,
+            last_activity_at = GREATEST(q.created_at, r.last_reply_at)
+        FROM (
+            SELECT question_id, count(*) AS reply_count, max(created_at) AS last_reply_at
+            FROM qna_replies
+            WHERE is_deleted IS false
+            GROUP BY question_id
+        ) AS r
+        WHERE r.question_id = q.id
+        """
+    )
+    op.execute("UPDATE qna_questions SET last_activity_at = created_at WHERE reply_count = 0")
+    op.create_index(
+        op.f("ix_qna_questions_last_activity_at_id"),
+        "qna_questions",
+        ["last_activity_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_qna_questions_unanswered"),
+        "qna_questions",
+        ["created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("reply_count = 0 AND is_deleted IS false"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_qna_questions_unanswered"), table_name="qna_questions")
+    op.drop_index(op.f("ix_qna_questions_last_activity_at_id"), table_name="qna_questions")
+    op.drop_column("qna_questions", "last_activity_at")
+    op.drop_column("qna_questions", "reply_count")
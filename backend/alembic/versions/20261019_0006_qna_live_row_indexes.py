@@ -0,0 +1,70 @@
+"""qna live row partial indexes
+
+Revision ID: 20261019_0006
+Revises: 20261019_0005
+Create Date: 2026-10-19 17:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0006"
+down_revision: Union[str, None] = "20261019_0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIVE_ROWS = sa.text("is_deleted IS false")
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f("ix_qna_questions_live_created_at_id"),
+        "qna_questions",
+        ["created_at", "id"],
+        unique=False,
+        postgresql_where=LIVE_ROWS,
+    )
+    op.create_index(
+        op.f("ix_qna_questions_live_last_activity_at_id"),
+        "qna_questions",
+        ["last_activity_at", "id"],
+        unique=False,
+        postgresql_where=LIVE_ROWS,
+    )
+    op.create_index(
+        op.f("ix_qna_replies_live_question_id_created_at_id"),
+        "qna_replies",
+        ["question_id", "created_at", "id"],
+        unique=False,
+        postgresql_where=LIVE_ROWS,
+    )
+    op.drop_index(op.f("ix_qna_questions_created_at_id"), table_name="qna_questions")
+    op.drop_index(op.f("ix_qna_questions_last_activity_at_id"), table_name="qna_questions")
+    op.drop_index(op.f("ix_qna_replies_question_id_created_at_id"), table_name="qna_replies")
+
+
+def downgrade() -> None:
+    op.create_index(
+        op.f("ix_qna_replies_question_id_created_at_id"),
+        "qna_replies",
+        ["question_id", "created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_qna_questions_last_activity_at_id"),
+        "qna_questions",
+        ["last_activity_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_qna_questions_created_at_id"),
+        "qna_questions",
+        ["created_at", "id"],
+        unique=False,
+    )
+    op.drop_index(op.f("ix_qna_replies_live_question_id_created_at_id"), table_name="qna_replies")
+    op.drop_index(op.f("ix_qna_questions_live_last_activity_at_id"), table_name="qna_questions")
+    op.drop_index(op.f("ix_qna_questions_live_created_at_id"), table_name="qna_questions")
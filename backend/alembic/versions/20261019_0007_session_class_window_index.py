@@ -0,0 +1,31 @@
+"""session class window index
+
+Revision ID: 20261019_0007
+Revises: 20261019_0006
+Create Date: 2026-10-19 19:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0007"
+down_revision: Union[str, None] = "20261019_0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f("ix_sessions_class_id_starts_at_id"),
+        "sessions",
+        ["class_id", "starts_at", "id"],
+        unique=False,
+    )
+    op.drop_index(op.f("ix_sessions_class_id"), table_name="sessions")
+
+
+def downgrade() -> None:
+    op.create_index(op.f("ix_sessions_class_id"), "sessions", ["class_id"], unique=False)
+    op.drop_index(op.f("ix_sessions_class_id_starts_at_id"), table_name="sessions")
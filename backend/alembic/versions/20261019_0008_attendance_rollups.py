@@ -0,0 +1,121 @@
+"""attendance rollups
+
+Revision ID: 20261019_0008
+Revises: 20261019_0007
+Create Date: 2026-10-19 21:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0008"
+down_revision: Union[str, None] = "20261019_0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+attendance_status = postgresql.ENUM(
+    "present",
+    "absent",
+    "excused",
+    name="attendance_status",
+    create_type=False,
+)
+
+
+def _count_columns() -> list[sa.Column]:
+    return [
+        sa.Column("present_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("absent_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("excused_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    ]
+
+
+def upgrade() -> None:
+    op.add_column("attendance", sa.Column("previous_status", attendance_status, nullable=True))
+
+    op.create_table(
+        "attendance_session_summaries",
+        sa.Column("session_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("class_id", postgresql.UUID(as_uuid=True), nullable=False),
+        *_count_columns(),
+        sa.ForeignKeyConstraint(
+            ["session_id"],
+            ["sessions.id"],
+            name=op.f("fk_attendance_session_summaries_session_id_sessions"),
+        ),
+        sa.ForeignKeyConstraint(
+            ["class_id"],
+            ["classes.id"],
+            name=op.f("fk_attendance_session_summaries_class_id_classes"),
+        ),
+        sa.PrimaryKeyConstraint("session_id", name=op.f("pk_attendance_session_summaries")),
+    )
+    op.create_index(
+        op.f("ix_attendance_session_summaries_class_id"),
+        "attendance_session_summaries",
+        ["class_id"],
+        unique=False,
+    )
+
+    op.create_table(
+        "attendance_member_summaries",
+        sa.Column("class_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        *_count_columns(),
+        sa.ForeignKeyConstraint(
+            ["class_id"],
+            ["classes.id"],
+            name=op.f("fk_attendance_member_summaries_class_id_classes"),
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+            name=op.f("fk_attendance_member_summaries_user_id_users"),
+        ),
+        sa.PrimaryKeyConstraint("class_id", "user_id", name=op.f("pk_attendance_member_summaries")),
+    )
+    op.create_index(
+        op.f("ix_attendance_member_summaries_user_id"),
+        "attendance_member_summaries",
+        ["user_id"],
+        unique=False,
+    )
+
+    op.execute(
+        """
+        INSERT INTO attendance_session_summaries
+            (session_id, class_id, present_count, absent_count, excused_count)
+        SELECT a.session_id, s.class_id,
+               count(*) FILTER (WHERE a.status = 'present'),
+               count(*) FILTER (WHERE a.status = 'absent'),
+               count(*) FILTER (WHERE a.status = 'excused')
+        FROM attendance AS a
+        JOIN sessions AS s ON s.id = a.session_id
+        GROUP BY a.session_id, s.class_id
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO attendance_member_summaries
+            (class_id, user_id, present_count, absent_count, excused_count)
+        SELECT s.class_id, a.user_id,
+               count(*) FILTER (WHERE a.status = 'present'),
+               count(*) FILTER (WHERE a.status = 'absent'),
+               count(*) FILTER (WHERE a.status = 'excused')
+        FROM attendance AS a
+        JOIN sessions AS s ON s.id = a.session_id
+        GROUP BY s.class_id, a.user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_attendance_member_summaries_user_id"), table_name="attendance_member_summaries")
+    op.drop_table("attendance_member_summaries")
+    op.drop_index(op.f("ix_attendance_session_summaries_class_id"), table_name="attendance_session_summaries")
+    op.drop_table("attendance_session_summaries")
+    op.drop_column("attendance", "previous_status")
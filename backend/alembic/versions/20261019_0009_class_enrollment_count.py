@@ -0,0 +1,40 @@
+"""class enrollment count
+
+Revision ID: 20261019_0009
+Revises: 20261019_0008
+Create Date: 2026-10-19 22:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0009"
+down_revision: Union[str, None] = "20261019_0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "classes",
+        sa.Column("enrollment_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+    op.execute(
+        """
+        UPDATE classes
+        SET enrollment_count = counts.enrolled
+        FROM (
+            SELECT class_id, count(*) AS enrolled
+            FROM enrollments
+            GROUP BY class_id
+        ) AS counts
+        WHERE counts.class_id = classes.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("classes", "enrollment_count")
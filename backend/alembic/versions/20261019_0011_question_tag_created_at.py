@@ -0,0 +1,48 @@
+"""question tag created_at
+
+Revision ID: 20261019_0011
+Revises: 20261019_0010
+Create Date: 2026-10-19 23:30:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0011"
+down_revision: Union[str, None] = "20261019_0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("question_tags", sa.Column("created_at", sa.DateTime(timezone=True), nullable=True))
+    op.execute(
+        """
+        UPDATE question_tags AS t
+        SET created_at = q.created_at
+        FROM qna_questions AS q
+        WHERE q.id = t.question_id
+        """
+    )
+    op.alter_column("question_tags", "created_at", nullable=False)
+    op.drop_index(op.f("ix_question_tags_tag_question_id"), table_name="question_tags")
+    op.create_index(
+        op.f("ix_question_tags_tag_created_at_question_id"),
+        "question_tags",
+        ["tag", "created_at", "question_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_question_tags_tag_created_at_question_id"), table_name="question_tags")
+    op.create_index(
+        op.f("ix_question_tags_tag_question_id"),
+        "question_tags",
+        ["tag", "question_id"],
+        unique=False,
+    )
+    op.drop_column("question_tags", "created_at")
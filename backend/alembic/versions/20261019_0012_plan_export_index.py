@@ -0,0 +1,31 @@
+"""plan export index
+
+Revision ID: 20261019_0012
+Revises: 20261019_0011
+Create Date: 2026-10-19 23:45:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_0012"
+down_revision: Union[str, None] = "20261019_0011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f("ix_quarterly_plans_quarter_created_at_id"),
+        "quarterly_plans",
+        ["quarter", "created_at", "id"],
+        unique=False,
+    )
+    op.drop_index(op.f("ix_quarterly_plans_quarter"), table_name="quarterly_plans")
+
+
+def downgrade() -> None:
+    op.create_index(op.f("ix_quarterly_plans_quarter"), "quarterly_plans", ["quarter"], unique=False)
+    op.drop_index(op.f("ix_quarterly_plans_quarter_created_at_id"), table_name="quarterly_plans")
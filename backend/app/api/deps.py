@@ -1,8 +1,8 @@
 """Reusable API dependencies for auth and RBAC checks."""
 
+import uuid
 from collections.abc import Callable
 from typing import Annotated
-import uuid
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
@@ -6,8 +6,10 @@ from app.api.routes import (
     announcements,
     attendance,
     auth,
+    cache,
     classes,
     enrollment,
+    events,
     health,
     plans,
     qna,
@@ -31,5 +33,7 @@ v1_router.include_router(attendance.router)
 v1_router.include_router(announcements.router)
 v1_router.include_router(qna.router)
 v1_router.include_router(plans.router)
+v1_router.include_router(events.router)
+v1_router.include_router(cache.router)
 
 api_router.include_router(v1_router)
@@ -3,14 +3,17 @@
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, require_roles
+from app.api.streaming import NDJSON_RESPONSES, ndjson_rows_response, wants_ndjson
 from app.db.session import get_db
 from app.models.user import User, UserRole
 from app.schemas.announcement import AnnouncementCreate, AnnouncementRead
+from app.schemas.common import Page, page_json
 from app.services.announcement_service import AnnouncementService
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 router = APIRouter(prefix="/announcements", tags=["announcements"])
 
@@ -31,15 +34,25 @@ async def create_announcement(
     return AnnouncementRead.model_validate(created)
 
 
-@router.get("", response_model=list[AnnouncementRead])
+@router.get("", response_model=Page[AnnouncementRead], responses=NDJSON_RESPONSES)
 async def list_announcements(
+    request: Request,
     _: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> list[AnnouncementRead]:
-    """List announcements."""
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None),
+) -> Response:
+    """List announcements, newest first, one cursor page at a time."""
 
-    announcements = await AnnouncementService(db).list_announcements()
-    return [AnnouncementRead.model_validate(item) for item in announcements]
+    if wants_ndjson(request):
+        return ndjson_rows_response(AnnouncementService(db).stream_announcements(), AnnouncementRead)
+
+    try:
+        page = await AnnouncementService(db).list_announcements(limit=limit, cursor=cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    return Response(content=page_json(AnnouncementRead, page.items, page.next_cursor), media_type="application/json")
 
 
 @router.delete("/{announcement_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -3,13 +3,22 @@
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import require_roles
+from app.api.deps import get_current_user, require_roles
 from app.db.session import get_db
 from app.models.user import User, UserRole
-from app.schemas.attendance import AttendanceMarkRequest, AttendanceRead
+from app.schemas.attendance import (
+    AttendanceMarkRequest,
+    AttendanceRead,
+    AttendanceRollCallRequest,
+    AttendanceRollCallResponse,
+    AttendanceRollCallResult,
+    MemberAttendanceSummary,
+    SessionAttendanceSummary,
+)
+from app.schemas.common import list_json
 from app.services.attendance_service import AttendanceService
 
 router = APIRouter(prefix="/attendance", tags=["attendance"])
@@ -37,12 +46,85 @@ async def mark_attendance(
     return AttendanceRead.model_validate(record)
 
 
+@router.post("/roll-call", response_model=AttendanceRollCallResponse)
+async def roll_call(
+    payload: AttendanceRollCallRequest,
+    current_user: Annotated[User, Depends(require_roles(UserRole.LEAD, UserRole.ADMIN))],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> AttendanceRollCallResponse:
+    """Mark attendance for a whole session roster in one request."""
+
+    service = AttendanceService(db)
+    try:
+        records = await service.roll_call(
+            session_id=payload.session_id,
+            marked_by_id=current_user.id,
+            statuses=payload.statuses,
+        )
+    except LookupError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+
+    results = [
+        AttendanceRollCallResult(
+            user_id=user_id,
+            status=payload.statuses[user_id],
+            outcome="not_enrolled" if record is None else "marked",
+            attendance=None if record is None else AttendanceRead.model_validate(record),
+        )
+        for user_id, record in records.items()
+    ]
+    return AttendanceRollCallResponse(session_id=payload.session_id, results=results)
+
+
+@router.get("/me", response_model=list[MemberAttendanceSummary])
+async def get_my_attendance_summary(
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> Response:
+    """Return the current user's attendance rate in each class."""
+
+    rows = await AttendanceService(db).summaries_for_user(current_user.id)
+    return Response(content=list_json(MemberAttendanceSummary, rows), media_type="application/json")
+
+
+@router.get("/classes/{class_id}/sessions", response_model=list[SessionAttendanceSummary])
+async def get_class_session_summaries(
+    class_id: uuid.UUID,
+    _: Annotated[User, Depends(require_roles(UserRole.LEAD, UserRole.ADMIN))],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> Response:
+    """Return attendance counts and rate for each marked session of a class."""
+
+    try:
+        rows = await AttendanceService(db).session_summaries(class_id)
+    except LookupError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+
+    return Response(content=list_json(SessionAttendanceSummary, rows), media_type="application/json")
+
+
+@router.get("/classes/{class_id}/members", response_model=list[MemberAttendanceSummary])
+async def get_class_member_summaries(
+    class_id: uuid.UUID,
+    _: Annotated[User, Depends(require_roles(UserRole.LEAD, UserRole.ADMIN))],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> Response:
+    """Return attendance counts and rate for each marked member of a class."""
+
+    try:
+        rows = await AttendanceService(db).member_summaries(class_id)
+    except LookupError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+
+    return Response(content=list_json(MemberAttendanceSummary, rows), media_type="application/json")
+
+
 @router.get("/{session_id}", response_model=list[AttendanceRead])
 async def list_attendance(
     session_id: uuid.UUID,
     _: Annotated[User, Depends(require_roles(UserRole.LEAD, UserRole.ADMIN))],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> list[AttendanceRead]:
+) -> Response:
     """List attendance records for one session."""
 
     service = AttendanceService(db)
@@ -51,4 +133,4 @@ async def list_attendance(
     except LookupError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
 
-    return [AttendanceRead.model_validate(record) for record in records]
+    return Response(content=list_json(AttendanceRead, records), media_type="application/json")
@@ -0,0 +1,21 @@
+"""In-process cache metrics endpoints."""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+
+from app.api.deps import require_roles
+from app.core.cache import caches
+from app.models.user import User, UserRole
+from app.schemas.cache import CacheStatsRead
+
+router = APIRouter(prefix="/cache", tags=["cache"])
+
+
+@router.get("/stats", response_model=dict[str, CacheStatsRead])
+async def cache_stats(
+    _: Annotated[User, Depends(require_roles(UserRole.ADMIN))],
+) -> dict[str, CacheStatsRead]:
+    """Report size, hits, misses and hit rate of this worker's caches (admin only)."""
+
+    return {name: CacheStatsRead.model_validate(cache.stats()) for name, cache in caches.items()}
@@ -3,14 +3,17 @@
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, require_roles
+from app.api.streaming import NDJSON_RESPONSES, ndjson_rows_response, wants_ndjson
 from app.db.session import get_db
 from app.models.user import User, UserRole
 from app.schemas.class_ import ClassCreate, ClassRead, ClassUpdate
+from app.schemas.common import Page
 from app.services.class_service import ClassService
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 router = APIRouter(prefix="/classes", tags=["classes"])
 
@@ -33,15 +36,25 @@ async def create_class(
     return ClassRead.model_validate(created)
 
 
-@router.get("", response_model=list[ClassRead])
+@router.get("", response_model=Page[ClassRead], responses=NDJSON_RESPONSES)
 async def list_classes(
+    request: Request,
     _: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> list[ClassRead]:
-    """List classes."""
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None),
+) -> Response:
+    """List classes, newest first, one cursor page at a time."""
 
-    classes = await ClassService(db).list_classes()
-    return [ClassRead.model_validate(class_) for class_ in classes]
+    if wants_ndjson(request):
+        return ndjson_rows_response(ClassService(db).stream_classes(), ClassRead)
+
+    try:
+        body = await ClassService(db).list_classes(limit=limit, cursor=cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/{class_id}", response_model=ClassRead)
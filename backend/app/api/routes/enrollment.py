@@ -1,16 +1,33 @@
 """Enrollment endpoints."""
 
 import uuid
+from collections.abc import AsyncIterator
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, require_roles
+from app.api.streaming import NDJSON_RESPONSES, ndjson_response
 from app.db.session import get_db
 from app.models.user import User, UserRole
-from app.schemas.enrollment import EnrollmentCreate, EnrollmentRead
-from app.services.enrollment_service import EnrollmentService
+from app.schemas.common import list_json
+from app.schemas.enrollment import (
+    EnrollmentCreate,
+    EnrollmentImportResult,
+    EnrollmentRead,
+)
+from app.services.enrollment_service import EnrollmentService, ImportOutcome
+from app.utils.roster import RosterFormat, iter_roster_emails
 
 router = APIRouter(prefix="/enrollment", tags=["enrollment"])
 
@@ -34,6 +51,37 @@ async def enroll_in_class(
     return EnrollmentRead.model_validate(enrollment)
 
 
+async def _import_results(outcomes: AsyncIterator[ImportOutcome]) -> AsyncIterator[EnrollmentImportResult]:
+    async for line, email, outcome, user_id in outcomes:
+        yield EnrollmentImportResult(line=line, email=email, outcome=outcome, user_id=user_id)
+
+
+@router.post(
+    "/import",
+    response_class=StreamingResponse,
+    responses=NDJSON_RESPONSES,
+)
+async def import_enrollments(
+    file: UploadFile,
+    _: Annotated[User, Depends(require_roles(UserRole.LEAD, UserRole.ADMIN))],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    class_id: uuid.UUID = Query(),
+    roster_format: RosterFormat = Query(default="csv", alias="format"),
+) -> StreamingResponse:
+    """Bulk-enroll members from a CSV or JSONL roster (lead/admin only).
+
+    Streams one JSON result per roster row as newline-delimited JSON.
+    """
+
+    service = EnrollmentService(db)
+    try:
+        outcomes = await service.import_roster(class_id, iter_roster_emails(file, roster_format))
+    except LookupError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+
+    return ndjson_response(_import_results(outcomes))
+
+
 @router.delete("/{class_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def unenroll_from_class(
     class_id: uuid.UUID,
@@ -54,7 +102,7 @@ async def list_enrollments(
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
     class_id: uuid.UUID | None = Query(default=None),
-) -> list[EnrollmentRead]:
+) -> Response:
     """List enrollments for current user, or by class for lead/admin."""
 
     service = EnrollmentService(db)
@@ -68,4 +116,4 @@ async def list_enrollments(
     else:
         enrollments = await service.list_for_user(current_user.id)
 
-    return [EnrollmentRead.model_validate(enrollment) for enrollment in enrollments]
+    return Response(content=list_json(EnrollmentRead, enrollments), media_type="application/json")
@@ -0,0 +1,56 @@
+"""Server-Sent Events endpoint for live announcements and Q&A replies."""
+
+import uuid
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_user
+from app.api.streaming import SSE_RESPONSES, sse_response
+from app.core.config import get_settings
+from app.core.events import ANNOUNCEMENTS_TOPIC, event_hub, question_topic
+from app.db.session import get_db
+from app.models.user import User
+from app.services.qna_service import QnAService
+
+MAX_QUESTION_SUBSCRIPTIONS = 50
+
+settings = get_settings()
+router = APIRouter(prefix="/events", tags=["events"])
+
+
+@router.get("", response_class=StreamingResponse, responses=SSE_RESPONSES)
+async def stream_events(
+    _: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    announcements: bool = Query(default=False),
+    question_id: list[uuid.UUID] = Query(default=[], max_length=MAX_QUESTION_SUBSCRIPTIONS),
+    last_event_id: Annotated[str | None, Header()] = None,
+) -> StreamingResponse:
+    """Stream new announcements and replies on the given questions as they are posted.
+
+    Reconnecting with ``Last-Event-ID`` replays missed events; a ``reset``
+    event means they are no longer buffered and the client should reload.
+    """
+
+    if not announcements and not question_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Subscribe to announcements or at least one question",
+        )
+
+    try:
+        await QnAService(db).require_live_questions(question_id)
+    except LookupError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+
+    # The stream can stay open for hours; give the connection back to the pool now.
+    await db.close()
+
+    topics = [question_topic(value) for value in question_id]
+    if announcements:
+        topics.append(ANNOUNCEMENTS_TOPIC)
+    subscription = event_hub.subscribe(topics, last_event_id=last_event_id)
+    return sse_response(event_hub, subscription, settings.sse_heartbeat_seconds)
@@ -3,18 +3,54 @@
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import require_roles
+from app.api.streaming import NDJSON_RESPONSES, ndjson_rows_response, wants_ndjson
 from app.db.session import get_db
 from app.models.user import User, UserRole
-from app.schemas.common import MessageResponse
-from app.schemas.plan import PlanCreate, PlanRead, PlanUpdate
-from app.services.plan_service import PlanService
+from app.schemas.common import MessageResponse, Page, page_json
+from app.schemas.plan import JsonPatchOperation, PlanCreate, PlanRead, PlanUpdate
+from app.services.plan_service import (
+    PlanService,
+    PlanVersionMismatchError,
+    PlanWriteConflictError,
+)
+from app.utils.json_patch import JsonPatchError
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.utils.plan_export import EXPORT_MEDIA_TYPES, PlanExportFormat
 
 router = APIRouter(prefix="/plans", tags=["plans"])
 
+JSON_PATCH_MEDIA_TYPE = "application/json-patch+json"
+
+
+def _etag(version: int) -> str:
+    return f'"{version}"'
+
+
+def _parse_if_match(value: str) -> int:
+    """Return the plan version named by an ``If-Match`` header."""
+
+    tag = value.strip().removeprefix("W/").strip('"')
+    if not (tag.isascii() and tag.isdigit()):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="If-Match must be an ETag returned for this plan",
+        )
+    return int(tag)
+
 
 @router.post("", response_model=PlanRead, status_code=status.HTTP_201_CREATED)
 async def create_plan(
@@ -32,21 +68,52 @@ async def create_plan(
     return PlanRead.model_validate(plan)
 
 
-@router.get("", response_model=list[PlanRead])
+@router.get("", response_model=Page[PlanRead], responses=NDJSON_RESPONSES)
 async def list_plans(
+    request: Request,
     _: Annotated[User, Depends(require_roles(UserRole.LEAD, UserRole.ADMIN))],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> list[PlanRead]:
-    """List quarterly plans."""
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None),
+) -> Response:
+    """List quarterly plans, newest first, one cursor page at a time."""
 
-    plans = await PlanService(db).list_plans()
-    return [PlanRead.model_validate(plan) for plan in plans]
+    if wants_ndjson(request):
+        return ndjson_rows_response(PlanService(db).stream_plans(), PlanRead)
+
+    try:
+        page = await PlanService(db).list_plans(limit=limit, cursor=cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    return Response(content=page_json(PlanRead, page.items, page.next_cursor), media_type="application/json")
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()}}},
+)
+async def export_plans(
+    _: Annotated[User, Depends(require_roles(UserRole.LEAD, UserRole.ADMIN))],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    export_format: PlanExportFormat = Query(default="csv", alias="format"),
+    quarter: list[str] = Query(default=[]),
+) -> StreamingResponse:
+    """Download every plan, or only those in the given quarters, as one CSV or JSONL file."""
+
+    return StreamingResponse(
+        PlanService(db).export_plans(export_format, quarters=quarter),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="plans.{export_format}"'},
+    )
 
 
 @router.patch("/{plan_id}", response_model=PlanRead)
 async def update_plan(
     plan_id: uuid.UUID,
     payload: PlanUpdate,
+    response: Response,
     _: Annotated[User, Depends(require_roles(UserRole.LEAD, UserRole.ADMIN))],
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> PlanRead:
@@ -57,7 +124,55 @@ async def update_plan(
         plan = await service.update_plan(plan_id, payload.model_dump(exclude_none=True))
     except LookupError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except PlanWriteConflictError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+
+    response.headers["ETag"] = _etag(plan.version)
+    return PlanRead.model_validate(plan)
+
+
+@router.patch(
+    "/{plan_id}/objectives",
+    response_model=PlanRead,
+    openapi_extra={"requestBody": {"content": {JSON_PATCH_MEDIA_TYPE: {}}}},
+)
+async def patch_plan_objectives(
+    plan_id: uuid.UUID,
+    operations: list[JsonPatchOperation],
+    response: Response,
+    _: Annotated[User, Depends(require_roles(UserRole.LEAD, UserRole.ADMIN))],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    if_match: Annotated[str | None, Header()] = None,
+) -> PlanRead:
+    """Apply a JSON Patch (RFC 6902) to the plan's objectives list.
+
+    ``If-Match`` must carry the plan's current ETag (its ``version``); a stale
+    one is rejected with 412 so concurrent edits are never silently lost. A
+    patch that does not apply to the current objectives (missing path, failed
+    ``test``) is rejected with 409 and nothing is written.
+    """
+
+    if if_match is None:
+        raise HTTPException(
+            status_code=status.HTTP_428_PRECONDITION_REQUIRED,
+            detail="If-Match header with the plan ETag is required",
+        )
+
+    service = PlanService(db)
+    try:
+        plan = await service.patch_objectives(
+            plan_id,
+            [operation.model_dump(by_alias=True, exclude_unset=True) for operation in operations],
+            expected_version=_parse_if_match(if_match),
+        )
+    except LookupError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except PlanVersionMismatchError as exc:
+        raise HTTPException(status_code=status.HTTP_412_PRECONDITION_FAILED, detail=str(exc)) from exc
+    except (PlanWriteConflictError, JsonPatchError) as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
 
+    response.headers["ETag"] = _etag(plan.version)
     return PlanRead.model_validate(plan)
 
 
@@ -3,15 +3,24 @@
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, require_roles
+from app.api.streaming import NDJSON_RESPONSES, ndjson_rows_response, wants_ndjson
 from app.db.session import get_db
 from app.models.user import User, UserRole
-from app.schemas.common import MessageResponse
-from app.schemas.qna import QuestionCreate, QuestionRead, ReplyCreate, ReplyRead
+from app.schemas.common import MessageResponse, Page, list_json, page_json
+from app.schemas.qna import (
+    QuestionCreate,
+    QuestionRead,
+    QuestionSort,
+    ReplyCreate,
+    ReplyRead,
+    TagCount,
+)
 from app.services.qna_service import QnAService
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 router = APIRouter(prefix="/qna", tags=["qna"])
 
@@ -33,17 +42,55 @@ async def create_question(
     return QuestionRead.model_validate(question)
 
 
-@router.get("/questions", response_model=list[QuestionRead])
+@router.get("/questions", response_model=Page[QuestionRead], responses=NDJSON_RESPONSES)
 async def list_questions(
+    request: Request,
     _: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
     search: str | None = Query(default=None),
     tag: str | None = Query(default=None),
-) -> list[QuestionRead]:
-    """List questions with optional search and tag filtering."""
+    unanswered: bool = Query(default=False),
+    sort: QuestionSort = Query(default="newest"),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None),
+) -> Response:
+    """List questions newest first (by creation or activity), or the most relevant matches for a search."""
+
+    service = QnAService(db)
+    if wants_ndjson(request):
+        questions = service.stream_questions(
+            search=search,
+            tag=tag,
+            unanswered=unanswered,
+            sort=sort,
+        )
+        return ndjson_rows_response(questions, QuestionRead)
+
+    try:
+        page = await service.list_questions(
+            search=search,
+            tag=tag,
+            unanswered=unanswered,
+            sort=sort,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
-    questions = await QnAService(db).list_questions(search=search, tag=tag)
-    return [QuestionRead.model_validate(question) for question in questions]
+    return Response(content=page_json(QuestionRead, page.items, page.next_cursor), media_type="application/json")
+
+
+@router.get("/tags", response_model=list[TagCount])
+async def list_tag_counts(
+    _: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+) -> Response:
+    """List the most used tags with their question counts."""
+
+    counts = await QnAService(db).tag_counts(limit)
+    return Response(content=list_json(TagCount, counts), media_type="application/json")
 
 
 @router.post(
@@ -72,21 +119,33 @@ async def reply_to_question(
     return ReplyRead.model_validate(reply)
 
 
-@router.get("/questions/{question_id}/replies", response_model=list[ReplyRead])
+@router.get("/questions/{question_id}/replies", response_model=Page[ReplyRead], responses=NDJSON_RESPONSES)
 async def list_replies(
     question_id: uuid.UUID,
+    request: Request,
     _: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> list[ReplyRead]:
-    """List replies for a question."""
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None),
+) -> Response:
+    """List replies for a question, oldest first, one cursor page at a time."""
 
     service = QnAService(db)
+    if wants_ndjson(request):
+        try:
+            replies = await service.stream_replies(question_id)
+        except LookupError as exc:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+        return ndjson_rows_response(replies, ReplyRead)
+
     try:
-        replies = await service.list_replies(question_id)
+        page = await service.list_replies(question_id, limit=limit, cursor=cursor)
     except LookupError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
-    return [ReplyRead.model_validate(reply) for reply in replies]
+    return Response(content=page_json(ReplyRead, page.items, page.next_cursor), media_type="application/json")
 
 
 @router.delete("/questions/{question_id}", response_model=MessageResponse)
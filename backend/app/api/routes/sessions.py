@@ -1,16 +1,21 @@
 """Session management endpoints."""
 
 import uuid
+from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, require_roles
+from app.api.streaming import NDJSON_RESPONSES, ndjson_rows_response, wants_ndjson
 from app.db.session import get_db
 from app.models.user import User, UserRole
+from app.schemas.common import Page, page_json
 from app.schemas.session import SessionCreate, SessionRead, SessionUpdate
 from app.services.session_service import SessionService
+from app.utils.ics import ICS_MEDIA_TYPE
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 router = APIRouter(prefix="/sessions", tags=["sessions"])
 
@@ -41,16 +46,98 @@ async def create_session(
     return SessionRead.model_validate(session)
 
 
-@router.get("", response_model=list[SessionRead])
+@router.get("", response_model=Page[SessionRead], responses=NDJSON_RESPONSES)
 async def list_sessions(
+    request: Request,
     _: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
     class_id: uuid.UUID | None = Query(default=None),
-) -> list[SessionRead]:
-    """List sessions with optional class filter."""
+    starts_from: datetime | None = Query(default=None, alias="from"),
+    starts_before: datetime | None = Query(default=None, alias="to"),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None),
+) -> Response:
+    """List sessions by start time, optionally by class and ``[from, to)`` start window."""
 
-    sessions = await SessionService(db).list_sessions(class_id=class_id)
-    return [SessionRead.model_validate(session) for session in sessions]
+    service = SessionService(db)
+    try:
+        if wants_ndjson(request):
+            sessions = service.stream_sessions(
+                class_id=class_id,
+                starts_from=starts_from,
+                starts_before=starts_before,
+            )
+            return ndjson_rows_response(sessions, SessionRead)
+
+        body = await service.list_sessions(
+            class_id=class_id,
+            starts_from=starts_from,
+            starts_before=starts_before,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    return Response(content=body, media_type="application/json")
+
+
+@router.get("/upcoming", response_model=Page[SessionRead])
+async def list_my_upcoming_sessions(
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    starts_before: datetime | None = Query(default=None, alias="to"),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None),
+) -> Response:
+    """List upcoming sessions across the current user's enrolled classes."""
+
+    try:
+        page = await SessionService(db).list_upcoming(
+            user_id=current_user.id,
+            starts_before=starts_before,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    return Response(content=page_json(SessionRead, page.items, page.next_cursor), media_type="application/json")
+
+
+@router.get(
+    "/calendar/me.ics",
+    response_class=Response,
+    responses={200: {"content": {ICS_MEDIA_TYPE: {}}}},
+)
+async def get_my_calendar(
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> Response:
+    """Return an ICS feed of sessions in the current user's enrolled classes."""
+
+    calendar = await SessionService(db).user_calendar(current_user.id)
+    return Response(content=calendar, media_type=ICS_MEDIA_TYPE)
+
+
+@router.get(
+    "/calendar/classes/{class_id}.ics",
+    response_class=Response,
+    responses={200: {"content": {ICS_MEDIA_TYPE: {}}}},
+)
+async def get_class_calendar(
+    class_id: uuid.UUID,
+    _: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> Response:
+    """Return an ICS feed of every session in one class."""
+
+    try:
+        calendar = await SessionService(db).class_calendar(class_id)
+    except LookupError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+
+    return Response(content=calendar, media_type=ICS_MEDIA_TYPE)
 
 
 @router.get("/{session_id}", response_model=SessionRead)
@@ -2,14 +2,17 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, require_roles
+from app.api.streaming import NDJSON_RESPONSES, ndjson_rows_response, wants_ndjson
 from app.db.session import get_db
 from app.models.user import User, UserRole
+from app.schemas.common import Page, page_json
 from app.schemas.user import UserRead
 from app.services.auth_service import AuthService
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -23,12 +26,22 @@ async def get_my_profile(
     return UserRead.model_validate(current_user)
 
 
-@router.get("", response_model=list[UserRead])
+@router.get("", response_model=Page[UserRead], responses=NDJSON_RESPONSES)
 async def list_users(
+    request: Request,
     _: Annotated[User, Depends(require_roles(UserRole.ADMIN))],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> list[UserRead]:
-    """List all users (admin only)."""
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None),
+) -> Response:
+    """List users, newest first, one cursor page at a time (admin only)."""
 
-    users = await AuthService(db).user_repo.list_users()
-    return [UserRead.model_validate(user) for user in users]
+    if wants_ndjson(request):
+        return ndjson_rows_response(AuthService(db).user_repo.stream_users(), UserRead)
+
+    try:
+        page = await AuthService(db).user_repo.list_users(limit=limit, cursor=cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    return Response(content=page_json(UserRead, page.items, page.next_cursor), media_type="application/json")
@@ -0,0 +1,94 @@
+"""Helpers for streaming API responses."""
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from app.core.events import Event, EventHub, Subscription
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+NDJSON_RESPONSES: dict[int | str, dict[str, Any]] = {
+    200: {"content": {NDJSON_MEDIA_TYPE: {}}},
+}
+SSE_MEDIA_TYPE = "text/event-stream"
+SSE_RESPONSES: dict[int | str, dict[str, Any]] = {
+    200: {"content": {SSE_MEDIA_TYPE: {}}},
+}
+SSE_RETRY_MILLISECONDS = 3000
+
+
+def wants_ndjson(request: Request) -> bool:
+    """Return whether the client opted into newline-delimited JSON via ``Accept``."""
+
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+async def _ndjson_lines(items: AsyncIterable[BaseModel]) -> AsyncIterator[bytes]:
+    async for item in items:
+        yield item.model_dump_json().encode("utf-8") + b"\n"
+
+
+async def _validated(rows: AsyncIterable[Any], schema: type[BaseModel]) -> AsyncIterator[BaseModel]:
+    async for row in rows:
+        yield schema.model_validate(row)
+
+
+def ndjson_response(items: AsyncIterable[BaseModel]) -> StreamingResponse:
+    """Stream models as newline-delimited JSON, one object per line."""
+
+    return StreamingResponse(_ndjson_lines(items), media_type=NDJSON_MEDIA_TYPE)
+
+
+def ndjson_rows_response(rows: AsyncIterable[Any], schema: type[BaseModel]) -> StreamingResponse:
+    """Serialize streamed rows with ``schema`` and write each one as it arrives."""
+
+    return ndjson_response(_validated(rows, schema))
+
+
+def _sse_frame(event: Event) -> bytes:
+    data = "".join(f"data: {line}\n" for line in event.data.splitlines())
+    return f"id: {event.id}\nevent: {event.name}\n{data}\n".encode()
+
+
+async def sse_frames(
+    hub: EventHub,
+    subscription: Subscription,
+    heartbeat_seconds: float,
+) -> AsyncIterator[bytes]:
+    """Yield replayed then live events as SSE frames, with comment heartbeats while idle.
+
+    The stream ends when the hub evicts the subscriber; the client reconnects
+    with ``Last-Event-ID`` and resumes from the hub history.
+    """
+
+    try:
+        yield f"retry: {SSE_RETRY_MILLISECONDS}\n\n".encode()
+        if subscription.reset:
+            yield b"event: reset\ndata: {}\n\n"
+        for event in subscription.backlog:
+            yield _sse_frame(event)
+        while True:
+            try:
+                item = await asyncio.wait_for(subscription.queue.get(), heartbeat_seconds)
+            except TimeoutError:
+                yield b": keepalive\n\n"
+                continue
+            if item is None:
+                return
+            yield _sse_frame(item)
+    finally:
+        hub.unsubscribe(subscription)
+
+
+def sse_response(hub: EventHub, subscription: Subscription, heartbeat_seconds: float) -> StreamingResponse:
+    """Stream a hub subscription as ``text/event-stream``."""
+
+    return StreamingResponse(
+        sse_frames(hub, subscription, heartbeat_seconds),
+        media_type=SSE_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,257 @@
+"""In-process caches with tag-based invalidation."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+from sqlalchemy import Row
+
+from app.core.config import get_settings
+
+V = TypeVar("V")
+
+# Tag for cached first pages of the class list, the only pages a new class changes.
+CLASS_LIST_HEAD_TAG = "classes:head"
+# Tag for cached session lists that span every class.
+SESSION_LIST_TAG = "sessions"
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry(Generic[V]):
+    value: V
+    tags: frozenset[str]
+    expires_at: float | None
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """Point-in-time counters of one cache."""
+
+    entries: int
+    max_entries: int
+    ttl_seconds: float | None
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+
+    @property
+    def hit_rate(self) -> float | None:
+        """Share of lookups served from the cache, or ``None`` before the first lookup."""
+
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+
+class TaggedCache(Generic[V]):
+    """Bounded LRU cache whose entries are dropped by the tags they depend on.
+
+    Each entry records the tags (for example ``"class:<id>"``) describing the
+    rows it was rendered from; ``invalidate`` evicts every entry carrying any
+    of the given tags and leaves unrelated entries warm. With ``ttl_seconds``
+    entries also expire, bounding staleness from writes that bypass the
+    service layer.
+
+    When an invalidation bus attaches a ``publisher``, every ``invalidate``
+    is also sent to peer processes, which apply it with
+    ``apply_invalidation``.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry[V]] = OrderedDict()
+        self._keys_by_tag: dict[str, set[str]] = {}
+        self._epoch = 0
+        self._reset_counters()
+        self.publisher: Callable[[tuple[str, ...]], None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> V | None:
+        """Return a live cached value and mark it as recently used."""
+
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at is not None and entry.expires_at <= self._clock():
+            self._discard(key)
+            self._expirations += 1
+            entry = None
+        if entry is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return entry.value
+
+    def set(self, key: str, value: V, tags: Iterable[str]) -> None:
+        """Store a value under ``key``, evicting the least recently used entry when full."""
+
+        self._discard(key)
+        expires_at = self._clock() + self.ttl_seconds if self.ttl_seconds is not None else None
+        entry = _Entry(value=value, tags=frozenset(tags), expires_at=expires_at)
+        self._entries[key] = entry
+        for tag in entry.tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._discard(next(iter(self._entries)))
+            self._evictions += 1
+
+    def stats(self) -> CacheStats:
+        """Return entry count and hit, miss, eviction and expiration counters."""
+
+        return CacheStats(
+            entries=len(self._entries),
+            max_entries=self.max_entries,
+            ttl_seconds=self.ttl_seconds,
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            expirations=self._expirations,
+        )
+
+    async def get_or_render(
+        self,
+        key: str,
+        render: Callable[[], Awaitable[tuple[V, Iterable[str]]]],
+    ) -> V:
+        """Return the cached value or render, store and return a fresh one.
+
+        ``render`` returns the value with its tags. A value is not stored when
+        an invalidation ran while it was rendering, since it may predate it.
+        """
+
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        epoch = self._epoch
+        value, tags = await render()
+        if epoch == self._epoch:
+            self.set(key, value, tags)
+        return value
+
+    def invalidate(self, *tags: str) -> None:
+        """Evict every entry that depends on any of ``tags``, here and in peer processes."""
+
+        self.apply_invalidation(tags)
+        if self.publisher is not None:
+            self.publisher(tags)
+
+    def apply_invalidation(self, tags: tuple[str, ...]) -> None:
+        """Evict entries for ``tags`` in this process only."""
+
+        self._epoch += 1
+        for tag in tags:
+            for key in self._keys_by_tag.pop(tag, set()):
+                self._discard(key)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+
+        self._epoch += 1
+        self._entries.clear()
+        self._keys_by_tag.clear()
+        self._reset_counters()
+
+    def _reset_counters(self) -> None:
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry.tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+
+class SnapshotCache(TaggedCache[Row[Any]]):
+    """Process-local second-level cache of immutable row snapshots by primary key.
+
+    Snapshots are read-only ``Row`` tuples. Repositories drop them on every
+    write, here and in peer processes; loads racing an invalidation are not
+    stored (see ``get_or_render``). ``max_entries=0`` disables the cache and
+    every lookup goes to the database.
+    """
+
+    async def get_or_load(
+        self,
+        key: str,
+        load: Callable[[], Awaitable[Row[Any] | None]],
+        tags_for: Callable[[Row[Any]], Iterable[str]] = lambda row: (),
+    ) -> Row[Any] | None:
+        """Return the snapshot under ``key``, loading and storing it on a miss.
+
+        ``tags_for`` names extra tags of a loaded row, such as its parent, so
+        writes elsewhere can drop it. Missing rows are not cached, so a row
+        created later is found at once.
+        """
+
+        if self.max_entries <= 0:
+            return await load()
+
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        epoch = self._epoch
+        row = await load()
+        if row is not None and epoch == self._epoch:
+            self.set(key, row, [key, *tags_for(row)])
+        return row
+
+    def invalidate_row(self, key: str) -> None:
+        """Drop the snapshot under ``key`` after a write to its row."""
+
+        self.invalidate(key)
+
+
+def class_tag(class_id: object) -> str:
+    """Tag for cached data derived from one class and its sessions."""
+
+    return f"class:{class_id}"
+
+
+def user_tag(user_id: object) -> str:
+    """Tag for cached data derived from one user's enrollments."""
+
+    return f"user:{user_id}"
+
+
+def plan_tag(plan_id: object) -> str:
+    """Tag for cached renderings of one quarterly plan."""
+
+    return f"plan:{plan_id}"
+
+
+settings = get_settings()
+
+calendar_cache: TaggedCache[str] = TaggedCache(max_entries=1024)
+plan_export_cache: TaggedCache[str] = TaggedCache(max_entries=4096)
+catalog_cache: TaggedCache[bytes] = TaggedCache(
+    max_entries=settings.catalog_cache_max_entries,
+    ttl_seconds=settings.catalog_cache_ttl_seconds,
+)
+snapshot_cache = SnapshotCache(max_entries=settings.snapshot_cache_max_entries)
+
+caches: dict[str, TaggedCache[Any]] = {
+    "calendar": calendar_cache,
+    "plan_export": plan_export_cache,
+    "catalog": catalog_cache,
+    "snapshots": snapshot_cache,
+}
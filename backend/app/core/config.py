@@ -1,6 +1,7 @@
 """Application configuration loaded from environment variables."""
 
 from functools import lru_cache
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -30,6 +31,9 @@ class Settings(BaseSettings):
         default="sqlite+aiosqlite:///./community.db",
         alias="DATABASE_URL",
     )
+    db_pool_size: int = Field(default=5, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=10, alias="DB_MAX_OVERFLOW")
+    db_warmup_connections: int = Field(default=2, alias="DB_WARMUP_CONNECTIONS")
 
     cors_origins_raw: str = Field(
         default="http://localhost:3000,http://localhost:5173,http://localhost:8000",
@@ -38,6 +42,23 @@ class Settings(BaseSettings):
 
     rate_limit_per_minute: int = Field(default=100, alias="RATE_LIMIT_PER_MINUTE")
 
+    catalog_cache_max_entries: int = Field(default=512, alias="CATALOG_CACHE_MAX_ENTRIES")
+    catalog_cache_ttl_seconds: float = Field(default=60.0, alias="CATALOG_CACHE_TTL_SECONDS")
+    snapshot_cache_max_entries: int = Field(default=4096, alias="SNAPSHOT_CACHE_MAX_ENTRIES")
+
+    invalidation_bus: Literal["memory", "unix", "postgres"] = Field(
+        default="memory",
+        alias="INVALIDATION_BUS",
+    )
+    invalidation_socket_dir: str = Field(
+        default="/tmp/community-learning-invalidation",
+        alias="INVALIDATION_SOCKET_DIR",
+    )
+
+    sse_queue_size: int = Field(default=256, alias="SSE_QUEUE_SIZE")
+    sse_history_size: int = Field(default=1024, alias="SSE_HISTORY_SIZE")
+    sse_heartbeat_seconds: float = Field(default=15.0, alias="SSE_HEARTBEAT_SECONDS")
+
     model_config = SettingsConfigDict(env_file=".env", extra="ignore", case_sensitive=False)
 
     @property
@@ -0,0 +1,151 @@
+"""In-process publish/subscribe hub behind the Server-Sent Events endpoint."""
+
+import asyncio
+import uuid
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from app.core.config import get_settings
+
+ANNOUNCEMENTS_TOPIC = "announcements"
+
+
+def question_topic(question_id: object) -> str:
+    """Topic carrying new replies on one question thread."""
+
+    return f"question:{question_id}"
+
+
+@dataclass(frozen=True, slots=True)
+class Event:
+    """One published event; ``id`` is unique within this process's stream."""
+
+    id: str
+    sequence: int
+    topic: str
+    name: str
+    data: str
+
+
+@dataclass(eq=False, slots=True)
+class Subscription:
+    """A client's topic filter, the events it missed and its bounded live queue.
+
+    ``reset`` is set when the requested ``Last-Event-ID`` is no longer in the
+    history buffer (or came from another process lifetime), so the client
+    has to reload through the REST endpoints instead of resuming.
+    """
+
+    topics: frozenset[str]
+    queue: asyncio.Queue[Event | None]
+    backlog: list[Event] = field(default_factory=list)
+    reset: bool = False
+    evicted: bool = False
+
+
+class EventHub:
+    """Fan events out to subscribers with per-client buffers and resumable history.
+
+    Subscribers are indexed by topic so publishing touches only interested
+    clients. Each subscriber gets a bounded queue; one that falls
+    ``queue_size`` events behind is evicted rather than buffered without
+    limit, and can reconnect with ``Last-Event-ID`` to replay what it missed
+    from the last ``history_size`` events.
+    """
+
+    def __init__(self, queue_size: int = 256, history_size: int = 1024) -> None:
+        self.queue_size = queue_size
+        self._history: deque[Event] = deque(maxlen=history_size)
+        self._subscribers: dict[str, set[Subscription]] = {}
+        self._stream = uuid.uuid4().hex[:12]
+        self._sequence = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of connected subscribers."""
+
+        return len({subscription for group in self._subscribers.values() for subscription in group})
+
+    def publish(self, topic: str, name: str, data: str) -> Event:
+        """Record an event and queue it for every subscriber of ``topic``."""
+
+        self._sequence += 1
+        event = Event(
+            id=f"{self._stream}-{self._sequence}",
+            sequence=self._sequence,
+            topic=topic,
+            name=name,
+            data=data,
+        )
+        self._history.append(event)
+        for subscription in list(self._subscribers.get(topic, ())):
+            try:
+                subscription.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                self._evict(subscription)
+        return event
+
+    def subscribe(self, topics: Iterable[str], last_event_id: str | None = None) -> Subscription:
+        """Register a subscriber, replaying buffered events after ``last_event_id``."""
+
+        subscription = Subscription(
+            topics=frozenset(topics),
+            queue=asyncio.Queue(maxsize=self.queue_size),
+        )
+        if last_event_id:
+            after = self._resume_point(last_event_id)
+            if after is None:
+                subscription.reset = True
+            else:
+                subscription.backlog = [
+                    event
+                    for event in self._history
+                    if event.sequence > after and event.topic in subscription.topics
+                ]
+        for topic in subscription.topics:
+            self._subscribers.setdefault(topic, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Stop delivering events to ``subscription``."""
+
+        for topic in subscription.topics:
+            group = self._subscribers.get(topic)
+            if group is not None:
+                group.discard(subscription)
+                if not group:
+                    del self._subscribers[topic]
+
+    def clear(self) -> None:
+        """Drop every subscriber and the event history."""
+
+        self._subscribers.clear()
+        self._history.clear()
+
+    def _resume_point(self, last_event_id: str) -> int | None:
+        """Return the sequence to replay after, or ``None`` when it cannot be resumed."""
+
+        stream, _, sequence = last_event_id.rpartition("-")
+        if stream != self._stream or not (sequence.isascii() and sequence.isdigit()):
+            return None
+        after = int(sequence)
+        if after > self._sequence:
+            return None
+        oldest = self._history[0].sequence if self._history else self._sequence + 1
+        if after < oldest - 1:
+            return None
+        return after
+
+    def _evict(self, subscription: Subscription) -> None:
+        """Disconnect a slow consumer: drop its backlog and wake it with the end marker."""
+
+        self.unsubscribe(subscription)
+        subscription.evicted = True
+        while not subscription.queue.empty():
+            subscription.queue.get_nowait()
+        subscription.queue.put_nowait(None)
+
+
+settings = get_settings()
+event_hub = EventHub(queue_size=settings.sse_queue_size, history_size=settings.sse_history_size)
@@ -0,0 +1,312 @@
+"""Cross-process cache invalidation bus.
+
+Every process-local cache in ``app.core.cache`` invalidates itself and then
+hands the same tags to the bus, which delivers them to peer processes. Peers
+apply them locally without re-publishing. Three transports exist:
+
+* ``memory``: buses attached to one in-process network; the default for a
+  single worker and for tests.
+* ``unix``: datagram Unix sockets in a shared directory, for several workers
+  on one host (including SQLite deployments).
+* ``postgres``: ``LISTEN``/``NOTIFY`` on a dedicated connection, for workers
+  spread over several hosts.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import socket
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from app.core.cache import TaggedCache
+from app.core.config import Settings
+
+logger = logging.getLogger(__name__)
+
+# Keeps every message well below the 8000-byte NOTIFY payload limit.
+MAX_TAGS_PER_MESSAGE = 50
+RECONNECT_DELAY_SECONDS = 1.0
+RESYNC_DELAY_SECONDS = 0.2
+
+
+class InvalidationBus(ABC):
+    """Base bus: serializes local invalidations for peers and applies theirs.
+
+    Subclasses implement ``_send`` (must not block) and, when they need
+    I/O, ``start``/``stop``. Messages carry the sender's ``origin`` so a
+    process ignores its own echoes; a message with ``clear`` set tells the
+    receiver to drop every cache because it missed invalidations.
+    """
+
+    def __init__(self) -> None:
+        self.origin = uuid.uuid4().hex
+        self._caches: dict[str, TaggedCache[Any]] = {}
+
+    async def start(self, caches: Mapping[str, TaggedCache[Any]]) -> None:
+        """Attach to ``caches`` so their invalidations are published."""
+
+        self._caches = dict(caches)
+        for name, cache in self._caches.items():
+            cache.publisher = partial(self.publish, name)
+
+    async def stop(self) -> None:
+        """Detach from the caches."""
+
+        for cache in self._caches.values():
+            cache.publisher = None
+        self._caches = {}
+
+    def publish(self, cache: str, tags: tuple[str, ...]) -> None:
+        """Send an invalidation of ``tags`` in ``cache`` to every peer."""
+
+        for start in range(0, len(tags), MAX_TAGS_PER_MESSAGE):
+            message = {
+                "origin": self.origin,
+                "cache": cache,
+                "tags": tags[start : start + MAX_TAGS_PER_MESSAGE],
+            }
+            self._send(json.dumps(message, separators=(",", ":")))
+
+    def receive(self, payload: str | bytes) -> None:
+        """Apply a peer's invalidation to the local cache it names."""
+
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            logger.warning("Ignoring malformed cache invalidation payload")
+            return
+        if message.get("origin") == self.origin:
+            return
+        if message.get("clear"):
+            self.clear_caches()
+            return
+        cache = self._caches.get(message.get("cache", ""))
+        if cache is None:
+            return
+        cache.apply_invalidation(tuple(message.get("tags", ())))
+
+    def clear_caches(self) -> None:
+        """Drop every attached cache, used when messages may have been missed."""
+
+        for cache in self._caches.values():
+            cache.clear()
+
+    @abstractmethod
+    def _send(self, payload: str) -> None:
+        """Hand ``payload`` to every peer without blocking."""
+
+
+class InMemoryNetwork:
+    """A set of in-memory buses that deliver to each other synchronously."""
+
+    def __init__(self) -> None:
+        self.buses: list[InMemoryBus] = []
+
+
+class InMemoryBus(InvalidationBus):
+    """Bus for one process; buses sharing a network simulate separate workers in tests."""
+
+    def __init__(self, network: InMemoryNetwork | None = None) -> None:
+        super().__init__()
+        self.network = network or InMemoryNetwork()
+
+    async def start(self, caches: Mapping[str, TaggedCache[Any]]) -> None:
+        await super().start(caches)
+        self.network.buses.append(self)
+
+    async def stop(self) -> None:
+        if self in self.network.buses:
+            self.network.buses.remove(self)
+        await super().stop()
+
+    def _send(self, payload: str) -> None:
+        for bus in list(self.network.buses):
+            if bus is not self:
+                bus.receive(payload)
+
+
+class UnixSocketBus(InvalidationBus):
+    """Single-host bus: each process binds a datagram socket in a shared directory.
+
+    Publishing sends one datagram to every other socket in the directory;
+    sockets left behind by dead processes are removed when a send is refused.
+    A peer whose receive queue is full has missed an invalidation, so it is
+    skipped until a ``clear`` message gets through, retried every
+    ``RESYNC_DELAY_SECONDS``.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        super().__init__()
+        self.directory = Path(directory)
+        self.path = self.directory / f"{self.origin}.sock"
+        self._socket: socket.socket | None = None
+        self._lagging: set[str] = set()
+        self._resync: asyncio.TimerHandle | None = None
+
+    async def start(self, caches: Mapping[str, TaggedCache[Any]]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.setblocking(False)
+        sock.bind(str(self.path))
+        self._socket = sock
+        self._loop = asyncio.get_running_loop()
+        self._loop.add_reader(sock.fileno(), self._readable)
+        await super().start(caches)
+
+    async def stop(self) -> None:
+        await super().stop()
+        if self._resync is not None:
+            self._resync.cancel()
+            self._resync = None
+        self._lagging.clear()
+        if self._socket is not None:
+            self._loop.remove_reader(self._socket.fileno())
+            self._socket.close()
+            self._socket = None
+        with contextlib.suppress(FileNotFoundError):
+            self.path.unlink()
+
+    def _readable(self) -> None:
+        assert self._socket is not None
+        while True:
+            try:
+                payload = self._socket.recv(65536)
+            except (BlockingIOError, InterruptedError):
+                return
+            self.receive(payload)
+
+    def _send(self, payload: str) -> None:
+        if self._socket is None:
+            return
+        data = payload.encode()
+        with os.scandir(self.directory) as entries:
+            peers = [entry.path for entry in entries if entry.name.endswith(".sock") and entry.path != str(self.path)]
+        for peer in peers:
+            if peer not in self._lagging and not self._deliver(peer, data):
+                logger.warning("Cache invalidation dropped: peer %s is not reading; it will be told to clear", peer)
+                self._lagging.add(peer)
+        self._schedule_resync()
+
+    def _deliver(self, peer: str, data: bytes) -> bool:
+        """Send one datagram; return ``False`` only when the peer's queue is full."""
+
+        assert self._socket is not None
+        try:
+            self._socket.sendto(data, peer)
+        except (ConnectionRefusedError, FileNotFoundError):
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(peer)
+        except BlockingIOError:
+            return False
+        return True
+
+    def _schedule_resync(self) -> None:
+        if self._lagging and self._resync is None:
+            self._resync = self._loop.call_later(RESYNC_DELAY_SECONDS, self._send_clear)
+
+    def _send_clear(self) -> None:
+        """Tell lagging peers to drop their caches, retrying those still full."""
+
+        self._resync = None
+        if self._socket is None:
+            return
+        data = json.dumps({"origin": self.origin, "clear": True}, separators=(",", ":")).encode()
+        self._lagging = {peer for peer in self._lagging if not self._deliver(peer, data)}
+        self._schedule_resync()
+
+
+class PostgresBus(InvalidationBus):
+    """Multi-host bus over PostgreSQL ``LISTEN``/``NOTIFY`` on one dedicated connection.
+
+    Notifications are sent from a background task on the listening
+    connection. Every time it starts listening, including the first, the bus
+    clears every attached cache, since invalidations sent before were missed.
+    """
+
+    def __init__(self, dsn: str, channel: str = "cache_invalidation") -> None:
+        super().__init__()
+        self.dsn = dsn
+        self.channel = channel
+        self._outbox: asyncio.Queue[str] = asyncio.Queue()
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self, caches: Mapping[str, TaggedCache[Any]]) -> None:
+        await super().start(caches)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        await super().stop()
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def _send(self, payload: str) -> None:
+        self._outbox.put_nowait(payload)
+
+    def _notification(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        self.receive(payload)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                connection = await asyncpg.connect(self.dsn)
+            except (OSError, asyncpg.PostgresError) as exc:
+                logger.warning("Cache invalidation bus cannot connect: %s", exc)
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+                continue
+
+            lost = asyncio.Event()
+            connection.add_termination_listener(lambda _: lost.set())
+            try:
+                await connection.add_listener(self.channel, self._notification)
+                self.clear_caches()
+                await self._forward(connection, lost)
+            except (OSError, asyncpg.PostgresError, asyncpg.InterfaceError) as exc:
+                logger.warning("Cache invalidation bus connection lost: %s", exc)
+            finally:
+                if not connection.is_closed():
+                    await connection.close()
+            await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+
+    async def _forward(self, connection: asyncpg.Connection, lost: asyncio.Event) -> None:
+        """Send queued payloads with ``pg_notify`` until the connection is lost."""
+
+        lost_wait = asyncio.create_task(lost.wait())
+        try:
+            while not lost.is_set():
+                next_payload = asyncio.create_task(self._outbox.get())
+                done, _ = await asyncio.wait({next_payload, lost_wait}, return_when=asyncio.FIRST_COMPLETED)
+                if next_payload not in done:
+                    next_payload.cancel()
+                    return
+                payload = next_payload.result()
+                try:
+                    await connection.execute("SELECT pg_notify($1, $2)", self.channel, payload)
+                except BaseException:
+                    self._outbox.put_nowait(payload)
+                    raise
+        finally:
+            lost_wait.cancel()
+
+
+def create_invalidation_bus(settings: Settings) -> InvalidationBus:
+    """Build the bus selected by ``INVALIDATION_BUS``."""
+
+    if settings.invalidation_bus == "unix":
+        return UnixSocketBus(settings.invalidation_socket_dir)
+    if settings.invalidation_bus == "postgres":
+        url = make_url(settings.database_url).set(drivername="postgresql")
+        return PostgresBus(url.render_as_string(hide_password=False))
+    return InMemoryBus()
@@ -5,11 +5,11 @@ project can run in constrained environments without optional crypto packages.
 """
 
 import base64
-from datetime import datetime, timedelta, timezone
 import hashlib
 import hmac
 import json
 import secrets
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from app.core.config import get_settings
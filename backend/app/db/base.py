@@ -5,6 +5,8 @@ from datetime import datetime
 from sqlalchemy import DateTime, MetaData, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
+from app.utils.time import utc_now
+
 NAMING_CONVENTION = {
     "ix": "ix_%(column_0_label)s",
     "uq": "uq_%(table_name)s_%(column_0_name)s",
@@ -23,8 +25,11 @@ class Base(DeclarativeBase):
 class TimestampMixin:
     """Reusable timestamp columns for audit-friendly models."""
 
+    # Python-side default keeps microsecond precision on every backend, which
+    # keyset pagination on (created_at, id) relies on to order ties stably.
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        default=utc_now,
         server_default=func.now(),
         nullable=False,
     )
@@ -0,0 +1,22 @@
+"""Dialect-specific SQL constructs shared by repositories."""
+
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+_UPSERT_INSERTS: dict[str, Callable[..., Any]] = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def upsert_insert(session: AsyncSession) -> Callable[..., Any]:
+    """Return the ``insert`` construct supporting ``ON CONFLICT`` for the session's dialect."""
+
+    dialect_name = session.get_bind().dialect.name
+    try:
+        return _UPSERT_INSERTS[dialect_name]
+    except KeyError as exc:
+        raise NotImplementedError(f"ON CONFLICT upserts are not supported on {dialect_name}") from exc
@@ -0,0 +1,41 @@
+"""Column projection helpers for read-only list queries."""
+
+from collections.abc import AsyncIterator
+from functools import cache
+from typing import Any
+
+from pydantic import BaseModel
+from sqlalchemy import Row, Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import KeyedColumnElement
+
+from app.db.base import Base
+
+STREAM_BATCH_SIZE = 500
+
+
+@cache
+def _projected_columns(model: type[Base], schema: type[BaseModel]) -> tuple[KeyedColumnElement[Any], ...]:
+    table = model.__table__
+    return tuple(table.c[name] for name in schema.model_fields)
+
+
+def project(model: type[Base], schema: type[BaseModel]) -> Select[Any]:
+    """Select only the table columns a response schema needs.
+
+    The statement yields plain ``Row`` tuples instead of ORM entities, so list
+    endpoints skip identity-map bookkeeping and attribute instrumentation.
+    Rows expose columns as attributes, which keeps them compatible with
+    ``from_attributes`` schemas.
+    """
+
+    return select(*_projected_columns(model, schema))
+
+
+async def stream_rows(session: AsyncSession, statement: Select[Any]) -> AsyncIterator[Row[Any]]:
+    """Stream rows through a server-side cursor, fetching ``STREAM_BATCH_SIZE`` at a time."""
+
+    result = await session.stream(statement.execution_options(yield_per=STREAM_BATCH_SIZE))
+    async for partition in result.partitions():
+        for row in partition:
+            yield row
@@ -0,0 +1,107 @@
+"""Dialect-specific full-text search over Q&A questions.
+
+PostgreSQL keeps a generated, weighted ``tsvector`` column behind a GIN index.
+SQLite keeps an FTS5 table holding its own copy of each question's title and
+body, keyed by an unindexed ``question_id`` that searches join on; triggers
+keep it in step with ``qna_questions``. Implicit rowids of ``qna_questions``
+are not used, since ``VACUUM`` may renumber them. Both rank title matches
+above body matches. Other dialects fall back to an unindexed ``ILIKE`` scan.
+"""
+
+from typing import Any
+
+from sqlalchemy import (
+    DDL,
+    ColumnClause,
+    Select,
+    Table,
+    column,
+    event,
+    func,
+    literal_column,
+    table,
+)
+
+SEARCH_CONFIG = "english"
+SEARCH_VECTOR_COLUMN = "search_vector"
+SEARCH_VECTOR_INDEX = "ix_qna_questions_search_vector"
+FTS_TABLE = "qna_questions_fts"
+
+SEARCH_VECTOR_EXPRESSION = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(body, '')), 'B')"
+)
+
+_POSTGRESQL_DDL = (
+    f"ALTER TABLE qna_questions ADD COLUMN {SEARCH_VECTOR_COLUMN} tsvector "
+    f"GENERATED ALWAYS AS ({SEARCH_VECTOR_EXPRESSION}) STORED",
+    f"CREATE INDEX {SEARCH_VECTOR_INDEX} ON qna_questions USING gin ({SEARCH_VECTOR_COLUMN})",
+)
+
+# Questions are only ever inserted and soft-deleted by the application. The
+# update and delete triggers, which find the FTS row by its unindexed
+# ``question_id``, scan the FTS table and only serve manual maintenance.
+_SQLITE_DDL = (
+    f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+    "question_id UNINDEXED, title, body, tokenize='porter unicode61')",
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rank) VALUES ('rank', 'bm25(0.0, 10.0, 1.0)')",
+    f"CREATE TRIGGER {FTS_TABLE}_ai AFTER INSERT ON qna_questions BEGIN "
+    f"INSERT INTO {FTS_TABLE}(question_id, title, body) VALUES (new.id, new.title, new.body); END",
+    f"CREATE TRIGGER {FTS_TABLE}_ad AFTER DELETE ON qna_questions BEGIN "
+    f"DELETE FROM {FTS_TABLE} WHERE question_id = old.id; END",
+    f"CREATE TRIGGER {FTS_TABLE}_au AFTER UPDATE OF id, title, body ON qna_questions BEGIN "
+    f"UPDATE {FTS_TABLE} SET question_id = new.id, title = new.title, body = new.body "
+    "WHERE question_id = old.id; END",
+)
+
+_fts = table(FTS_TABLE, column("question_id"), column("rank"))
+
+
+def install_question_search(questions: Table) -> None:
+    """Attach the search index DDL to ``create_all``/``drop_all`` of the questions table."""
+
+    for statement in _POSTGRESQL_DDL:
+        event.listen(questions, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+    for statement in _SQLITE_DDL:
+        event.listen(questions, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    event.listen(
+        questions,
+        "after_drop",
+        DDL(f"DROP TABLE IF EXISTS {FTS_TABLE}").execute_if(dialect="sqlite"),
+    )
+
+
+def fts5_query(search: str) -> str:
+    """Quote every term so user input is matched literally, with implicit AND between terms."""
+
+    return " ".join('"' + term.replace('"', '""') + '"' for term in search.split())
+
+
+def search_questions(
+    statement: Select[Any],
+    questions: Table,
+    search: str,
+    dialect_name: str,
+) -> Select[Any]:
+    """Filter a questions statement to ``search`` matches, most relevant first."""
+
+    if dialect_name == "postgresql":
+        vector: ColumnClause[Any] = literal_column(f"{questions.name}.{SEARCH_VECTOR_COLUMN}")
+        query = func.websearch_to_tsquery(literal_column(f"'{SEARCH_CONFIG}'::regconfig"), search)
+        return statement.where(vector.op("@@")(query)).order_by(
+            func.ts_rank_cd(vector, query).desc(),
+            questions.c.created_at.desc(),
+            questions.c.id.desc(),
+        )
+
+    if dialect_name == "sqlite":
+        return (
+            statement.join(_fts, _fts.c.question_id == questions.c.id)
+            .where(literal_column(FTS_TABLE).op("MATCH")(fts5_query(search)))
+            .order_by(_fts.c.rank, questions.c.created_at.desc(), questions.c.id.desc())
+        )
+
+    like_value = f"%{search}%"
+    return statement.where(
+        questions.c.title.ilike(like_value) | questions.c.body.ilike(like_value)
+    ).order_by(questions.c.created_at.desc(), questions.c.id.desc())
@@ -1,7 +1,9 @@
 """Database session and engine configuration."""
 
 from collections.abc import AsyncIterator
+from typing import Any
 
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -17,12 +19,22 @@ _engine: AsyncEngine | None = None
 _session_maker: async_sessionmaker[AsyncSession] | None = None
 
 
+def _engine_options(database_url: str) -> dict[str, Any]:
+    """Return pool options supported by the configured database backend."""
+
+    options: dict[str, Any] = {"pool_pre_ping": True}
+    if make_url(database_url).get_backend_name() != "sqlite":
+        options["pool_size"] = settings.db_pool_size
+        options["max_overflow"] = settings.db_max_overflow
+    return options
+
+
 def get_engine() -> AsyncEngine:
     """Return lazily initialized async database engine."""
 
     global _engine
     if _engine is None:
-        _engine = create_async_engine(settings.database_url, pool_pre_ping=True)
+        _engine = create_async_engine(settings.database_url, **_engine_options(settings.database_url))
     return _engine
 
 
@@ -39,6 +51,16 @@ def get_session_maker() -> async_sessionmaker[AsyncSession]:
     return _session_maker
 
 
+async def dispose_engine() -> None:
+    """Close pooled connections and reset the lazily created engine."""
+
+    global _engine, _session_maker
+    if _engine is not None:
+        await _engine.dispose()
+    _engine = None
+    _session_maker = None
+
+
 async def get_db() -> AsyncIterator[AsyncSession]:
     """Yield an async database session per request."""
 
@@ -0,0 +1,61 @@
+"""Start-up warm-up helpers for the database layer."""
+
+import asyncio
+import logging
+import uuid
+from contextlib import AsyncExitStack
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+from sqlalchemy.orm import configure_mappers
+
+from app.db.base import Base
+
+logger = logging.getLogger(__name__)
+
+_PROBE_ID = uuid.UUID(int=0)
+
+
+def configure_orm() -> None:
+    """Import every model and resolve mapper relationships eagerly."""
+
+    import app.models  # noqa: F401
+
+    configure_mappers()
+
+
+async def _prime_connection(connection: AsyncConnection) -> None:
+    """Run a handshake query and primary-key probes for every id-keyed model.
+
+    The probes populate the engine's compiled statement cache (and the
+    driver-level prepared statement cache on PostgreSQL) with the lookups
+    executed by nearly every request, such as ``get_current_user``. Models
+    with composite keys are association rows that are never fetched by key.
+    """
+
+    await connection.execute(text("SELECT 1"))
+    async with AsyncSession(bind=connection) as session:
+        for mapper in Base.registry.mappers:
+            if len(mapper.primary_key) == 1:
+                await session.get(mapper.class_, _PROBE_ID)
+
+
+async def warm_up_engine(engine: AsyncEngine, connections: int) -> None:
+    """Pre-open pooled connections and warm statement caches on each of them."""
+
+    if connections <= 0:
+        return
+
+    try:
+        async with AsyncExitStack() as stack:
+            opened = await asyncio.gather(
+                *(stack.enter_async_context(engine.connect()) for _ in range(connections))
+            )
+            for connection in opened:
+                await _prime_connection(connection)
+    except (SQLAlchemyError, OSError):
+        logger.warning("Database warm-up failed; continuing with a cold pool", exc_info=True)
+        return
+
+    logger.info("Database pool warmed with %d connection(s)", connections)
@@ -1,21 +1,49 @@
 """FastAPI application entrypoint."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.router import api_router
+from app.core.cache import caches
 from app.core.config import get_settings
+from app.core.invalidation import create_invalidation_bus
 from app.core.logging import configure_logging
 from app.core.middleware import RequestContextMiddleware
+from app.db.session import dispose_engine, get_engine
+from app.db.warmup import configure_orm, warm_up_engine
 
 settings = get_settings()
 configure_logging(level="DEBUG" if settings.debug else "INFO")
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Warm up ORM, pool and OpenAPI schema and join the cache invalidation bus.
+
+    On shutdown, leave the bus and dispose the pool.
+    """
+
+    configure_orm()
+    if settings.db_warmup_connections > 0:
+        await warm_up_engine(get_engine(), settings.db_warmup_connections)
+    app.openapi()
+    invalidation_bus = create_invalidation_bus(settings)
+    await invalidation_bus.start(caches)
+    app.state.invalidation_bus = invalidation_bus
+    yield
+    await invalidation_bus.stop()
+    await dispose_engine()
+
+
 app = FastAPI(
     title=settings.app_name,
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
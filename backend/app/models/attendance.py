@@ -3,7 +3,7 @@
 import enum
 import uuid
 
-from sqlalchemy import Enum, ForeignKey, UniqueConstraint
+from sqlalchemy import Enum, ForeignKey, Integer, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base, TimestampMixin
@@ -23,6 +23,9 @@ class AttendanceStatus(str, enum.Enum):
     EXCUSED = "excused"
 
 
+attendance_status_enum = Enum(AttendanceStatus, name="attendance_status", values_callable=enum_values)
+
+
 class Attendance(Base, TimestampMixin):
     """Attendance state for one user in one class session."""
 
@@ -33,10 +36,39 @@ class Attendance(Base, TimestampMixin):
     session_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("sessions.id"), nullable=False, index=True)
     user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
     marked_by_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), nullable=False)
-    status: Mapped[AttendanceStatus] = mapped_column(
-        Enum(AttendanceStatus, name="attendance_status", values_callable=enum_values),
-        nullable=False,
+    status: Mapped[AttendanceStatus] = mapped_column(attendance_status_enum, nullable=False)
+    # Status before the latest upsert, written by its ON CONFLICT clause so the
+    # rollup delta is known without a separate read.
+    previous_status: Mapped[AttendanceStatus | None] = mapped_column(
+        attendance_status_enum,
+        nullable=True,
     )
 
     session = relationship("ClassSession", back_populates="attendance_records")
     user = relationship("User", back_populates="attendance_records", foreign_keys=[user_id])
+
+
+class AttendanceCountsMixin:
+    """Per-status attendance counters shared by rollup tables."""
+
+    present_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    absent_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    excused_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+
+
+class AttendanceSessionSummary(Base, AttendanceCountsMixin):
+    """Attendance counts for one session, maintained on every attendance upsert."""
+
+    __tablename__ = "attendance_session_summaries"
+
+    session_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("sessions.id"), primary_key=True)
+    class_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("classes.id"), nullable=False, index=True)
+
+
+class AttendanceMemberSummary(Base, AttendanceCountsMixin):
+    """Attendance counts for one member across one class, maintained on every upsert."""
+
+    __tablename__ = "attendance_member_summaries"
+
+    class_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("classes.id"), primary_key=True)
+    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), primary_key=True, index=True)
@@ -2,7 +2,7 @@
 
 import uuid
 
-from sqlalchemy import ForeignKey, JSON, String
+from sqlalchemy import JSON, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base, TimestampMixin
@@ -12,10 +12,19 @@ class QuarterlyPlan(Base, TimestampMixin):
     """Leadership planning artifact stored as structured JSON data."""
 
     __tablename__ = "quarterly_plans"
+    __table_args__ = (
+        Index("ix_quarterly_plans_created_at_id", "created_at", "id"),
+        Index("ix_quarterly_plans_quarter_created_at_id", "quarter", "created_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
-    quarter: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
+    quarter: Mapped[str] = mapped_column(String(20), nullable=False)
     objectives: Mapped[list[dict[str, str]]] = mapped_column(JSON, default=list, nullable=False)
     created_by_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), nullable=False)
+    version: Mapped[int] = mapped_column(Integer, server_default="1", nullable=False)
 
     created_by = relationship("User", back_populates="plans")
+
+    # Every ORM update checks and bumps ``version``, so concurrent writers fail
+    # with StaleDataError instead of silently overwriting each other.
+    __mapper_args__ = {"version_id_col": version}
@@ -1,11 +1,26 @@
 """Q&A ORM models."""
 
 import uuid
+from datetime import datetime
+from typing import Any
 
-from sqlalchemy import Boolean, ForeignKey, JSON, String, Text
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    ColumnElement,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base, TimestampMixin
+from app.db.search import install_question_search
+from app.utils.time import utc_now
 
 
 class QnAQuestion(Base, TimestampMixin):
@@ -19,9 +34,64 @@ class QnAQuestion(Base, TimestampMixin):
     body: Mapped[str] = mapped_column(Text, nullable=False)
     tags: Mapped[list[str]] = mapped_column(JSON, default=list, nullable=False)
     is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    reply_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    last_activity_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=utc_now,
+        server_default=func.now(),
+        nullable=False,
+    )
 
     author = relationship("User", back_populates="questions")
     replies = relationship("QnAReply", back_populates="question", cascade="all, delete-orphan")
+    tag_rows = relationship("QuestionTag", cascade="all, delete-orphan")
+
+
+def _partial_index(name: str, *columns: Any, where: ColumnElement[bool]) -> Index:
+    """Index only rows matching ``where``, which must match the query filter verbatim.
+
+    SQLite only uses a partial index when the query repeats its predicate
+    term for term, so list queries and indexes share ``is_deleted.is_(False)``.
+    """
+
+    return Index(name, *columns, postgresql_where=where, sqlite_where=where)
+
+
+_live_question = QnAQuestion.is_deleted.is_(False)
+_partial_index(
+    "ix_qna_questions_live_created_at_id",
+    QnAQuestion.created_at,
+    QnAQuestion.id,
+    where=_live_question,
+)
+_partial_index(
+    "ix_qna_questions_live_last_activity_at_id",
+    QnAQuestion.last_activity_at,
+    QnAQuestion.id,
+    where=_live_question,
+)
+_partial_index(
+    "ix_qna_questions_unanswered",
+    QnAQuestion.created_at,
+    QnAQuestion.id,
+    where=(QnAQuestion.reply_count == 0) & _live_question,
+)
+install_question_search(Base.metadata.tables[QnAQuestion.__tablename__])
+
+
+class QuestionTag(Base):
+    """Normalized tag row used for indexed tag filters and facet counts.
+
+    ``created_at`` copies the question's creation time so newest-first tag
+    listings page straight off ``(tag, created_at, question_id)``.
+    """
+
+    __tablename__ = "question_tags"
+    __table_args__ = (Index("ix_question_tags_tag_created_at_question_id", "tag", "created_at", "question_id"),)
+
+    question_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("qna_questions.id"), primary_key=True)
+    tag: Mapped[str] = mapped_column(String(50), primary_key=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
 
 class QnAReply(Base, TimestampMixin):
@@ -41,3 +111,12 @@ class QnAReply(Base, TimestampMixin):
 
     question = relationship("QnAQuestion", back_populates="replies")
     author = relationship("User", back_populates="replies")
+
+
+_partial_index(
+    "ix_qna_replies_live_question_id_created_at_id",
+    QnAReply.question_id,
+    QnAReply.created_at,
+    QnAReply.id,
+    where=QnAReply.is_deleted.is_(False),
+)
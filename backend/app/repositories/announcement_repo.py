@@ -1,11 +1,22 @@
 """Repository for announcement persistence operations."""
 
 import uuid
+from collections.abc import AsyncIterator
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.projection import project, stream_rows
 from app.models.announcement import Announcement
+from app.schemas.announcement import AnnouncementRead
+from app.utils.pagination import (
+    DEFAULT_PAGE_SIZE,
+    KeysetPage,
+    keyset_order,
+    keyset_page,
+    keyset_paginate,
+)
 
 
 class AnnouncementRepository:
@@ -23,12 +34,34 @@ class AnnouncementRepository:
         await self.session.refresh(announcement)
         return announcement
 
-    async def list_announcements(self) -> list[Announcement]:
-        """List all announcements sorted by newest first."""
+    async def list_announcements(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> KeysetPage[Row[Any]]:
+        """List one page of announcements sorted by newest first."""
 
-        statement = select(Announcement).order_by(Announcement.created_at.desc())
+        statement = keyset_paginate(
+            project(Announcement, AnnouncementRead),
+            Announcement.created_at,
+            Announcement.id,
+            limit=limit,
+            cursor=cursor,
+            descending=True,
+        )
         result = await self.session.execute(statement)
-        return list(result.scalars().all())
+        return keyset_page(list(result.all()), limit, "created_at")
+
+    def stream_announcements(self) -> AsyncIterator[Row[Any]]:
+        """Stream every announcement, newest first, through a server-side cursor."""
+
+        statement = keyset_order(
+            project(Announcement, AnnouncementRead),
+            Announcement.created_at,
+            Announcement.id,
+            descending=True,
+        )
+        return stream_rows(self.session, statement)
 
     async def get_by_id(self, announcement_id: uuid.UUID) -> Announcement | None:
         """Get one announcement by id."""
@@ -1,11 +1,27 @@
 """Repository for attendance persistence operations."""
 
 import uuid
+from collections import Counter
+from collections.abc import Iterable
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Row, delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.attendance import Attendance, AttendanceStatus
+from app.db.dialect import upsert_insert
+from app.models.attendance import (
+    Attendance,
+    AttendanceMemberSummary,
+    AttendanceSessionSummary,
+    AttendanceStatus,
+)
+from app.models.session import ClassSession
+
+COUNT_COLUMNS: dict[AttendanceStatus, str] = {
+    AttendanceStatus.PRESENT: "present_count",
+    AttendanceStatus.ABSENT: "absent_count",
+    AttendanceStatus.EXCUSED: "excused_count",
+}
 
 
 class AttendanceRepository:
@@ -24,31 +40,185 @@ class AttendanceRepository:
         result = await self.session.execute(statement)
         return result.scalar_one_or_none()
 
+    async def _execute_upsert(
+        self,
+        class_id: uuid.UUID,
+        rows: list[dict[str, object]],
+    ) -> list[Attendance]:
+        """Upsert attendance rows in one ``INSERT ... ON CONFLICT`` statement and roll them up.
+
+        The conflict clause copies the old status into ``previous_status``
+        while the row is locked, so the rollup deltas computed from the
+        returned rows are exact even under concurrent marks.
+        """
+
+        index_elements = [Attendance.session_id, Attendance.user_id]
+        insert = upsert_insert(self.session)
+        statement = insert(Attendance).values(_in_lock_order(rows, index_elements))
+        statement = statement.on_conflict_do_update(
+            index_elements=index_elements,
+            set_={
+                "previous_status": Attendance.status,
+                "status": statement.excluded.status,
+                "marked_by_id": statement.excluded.marked_by_id,
+                "updated_at": func.now(),
+            },
+        ).returning(Attendance)
+
+        result = await self.session.execute(
+            statement,
+            execution_options={"populate_existing": True},
+        )
+        records: list[Attendance] = list(result.scalars().all())
+        await self._apply_rollups(
+            class_id,
+            ((record.session_id, record.user_id, record.previous_status, record.status) for record in records),
+        )
+        return records
+
+    async def _apply_rollups(
+        self,
+        class_id: uuid.UUID,
+        transitions: Iterable[
+            tuple[uuid.UUID, uuid.UUID, AttendanceStatus | None, AttendanceStatus | None]
+        ],
+    ) -> None:
+        """Add status transitions ``(session_id, user_id, old, new)`` to the summary tables."""
+
+        session_deltas: dict[uuid.UUID, Counter[str]] = {}
+        member_deltas: dict[uuid.UUID, Counter[str]] = {}
+        for session_id, user_id, old, new in transitions:
+            if old == new:
+                continue
+            for deltas, key in ((session_deltas, session_id), (member_deltas, user_id)):
+                counter = deltas.setdefault(key, Counter())
+                if new is not None:
+                    counter[COUNT_COLUMNS[new]] += 1
+                if old is not None:
+                    counter[COUNT_COLUMNS[old]] -= 1
+
+        await self._increment(
+            AttendanceSessionSummary,
+            [AttendanceSessionSummary.session_id],
+            [
+                {"session_id": session_id, "class_id": class_id, **_count_values(counter)}
+                for session_id, counter in session_deltas.items()
+            ],
+        )
+        await self._increment(
+            AttendanceMemberSummary,
+            [AttendanceMemberSummary.class_id, AttendanceMemberSummary.user_id],
+            [
+                {"class_id": class_id, "user_id": user_id, **_count_values(counter)}
+                for user_id, counter in member_deltas.items()
+            ],
+        )
+
+    async def _increment(
+        self,
+        model: type[AttendanceSessionSummary] | type[AttendanceMemberSummary],
+        index_elements: list[Any],
+        rows: list[dict[str, object]],
+    ) -> None:
+        """Add per-status deltas to summary rows, creating missing rows on the way."""
+
+        if not rows:
+            return
+
+        insert = upsert_insert(self.session)
+        statement = insert(model).values(_in_lock_order(rows, index_elements))
+        statement = statement.on_conflict_do_update(
+            index_elements=index_elements,
+            set_={
+                column: getattr(model, column) + statement.excluded[column]
+                for column in COUNT_COLUMNS.values()
+            },
+        )
+        await self.session.execute(statement)
+
+    async def forget_session(self, session_id: uuid.UUID, class_id: uuid.UUID) -> None:
+        """Remove a session's attendance from the rollups ahead of deleting the session.
+
+        Does not commit; the caller deletes the session in the same transaction.
+        """
+
+        statement = select(Attendance.user_id, Attendance.status).where(
+            Attendance.session_id == session_id
+        )
+        result = await self.session.execute(statement)
+        await self._apply_rollups(
+            class_id,
+            ((session_id, user_id, status, None) for user_id, status in result.all()),
+        )
+        await self.session.execute(
+            delete(AttendanceSessionSummary).where(AttendanceSessionSummary.session_id == session_id)
+        )
+
+    async def forget_class(self, class_id: uuid.UUID) -> None:
+        """Drop every rollup row of a class ahead of deleting the class.
+
+        Does not commit; the caller deletes the class in the same transaction.
+        """
+
+        for model in (AttendanceSessionSummary, AttendanceMemberSummary):
+            await self.session.execute(delete(model).where(model.class_id == class_id))
+
     async def upsert(
         self,
         session_id: uuid.UUID,
+        class_id: uuid.UUID,
         user_id: uuid.UUID,
         marked_by_id: uuid.UUID,
         status: AttendanceStatus,
     ) -> Attendance:
-        """Create or update attendance for a user in a session."""
-
-        existing = await self.get_existing(session_id=session_id, user_id=user_id)
-        if existing is None:
-            existing = Attendance(
-                session_id=session_id,
-                user_id=user_id,
-                marked_by_id=marked_by_id,
-                status=status,
-            )
-            self.session.add(existing)
-        else:
-            existing.status = status
-            existing.marked_by_id = marked_by_id
+        """Create or update attendance for a user in a session.
+
+        Runs as a single ``INSERT ... ON CONFLICT (session_id, user_id) DO UPDATE
+        ... RETURNING`` statement, so concurrent marks for the same member
+        never collide on ``uq_attendance_session_user``. The session and
+        member rollups are updated in the same transaction.
+        """
+
+        [attendance] = await self._execute_upsert(
+            class_id,
+            [
+                {
+                    "session_id": session_id,
+                    "user_id": user_id,
+                    "marked_by_id": marked_by_id,
+                    "status": status,
+                }
+            ],
+        )
+        await self.session.commit()
+        return attendance
+
+    async def bulk_upsert(
+        self,
+        session_id: uuid.UUID,
+        class_id: uuid.UUID,
+        marked_by_id: uuid.UUID,
+        statuses: dict[uuid.UUID, AttendanceStatus],
+    ) -> list[Attendance]:
+        """Create or update attendance for many members in one statement and transaction."""
 
+        if not statuses:
+            return []
+
+        records = await self._execute_upsert(
+            class_id,
+            [
+                {
+                    "session_id": session_id,
+                    "user_id": user_id,
+                    "marked_by_id": marked_by_id,
+                    "status": status,
+                }
+                for user_id, status in statuses.items()
+            ],
+        )
         await self.session.commit()
-        await self.session.refresh(existing)
-        return existing
+        return records
 
     async def list_by_session(self, session_id: uuid.UUID) -> list[Attendance]:
         """List attendance entries for a specific session."""
@@ -56,3 +226,54 @@ class AttendanceRepository:
         statement = select(Attendance).where(Attendance.session_id == session_id)
         result = await self.session.execute(statement)
         return list(result.scalars().all())
+
+    async def session_summaries_for_class(self, class_id: uuid.UUID) -> list[Row[Any]]:
+        """Return the attendance rollup of every marked session in a class, by start time."""
+
+        statement = (
+            select(
+                AttendanceSessionSummary.session_id,
+                ClassSession.title,
+                ClassSession.starts_at,
+                *_count_columns(AttendanceSessionSummary),
+            )
+            .join(ClassSession, ClassSession.id == AttendanceSessionSummary.session_id)
+            .where(AttendanceSessionSummary.class_id == class_id)
+            .order_by(ClassSession.starts_at, ClassSession.id)
+        )
+        result = await self.session.execute(statement)
+        return list(result.all())
+
+    async def member_summaries(
+        self,
+        class_id: uuid.UUID | None = None,
+        user_id: uuid.UUID | None = None,
+    ) -> list[Row[Any]]:
+        """Return member rollups for a class, for a user across classes, or both."""
+
+        statement = select(
+            AttendanceMemberSummary.class_id,
+            AttendanceMemberSummary.user_id,
+            *_count_columns(AttendanceMemberSummary),
+        )
+        if class_id is not None:
+            statement = statement.where(AttendanceMemberSummary.class_id == class_id)
+        if user_id is not None:
+            statement = statement.where(AttendanceMemberSummary.user_id == user_id)
+        statement = statement.order_by(AttendanceMemberSummary.class_id, AttendanceMemberSummary.user_id)
+        result = await self.session.execute(statement)
+        return list(result.all())
+
+
+def _in_lock_order(rows: list[dict[str, object]], index_elements: list[Any]) -> list[dict[str, object]]:
+    """Sort upsert rows by their conflict key so concurrent upserts lock shared rows in the same order."""
+
+    return sorted(rows, key=lambda row: tuple(str(row[column.key]) for column in index_elements))
+
+
+def _count_values(counter: Counter[str]) -> dict[str, int]:
+    return {column: counter[column] for column in COUNT_COLUMNS.values()}
+
+
+def _count_columns(model: type[AttendanceSessionSummary] | type[AttendanceMemberSummary]) -> list[Any]:
+    return [getattr(model, column) for column in COUNT_COLUMNS.values()]
@@ -1,11 +1,39 @@
 """Repository for class persistence operations."""
 
 import uuid
+from collections.abc import AsyncIterator
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Row, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import class_tag, snapshot_cache
+from app.db.projection import project, stream_rows
 from app.models.class_ import LearningClass
+from app.schemas.class_ import ClassRead
+from app.utils.pagination import (
+    DEFAULT_PAGE_SIZE,
+    KeysetPage,
+    keyset_order,
+    keyset_page,
+    keyset_paginate,
+)
+
+# Stable columns only: counters such as ``enrollment_count`` change without
+# invalidating the snapshot and are never served from one.
+_SNAPSHOT_COLUMNS: tuple[Any, ...] = (
+    LearningClass.id,
+    LearningClass.title,
+    LearningClass.description,
+    LearningClass.is_published,
+    LearningClass.created_by_id,
+    LearningClass.created_at,
+    LearningClass.updated_at,
+)
+
+
+def _snapshot_key(class_id: uuid.UUID) -> str:
+    return f"snapshot:class:{class_id}"
 
 
 class ClassRepository:
@@ -39,12 +67,52 @@ class ClassRepository:
 
         return await self.session.get(LearningClass, class_id)
 
-    async def list_classes(self) -> list[LearningClass]:
-        """List classes ordered by newest first."""
+    async def get_snapshot(self, class_id: uuid.UUID) -> Row[Any] | None:
+        """Return a read-only snapshot of a class, cached across requests.
 
-        statement = select(LearningClass).order_by(LearningClass.created_at.desc())
+        Use it for existence checks and reads of stable columns; use
+        ``get_by_id`` for anything that modifies the class.
+        """
+
+        async def load() -> Row[Any] | None:
+            statement = select(*_SNAPSHOT_COLUMNS).where(LearningClass.id == class_id)
+            row: Row[Any] | None = (await self.session.execute(statement)).one_or_none()
+            return row
+
+        return await snapshot_cache.get_or_load(
+            _snapshot_key(class_id),
+            load,
+            lambda row: [class_tag(row.id)],
+        )
+
+    async def list_classes(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> KeysetPage[Row[Any]]:
+        """List one page of classes ordered by newest first."""
+
+        statement = keyset_paginate(
+            project(LearningClass, ClassRead),
+            LearningClass.created_at,
+            LearningClass.id,
+            limit=limit,
+            cursor=cursor,
+            descending=True,
+        )
         result = await self.session.execute(statement)
-        return list(result.scalars().all())
+        return keyset_page(list(result.all()), limit, "created_at")
+
+    def stream_classes(self) -> AsyncIterator[Row[Any]]:
+        """Stream every class, newest first, through a server-side cursor."""
+
+        statement = keyset_order(
+            project(LearningClass, ClassRead),
+            LearningClass.created_at,
+            LearningClass.id,
+            descending=True,
+        )
+        return stream_rows(self.session, statement)
 
     async def update(self, class_: LearningClass, updates: dict[str, object]) -> LearningClass:
         """Update fields on a class and persist changes."""
@@ -53,10 +121,13 @@ class ClassRepository:
             setattr(class_, key, value)
         await self.session.commit()
         await self.session.refresh(class_)
+        snapshot_cache.invalidate_row(_snapshot_key(class_.id))
         return class_
 
     async def delete(self, class_: LearningClass) -> None:
-        """Delete a class record."""
+        """Delete a class record along with its and its sessions' snapshots."""
 
+        class_id = class_.id
         await self.session.delete(class_)
         await self.session.commit()
+        snapshot_cache.invalidate(class_tag(class_id))
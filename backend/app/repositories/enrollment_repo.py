@@ -1,10 +1,13 @@
 """Repository for enrollment persistence operations."""
 
 import uuid
+from collections.abc import Collection
 
-from sqlalchemy import select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.dialect import upsert_insert
+from app.models.class_ import LearningClass
 from app.models.enrollment import Enrollment
 
 
@@ -24,15 +27,61 @@ class EnrollmentRepository:
         result = await self.session.execute(statement)
         return result.scalar_one_or_none()
 
+    async def enrolled_user_ids(
+        self,
+        class_id: uuid.UUID,
+        user_ids: list[uuid.UUID],
+    ) -> set[uuid.UUID]:
+        """Return which of the given users are enrolled in a class."""
+
+        if not user_ids:
+            return set()
+
+        statement = select(Enrollment.user_id).where(
+            Enrollment.class_id == class_id,
+            Enrollment.user_id.in_(user_ids),
+        )
+        result = await self.session.execute(statement)
+        return set(result.scalars().all())
+
     async def create(self, user_id: uuid.UUID, class_id: uuid.UUID) -> Enrollment:
-        """Create a new enrollment."""
+        """Create a new enrollment and count it on its class in the same transaction."""
 
         enrollment = Enrollment(user_id=user_id, class_id=class_id)
         self.session.add(enrollment)
+        await self.session.flush()
+        await self._adjust_count(class_id, 1)
         await self.session.commit()
         await self.session.refresh(enrollment)
         return enrollment
 
+    async def create_many_skip_existing(
+        self,
+        class_id: uuid.UUID,
+        user_ids: Collection[uuid.UUID],
+    ) -> set[uuid.UUID]:
+        """Insert enrollments for many users, skipping pairs that already exist.
+
+        Conflicts on ``uq_enrollments_user_class`` are ignored, and only the
+        user ids that were actually inserted are returned.
+        """
+
+        if not user_ids:
+            return set()
+
+        insert = upsert_insert(self.session)
+        statement = (
+            insert(Enrollment)
+            .values([{"user_id": user_id, "class_id": class_id} for user_id in user_ids])
+            .on_conflict_do_nothing(index_elements=[Enrollment.user_id, Enrollment.class_id])
+            .returning(Enrollment.user_id)
+        )
+        result = await self.session.execute(statement)
+        inserted: set[uuid.UUID] = set(result.scalars().all())
+        await self._adjust_count(class_id, len(inserted))
+        await self.session.commit()
+        return inserted
+
     async def list_by_class(self, class_id: uuid.UUID) -> list[Enrollment]:
         """List enrollments for a class."""
 
@@ -47,8 +96,55 @@ class EnrollmentRepository:
         result = await self.session.execute(statement)
         return list(result.scalars().all())
 
+    async def class_ids_for_user(self, user_id: uuid.UUID) -> list[uuid.UUID]:
+        """Return the ids of every class a user is enrolled in."""
+
+        statement = select(Enrollment.class_id).where(Enrollment.user_id == user_id)
+        result = await self.session.execute(statement)
+        return list(result.scalars().all())
+
     async def delete(self, enrollment: Enrollment) -> None:
-        """Delete an enrollment."""
+        """Delete an enrollment and uncount it on its class in the same transaction."""
 
+        class_id = enrollment.class_id
         await self.session.delete(enrollment)
+        await self.session.flush()
+        await self._adjust_count(class_id, -1)
+        await self.session.commit()
+
+    async def repair_counts(self) -> list[uuid.UUID]:
+        """Recompute every class's ``enrollment_count`` and return the ids that were wrong.
+
+        One grouped query counts enrollments for all classes; only classes whose
+        stored count drifted are rewritten, in a single executemany update.
+        """
+
+        actual = func.count(Enrollment.user_id)
+        statement = (
+            select(LearningClass.id, actual.label("actual"))
+            .outerjoin(Enrollment, Enrollment.class_id == LearningClass.id)
+            .group_by(LearningClass.id, LearningClass.enrollment_count)
+            .having(actual != LearningClass.enrollment_count)
+        )
+        drifted = (await self.session.execute(statement)).all()
+        if drifted:
+            await self.session.execute(
+                update(LearningClass),
+                [{"id": class_id, "enrollment_count": count} for class_id, count in drifted],
+            )
         await self.session.commit()
+        return [class_id for class_id, _ in drifted]
+
+    async def _adjust_count(self, class_id: uuid.UUID, delta: int) -> None:
+        """Atomically add ``delta`` to a class's enrollment counter without committing."""
+
+        if not delta:
+            return
+        await self.session.execute(
+            update(LearningClass)
+            .where(LearningClass.id == class_id)
+            .values(
+                enrollment_count=LearningClass.enrollment_count + delta,
+                updated_at=LearningClass.updated_at,
+            )
+        )
@@ -1,11 +1,23 @@
 """Repository for quarterly planning persistence operations."""
 
 import uuid
+from collections.abc import AsyncIterator, Collection
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.exc import StaleDataError
 
+from app.db.projection import project, stream_rows
 from app.models.plan import QuarterlyPlan
+from app.schemas.plan import PlanRead
+from app.utils.pagination import (
+    DEFAULT_PAGE_SIZE,
+    KeysetPage,
+    keyset_order,
+    keyset_page,
+    keyset_paginate,
+)
 
 
 class PlanRepository:
@@ -32,12 +44,46 @@ class PlanRepository:
         await self.session.refresh(plan)
         return plan
 
-    async def list_plans(self) -> list[QuarterlyPlan]:
-        """List all plans sorted by latest first."""
-
-        statement = select(QuarterlyPlan).order_by(QuarterlyPlan.created_at.desc())
+    async def list_plans(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> KeysetPage[Row[Any]]:
+        """List one page of plans sorted by latest first."""
+
+        statement = keyset_paginate(
+            project(QuarterlyPlan, PlanRead),
+            QuarterlyPlan.created_at,
+            QuarterlyPlan.id,
+            limit=limit,
+            cursor=cursor,
+            descending=True,
+        )
         result = await self.session.execute(statement)
-        return list(result.scalars().all())
+        return keyset_page(list(result.all()), limit, "created_at")
+
+    def stream_plans(self) -> AsyncIterator[Row[Any]]:
+        """Stream every plan, newest first, through a server-side cursor."""
+
+        statement = keyset_order(
+            project(QuarterlyPlan, PlanRead),
+            QuarterlyPlan.created_at,
+            QuarterlyPlan.id,
+            descending=True,
+        )
+        return stream_rows(self.session, statement)
+
+    def stream_for_export(self, quarters: Collection[str] | None = None) -> AsyncIterator[Row[Any]]:
+        """Stream plans grouped by quarter, optionally only the given quarters."""
+
+        statement = project(QuarterlyPlan, PlanRead).order_by(
+            QuarterlyPlan.quarter,
+            QuarterlyPlan.created_at,
+            QuarterlyPlan.id,
+        )
+        if quarters:
+            statement = statement.where(QuarterlyPlan.quarter.in_(quarters))
+        return stream_rows(self.session, statement)
 
     async def get_by_id(self, plan_id: uuid.UUID) -> QuarterlyPlan | None:
         """Fetch one plan by id."""
@@ -45,11 +91,19 @@ class PlanRepository:
         return await self.session.get(QuarterlyPlan, plan_id)
 
     async def update(self, plan: QuarterlyPlan, updates: dict[str, object]) -> QuarterlyPlan:
-        """Update a plan and persist changes."""
+        """Update a plan and persist changes.
+
+        Raises ``StaleDataError`` (after rolling back) when another writer bumped
+        the plan's version first.
+        """
 
         for key, value in updates.items():
             setattr(plan, key, value)
-        await self.session.commit()
+        try:
+            await self.session.commit()
+        except StaleDataError:
+            await self.session.rollback()
+            raise
         await self.session.refresh(plan)
         return plan
 
@@ -1,11 +1,31 @@
 """Repository for Q&A persistence operations."""
 
 import uuid
+from collections.abc import AsyncIterator, Collection
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Row, Select, delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.qna import QnAQuestion, QnAReply
+from app.db.base import Base
+from app.db.projection import project, stream_rows
+from app.db.search import search_questions
+from app.models.qna import QnAQuestion, QnAReply, QuestionTag
+from app.schemas.qna import QuestionRead, QuestionSort, ReplyRead
+from app.utils.pagination import (
+    DEFAULT_PAGE_SIZE,
+    KeyColumn,
+    KeysetPage,
+    keyset_order,
+    keyset_page,
+    keyset_paginate,
+)
+from app.utils.time import utc_now
+
+_SORT_ATTRIBUTES: dict[QuestionSort, str] = {
+    "newest": "created_at",
+    "activity": "last_activity_at",
+}
 
 
 class QnARepository:
@@ -21,9 +41,17 @@ class QnARepository:
         body: str,
         tags: list[str],
     ) -> QnAQuestion:
-        """Create a new question."""
-
-        question = QnAQuestion(author_id=author_id, title=title, body=body, tags=tags)
+        """Create a new question together with its normalized tag rows."""
+
+        now = utc_now()
+        question = QnAQuestion(
+            author_id=author_id,
+            title=title,
+            body=body,
+            tags=tags,
+            created_at=now,
+            tag_rows=[QuestionTag(tag=tag, created_at=now) for tag in tags],
+        )
         self.session.add(question)
         await self.session.commit()
         await self.session.refresh(question)
@@ -33,51 +61,171 @@ class QnARepository:
         self,
         search: str | None = None,
         tag: str | None = None,
-    ) -> list[QnAQuestion]:
-        """List non-deleted questions with optional search and tag filters."""
-
-        statement = select(QnAQuestion).where(QnAQuestion.is_deleted.is_(False))
-        if search:
-            like_value = f"%{search}%"
-            statement = statement.where(
-                QnAQuestion.title.ilike(like_value) | QnAQuestion.body.ilike(like_value)
-            )
-        if tag:
-            statement = statement.where(QnAQuestion.tags.contains([tag]))
+        unanswered: bool = False,
+        sort: QuestionSort = "newest",
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> KeysetPage[Row[Any]]:
+        """List one page of non-deleted questions with optional filters.
+
+        Searches return the ``limit`` most relevant matches as a single page,
+        since relevance ranks have no stable keyset to seek past. Otherwise
+        questions are ordered newest first by creation or by last activity.
+        """
+
+        if search and search.strip():
+            if cursor is not None:
+                raise ValueError("Search results are ranked by relevance and cannot be paged by cursor")
+            statement = self._search_statement(search, tag, unanswered).limit(limit)
+            result = await self.session.execute(statement)
+            return KeysetPage(items=list(result.all()), next_cursor=None)
+
+        sort_attribute = _SORT_ATTRIBUTES[sort]
+        statement = keyset_paginate(
+            self._questions_statement(tag, unanswered),
+            *self._sort_columns(tag, sort),
+            limit=limit,
+            cursor=cursor,
+            descending=True,
+        )
+        result = await self.session.execute(statement)
+        return keyset_page(list(result.all()), limit, sort_attribute)
+
+    def stream_questions(
+        self,
+        search: str | None = None,
+        tag: str | None = None,
+        unanswered: bool = False,
+        sort: QuestionSort = "newest",
+    ) -> AsyncIterator[Row[Any]]:
+        """Stream non-deleted questions through a server-side cursor.
+
+        Searches stream most relevant first; otherwise questions stream in the
+        same order as ``list_questions`` pages.
+        """
+
+        if search and search.strip():
+            return stream_rows(self.session, self._search_statement(search, tag, unanswered))
+
+        statement = keyset_order(
+            self._questions_statement(tag, unanswered),
+            *self._sort_columns(tag, sort),
+            descending=True,
+        )
+        return stream_rows(self.session, statement)
 
-        statement = statement.order_by(QnAQuestion.created_at.desc())
+    def _questions_statement(self, tag: str | None, unanswered: bool) -> Select[Any]:
+        statement = project(QnAQuestion, QuestionRead).where(QnAQuestion.is_deleted.is_(False))
+        if unanswered:
+            statement = statement.where(QnAQuestion.reply_count == 0)
+        if tag:
+            statement = statement.join(QuestionTag, QuestionTag.question_id == QnAQuestion.id).where(
+                QuestionTag.tag == tag
+            )
+        return statement
+
+    @staticmethod
+    def _sort_columns(tag: str | None, sort: QuestionSort) -> tuple[KeyColumn, KeyColumn]:
+        # Tag rows carry their question's created_at, so newest-first tag
+        # listings seek along (tag, created_at, question_id) instead of sorting.
+        if tag and sort == "newest":
+            return QuestionTag.created_at, QuestionTag.question_id
+        return getattr(QnAQuestion, _SORT_ATTRIBUTES[sort]), QnAQuestion.id
+
+    async def tag_counts(self, limit: int) -> list[Row[str, int]]:
+        """Count live questions per tag straight from the ``(tag, created_at, question_id)`` index."""
+
+        count = func.count().label("count")
+        statement = (
+            select(QuestionTag.tag, count)
+            .group_by(QuestionTag.tag)
+            .order_by(count.desc(), QuestionTag.tag)
+            .limit(limit)
+        )
         result = await self.session.execute(statement)
-        return list(result.scalars().all())
+        return list(result.all())
+
+    def _search_statement(self, search: str, tag: str | None, unanswered: bool) -> Select[Any]:
+        return search_questions(
+            self._questions_statement(tag, unanswered),
+            Base.metadata.tables[QnAQuestion.__tablename__],
+            search,
+            self.session.get_bind().dialect.name,
+        )
 
     async def get_question_by_id(self, question_id: uuid.UUID) -> QnAQuestion | None:
         """Fetch one question by id."""
 
         return await self.session.get(QnAQuestion, question_id)
 
+    async def live_question_ids(self, question_ids: Collection[uuid.UUID]) -> set[uuid.UUID]:
+        """Return which of the given ids belong to questions that are not deleted."""
+
+        if not question_ids:
+            return set()
+
+        statement = select(QnAQuestion.id).where(
+            QnAQuestion.id.in_(question_ids),
+            QnAQuestion.is_deleted.is_(False),
+        )
+        result = await self.session.execute(statement)
+        return set(result.scalars().all())
+
     async def soft_delete_question(self, question: QnAQuestion) -> QnAQuestion:
-        """Soft-delete a question."""
+        """Soft-delete a question and drop its tag rows so facet counts skip it."""
 
         question.is_deleted = True
+        await self.session.execute(delete(QuestionTag).where(QuestionTag.question_id == question.id))
         await self.session.commit()
         await self.session.refresh(question)
         return question
 
     async def create_reply(self, question_id: uuid.UUID, author_id: uuid.UUID, body: str) -> QnAReply:
-        """Create a reply under an existing question."""
+        """Create a reply and bump the question's reply count and activity in one transaction."""
 
-        reply = QnAReply(question_id=question_id, author_id=author_id, body=body)
+        now = utc_now()
+        reply = QnAReply(question_id=question_id, author_id=author_id, body=body, created_at=now)
         self.session.add(reply)
+        await self.session.execute(
+            update(QnAQuestion)
+            .where(QnAQuestion.id == question_id)
+            .values(
+                reply_count=QnAQuestion.reply_count + 1,
+                last_activity_at=now,
+                updated_at=QnAQuestion.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
         await self.session.commit()
         await self.session.refresh(reply)
         return reply
 
-    async def list_replies(self, question_id: uuid.UUID) -> list[QnAReply]:
-        """List non-deleted replies for a question."""
+    async def list_replies(
+        self,
+        question_id: uuid.UUID,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> KeysetPage[Row[Any]]:
+        """List one page of non-deleted replies for a question, oldest first."""
+
+        statement = keyset_paginate(
+            self._replies_statement(question_id),
+            QnAReply.created_at,
+            QnAReply.id,
+            limit=limit,
+            cursor=cursor,
+        )
+        result = await self.session.execute(statement)
+        return keyset_page(list(result.all()), limit, "created_at")
 
-        statement = select(QnAReply).where(
+    def stream_replies(self, question_id: uuid.UUID) -> AsyncIterator[Row[Any]]:
+        """Stream non-deleted replies for a question, oldest first, through a server-side cursor."""
+
+        statement = keyset_order(self._replies_statement(question_id), QnAReply.created_at, QnAReply.id)
+        return stream_rows(self.session, statement)
+
+    def _replies_statement(self, question_id: uuid.UUID) -> Select[Any]:
+        return project(QnAReply, ReplyRead).where(
             QnAReply.question_id == question_id,
             QnAReply.is_deleted.is_(False),
         )
-        statement = statement.order_by(QnAReply.created_at.asc())
-        result = await self.session.execute(statement)
-        return list(result.scalars().all())
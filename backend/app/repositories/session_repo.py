@@ -1,12 +1,29 @@
 """Repository for class session persistence operations."""
 
 import uuid
+from collections.abc import AsyncIterator, Collection
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Row, Select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import class_tag, snapshot_cache
+from app.db.projection import project, stream_rows
+from app.models.enrollment import Enrollment
 from app.models.session import ClassSession
+from app.schemas.session import SessionRead
+from app.utils.pagination import (
+    DEFAULT_PAGE_SIZE,
+    KeysetPage,
+    keyset_order,
+    keyset_page,
+    keyset_paginate,
+)
+
+
+def _snapshot_key(session_id: uuid.UUID) -> str:
+    return f"snapshot:session:{session_id}"
 
 
 class SessionRepository:
@@ -44,15 +61,115 @@ class SessionRepository:
 
         return await self.session.get(ClassSession, session_id)
 
-    async def list_sessions(self, class_id: uuid.UUID | None = None) -> list[ClassSession]:
-        """List sessions, optionally filtered by class id."""
+    async def get_snapshot(self, session_id: uuid.UUID) -> Row[Any] | None:
+        """Return a read-only snapshot of a session, cached across requests.
+
+        Snapshots are tagged with their class, so deleting the class (which
+        cascades to its sessions) drops them too.
+        """
+
+        async def load() -> Row[Any] | None:
+            statement = project(ClassSession, SessionRead).where(ClassSession.id == session_id)
+            row: Row[Any] | None = (await self.session.execute(statement)).one_or_none()
+            return row
+
+        return await snapshot_cache.get_or_load(
+            _snapshot_key(session_id),
+            load,
+            lambda row: [class_tag(row.class_id)],
+        )
+
+    async def list_sessions(
+        self,
+        class_id: uuid.UUID | None = None,
+        starts_from: datetime | None = None,
+        starts_before: datetime | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> KeysetPage[Row[Any]]:
+        """List one page of sessions by start time, optionally by class and start window."""
+
+        statement = keyset_paginate(
+            self._sessions_statement(class_id, starts_from, starts_before),
+            ClassSession.starts_at,
+            ClassSession.id,
+            limit=limit,
+            cursor=cursor,
+        )
+        result = await self.session.execute(statement)
+        return keyset_page(list(result.all()), limit, "starts_at")
+
+    def stream_sessions(
+        self,
+        class_id: uuid.UUID | None = None,
+        starts_from: datetime | None = None,
+        starts_before: datetime | None = None,
+    ) -> AsyncIterator[Row[Any]]:
+        """Stream sessions by start time through a server-side cursor."""
+
+        statement = keyset_order(
+            self._sessions_statement(class_id, starts_from, starts_before),
+            ClassSession.starts_at,
+            ClassSession.id,
+        )
+        return stream_rows(self.session, statement)
 
-        statement = select(ClassSession)
+    async def list_upcoming_for_user(
+        self,
+        user_id: uuid.UUID,
+        starts_from: datetime,
+        starts_before: datetime | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> KeysetPage[Row[Any]]:
+        """List one page of sessions in the user's enrolled classes starting from a time.
+
+        The join walks ``uq_enrollments_user_class`` for the user's classes and
+        then ``ix_sessions_class_id_starts_at_id`` for each class's window.
+        """
+
+        statement = self._sessions_statement(None, starts_from, starts_before).join(
+            Enrollment,
+            (Enrollment.class_id == ClassSession.class_id) & (Enrollment.user_id == user_id),
+        )
+        statement = keyset_paginate(
+            statement,
+            ClassSession.starts_at,
+            ClassSession.id,
+            limit=limit,
+            cursor=cursor,
+        )
+        result = await self.session.execute(statement)
+        return keyset_page(list(result.all()), limit, "starts_at")
+
+    async def list_for_classes(self, class_ids: Collection[uuid.UUID]) -> list[Row[Any]]:
+        """List every session of the given classes by start time."""
+
+        if not class_ids:
+            return []
+
+        statement = keyset_order(
+            self._sessions_statement(None).where(ClassSession.class_id.in_(class_ids)),
+            ClassSession.starts_at,
+            ClassSession.id,
+        )
+        result = await self.session.execute(statement)
+        return list(result.all())
+
+    def _sessions_statement(
+        self,
+        class_id: uuid.UUID | None,
+        starts_from: datetime | None = None,
+        starts_before: datetime | None = None,
+    ) -> Select[Any]:
+        statement = project(ClassSession, SessionRead)
         if class_id is not None:
             statement = statement.where(ClassSession.class_id == class_id)
-        statement = statement.order_by(ClassSession.starts_at.asc())
-        result = await self.session.execute(statement)
-        return list(result.scalars().all())
+        if starts_from is not None:
+            statement = statement.where(ClassSession.starts_at >= starts_from)
+        if starts_before is not None:
+            statement = statement.where(ClassSession.starts_at < starts_before)
+        return statement
 
     async def update(self, session: ClassSession, updates: dict[str, object]) -> ClassSession:
         """Update session fields and persist changes."""
@@ -61,10 +178,13 @@ class SessionRepository:
             setattr(session, key, value)
         await self.session.commit()
         await self.session.refresh(session)
+        snapshot_cache.invalidate_row(_snapshot_key(session.id))
         return session
 
     async def delete(self, session: ClassSession) -> None:
-        """Delete a session record."""
+        """Delete a session record and its snapshot."""
 
+        session_id = session.id
         await self.session.delete(session)
         await self.session.commit()
+        snapshot_cache.invalidate_row(_snapshot_key(session_id))
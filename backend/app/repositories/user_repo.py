@@ -1,11 +1,22 @@
 """Repository for user persistence operations."""
 
 import uuid
+from collections.abc import AsyncIterator, Collection
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Row, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.projection import project, stream_rows
 from app.models.user import User, UserRole
+from app.schemas.user import UserRead
+from app.utils.pagination import (
+    DEFAULT_PAGE_SIZE,
+    KeysetPage,
+    keyset_order,
+    keyset_page,
+    keyset_paginate,
+)
 
 
 class UserRepository:
@@ -26,12 +37,39 @@ class UserRepository:
         result = await self.session.execute(statement)
         return result.scalar_one_or_none()
 
-    async def list_users(self) -> list[User]:
-        """Return all users ordered by creation date descending."""
+    async def get_ids_by_emails(self, emails: Collection[str]) -> dict[str, uuid.UUID]:
+        """Resolve a batch of email addresses to user ids in one query."""
 
-        statement = select(User).order_by(User.created_at.desc())
+        if not emails:
+            return {}
+
+        statement = select(User.email, User.id).where(User.email.in_(emails))
+        result = await self.session.execute(statement)
+        return {email: user_id for email, user_id in result.all()}
+
+    def stream_users(self) -> AsyncIterator[Row[Any]]:
+        """Stream every user, newest first, through a server-side cursor."""
+
+        statement = keyset_order(project(User, UserRead), User.created_at, User.id, descending=True)
+        return stream_rows(self.session, statement)
+
+    async def list_users(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> KeysetPage[Row[Any]]:
+        """Return one page of users ordered by creation date descending."""
+
+        statement = keyset_paginate(
+            project(User, UserRead),
+            User.created_at,
+            User.id,
+            limit=limit,
+            cursor=cursor,
+            descending=True,
+        )
         result = await self.session.execute(statement)
-        return list(result.scalars().all())
+        return keyset_page(list(result.all()), limit, "created_at")
 
     async def create(
         self,
@@ -2,8 +2,9 @@
 
 import uuid
 from datetime import datetime
+from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, computed_field
 
 from app.models.attendance import AttendanceStatus
 from app.schemas.common import ORMModel
@@ -27,3 +28,57 @@ class AttendanceRead(ORMModel):
     status: AttendanceStatus
     created_at: datetime
     updated_at: datetime
+
+
+class AttendanceRollCallRequest(BaseModel):
+    """Request payload to mark a whole session roster at once."""
+
+    session_id: uuid.UUID
+    statuses: dict[uuid.UUID, AttendanceStatus] = Field(min_length=1, max_length=1000)
+
+
+class AttendanceRollCallResult(BaseModel):
+    """Outcome for one member of a roll-call request."""
+
+    user_id: uuid.UUID
+    status: AttendanceStatus
+    outcome: Literal["marked", "not_enrolled"]
+    attendance: AttendanceRead | None = None
+
+
+class AttendanceRollCallResponse(BaseModel):
+    """Per-member results for a roll-call request."""
+
+    session_id: uuid.UUID
+    results: list[AttendanceRollCallResult]
+
+
+class AttendanceCounts(ORMModel):
+    """Per-status attendance counters read from a rollup row."""
+
+    present_count: int
+    absent_count: int
+    excused_count: int
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def attendance_rate(self) -> float | None:
+        """Share of present marks among present and absent ones; excused marks are left out."""
+
+        counted = self.present_count + self.absent_count
+        return None if counted == 0 else self.present_count / counted
+
+
+class SessionAttendanceSummary(AttendanceCounts):
+    """Attendance rollup for one session."""
+
+    session_id: uuid.UUID
+    title: str
+    starts_at: datetime
+
+
+class MemberAttendanceSummary(AttendanceCounts):
+    """Attendance rollup for one member in one class."""
+
+    class_id: uuid.UUID
+    user_id: uuid.UUID
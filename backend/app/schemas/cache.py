@@ -0,0 +1,16 @@
+"""Cache metrics schemas."""
+
+from app.schemas.common import ORMModel
+
+
+class CacheStatsRead(ORMModel):
+    """Counters and hit rate of one in-process cache."""
+
+    entries: int
+    max_entries: int
+    ttl_seconds: float | None
+    hits: int
+    misses: int
+    hit_rate: float | None
+    evictions: int
+    expirations: int
@@ -32,5 +32,6 @@ class ClassRead(ORMModel):
     description: str | None
     is_published: bool
     created_by_id: uuid.UUID
+    enrollment_count: int
     created_at: datetime
     updated_at: datetime
@@ -1,6 +1,12 @@
 """Common schema utilities shared across API modules."""
 
-from pydantic import BaseModel, ConfigDict
+from collections.abc import Iterable
+from functools import cache
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+T = TypeVar("T")
 
 
 class ORMModel(BaseModel):
@@ -13,3 +19,39 @@ class MessageResponse(BaseModel):
     """Simple response envelope for status messages."""
 
     message: str
+
+
+class Page(BaseModel, Generic[T]):
+    """Cursor-paginated list envelope."""
+
+    items: list[T]
+    next_cursor: str | None = None
+
+
+@cache
+def _page_adapter(schema: type[BaseModel]) -> TypeAdapter[Any]:
+    return TypeAdapter(Page[schema])  # type: ignore[valid-type]
+
+
+@cache
+def _list_adapter(schema: type[BaseModel]) -> TypeAdapter[Any]:
+    return TypeAdapter(list[schema])  # type: ignore[valid-type]
+
+
+def page_json(schema: type[BaseModel], items: Iterable[Any], next_cursor: str | None) -> bytes:
+    """Validate ORM objects or rows into ``Page[schema]`` once and encode it as JSON.
+
+    Routes return the bytes in a plain ``Response``, so FastAPI does not
+    validate and serialize the page a second time through ``response_model``.
+    """
+
+    adapter = _page_adapter(schema)
+    page = adapter.validate_python({"items": list(items), "next_cursor": next_cursor}, from_attributes=True)
+    return adapter.dump_json(page)
+
+
+def list_json(schema: type[BaseModel], items: Iterable[Any]) -> bytes:
+    """Validate ORM objects or rows into ``list[schema]`` once and encode it as JSON."""
+
+    adapter = _list_adapter(schema)
+    return adapter.dump_json(adapter.validate_python(list(items), from_attributes=True))
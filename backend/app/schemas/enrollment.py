@@ -2,11 +2,14 @@
 
 import uuid
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel
 
 from app.schemas.common import ORMModel
 
+EnrollmentImportOutcome = Literal["enrolled", "already_enrolled", "unknown_email", "invalid"]
+
 
 class EnrollmentCreate(BaseModel):
     """Request payload to enroll a member in a class."""
@@ -22,3 +25,12 @@ class EnrollmentRead(ORMModel):
     class_id: uuid.UUID
     created_at: datetime
     updated_at: datetime
+
+
+class EnrollmentImportResult(BaseModel):
+    """Outcome for one row of a roster import."""
+
+    line: int
+    email: str | None
+    outcome: EnrollmentImportOutcome
+    user_id: uuid.UUID | None = None
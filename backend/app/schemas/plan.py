@@ -2,8 +2,9 @@
 
 import uuid
 from datetime import datetime
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.schemas.common import ORMModel
 
@@ -29,5 +30,17 @@ class PlanRead(ORMModel):
     quarter: str
     objectives: list[dict[str, str]]
     created_by_id: uuid.UUID
+    version: int
     created_at: datetime
     updated_at: datetime
+
+
+class JsonPatchOperation(BaseModel):
+    """One RFC 6902 operation; paths point into the plan's objectives list."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    op: Literal["add", "remove", "replace", "move", "copy", "test"]
+    path: str
+    value: Any = None
+    from_: str | None = Field(default=None, alias="from")
@@ -2,18 +2,21 @@
 
 import uuid
 from datetime import datetime
+from typing import Annotated, Literal
 
 from pydantic import BaseModel, Field
 
 from app.schemas.common import ORMModel
 
+QuestionSort = Literal["newest", "activity"]
+
 
 class QuestionCreate(BaseModel):
     """Create payload for technical questions."""
 
     title: str = Field(min_length=3, max_length=255)
     body: str = Field(min_length=3)
-    tags: list[str] = Field(default_factory=list)
+    tags: list[Annotated[str, Field(max_length=50)]] = Field(default_factory=list)
 
 
 class ReplyCreate(BaseModel):
@@ -41,5 +44,14 @@ class QuestionRead(ORMModel):
     title: str
     body: str
     tags: list[str]
+    reply_count: int
+    last_activity_at: datetime
     created_at: datetime
     updated_at: datetime
+
+
+class TagCount(BaseModel):
+    """Number of live questions carrying one tag."""
+
+    tag: str
+    count: int
@@ -1,11 +1,17 @@
 """Service layer for community announcements."""
 
 import uuid
+from collections.abc import AsyncIterator
+from typing import Any
 
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.events import ANNOUNCEMENTS_TOPIC, event_hub
 from app.models.announcement import Announcement
 from app.repositories.announcement_repo import AnnouncementRepository
+from app.schemas.announcement import AnnouncementRead
+from app.utils.pagination import DEFAULT_PAGE_SIZE, KeysetPage
 
 
 class AnnouncementService:
@@ -20,14 +26,29 @@ class AnnouncementService:
         body: str,
         created_by_id: uuid.UUID,
     ) -> Announcement:
-        """Create a new announcement."""
+        """Create a new announcement and push it to event stream subscribers."""
 
-        return await self.repo.create(title=title, body=body, created_by_id=created_by_id)
+        announcement = await self.repo.create(title=title, body=body, created_by_id=created_by_id)
+        event_hub.publish(
+            ANNOUNCEMENTS_TOPIC,
+            "announcement",
+            AnnouncementRead.model_validate(announcement).model_dump_json(),
+        )
+        return announcement
 
-    async def list_announcements(self) -> list[Announcement]:
-        """List announcements."""
+    async def list_announcements(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> KeysetPage[Row[Any]]:
+        """List one page of announcements."""
+
+        return await self.repo.list_announcements(limit=limit, cursor=cursor)
+
+    def stream_announcements(self) -> AsyncIterator[Row[Any]]:
+        """Stream every announcement for bulk export."""
 
-        return await self.repo.list_announcements()
+        return self.repo.stream_announcements()
 
     async def delete_announcement(self, announcement_id: uuid.UUID) -> None:
         """Delete announcement by id."""
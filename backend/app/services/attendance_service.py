@@ -1,11 +1,15 @@
 """Service layer for attendance tracking."""
 
 import uuid
+from typing import Any
 
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.attendance import Attendance, AttendanceStatus
 from app.repositories.attendance_repo import AttendanceRepository
+from app.repositories.class_repo import ClassRepository
+from app.repositories.enrollment_repo import EnrollmentRepository
 from app.repositories.session_repo import SessionRepository
 
 
@@ -13,7 +17,9 @@ class AttendanceService:
     """Business logic for attendance marking and retrieval."""
 
     def __init__(self, session: AsyncSession) -> None:
+        self.class_repo = ClassRepository(session)
         self.session_repo = SessionRepository(session)
+        self.enrollment_repo = EnrollmentRepository(session)
         self.repo = AttendanceRepository(session)
 
     async def mark_attendance(
@@ -25,22 +31,74 @@ class AttendanceService:
     ) -> Attendance:
         """Create or update attendance for a session/user pair."""
 
-        session = await self.session_repo.get_by_id(session_id)
+        session = await self.session_repo.get_snapshot(session_id)
         if session is None:
             raise LookupError("Session not found")
 
         return await self.repo.upsert(
             session_id=session_id,
+            class_id=session.class_id,
             user_id=user_id,
             marked_by_id=marked_by_id,
             status=status,
         )
 
+    async def roll_call(
+        self,
+        session_id: uuid.UUID,
+        marked_by_id: uuid.UUID,
+        statuses: dict[uuid.UUID, AttendanceStatus],
+    ) -> dict[uuid.UUID, Attendance | None]:
+        """Mark a session roster, skipping members not enrolled in the session's class.
+
+        Returns the attendance record per requested user id, or ``None`` for
+        users who are not enrolled.
+        """
+
+        session = await self.session_repo.get_snapshot(session_id)
+        if session is None:
+            raise LookupError("Session not found")
+
+        enrolled = await self.enrollment_repo.enrolled_user_ids(
+            class_id=session.class_id,
+            user_ids=list(statuses),
+        )
+        records = await self.repo.bulk_upsert(
+            session_id=session_id,
+            class_id=session.class_id,
+            marked_by_id=marked_by_id,
+            statuses={user_id: status for user_id, status in statuses.items() if user_id in enrolled},
+        )
+
+        by_user = {record.user_id: record for record in records}
+        return {user_id: by_user.get(user_id) for user_id in statuses}
+
     async def list_for_session(self, session_id: uuid.UUID) -> list[Attendance]:
         """List attendance records for a session."""
 
-        session = await self.session_repo.get_by_id(session_id)
+        session = await self.session_repo.get_snapshot(session_id)
         if session is None:
             raise LookupError("Session not found")
 
         return await self.repo.list_by_session(session_id)
+
+    async def session_summaries(self, class_id: uuid.UUID) -> list[Row[Any]]:
+        """Return per-session attendance rollups for a class."""
+
+        await self._require_class(class_id)
+        return await self.repo.session_summaries_for_class(class_id)
+
+    async def member_summaries(self, class_id: uuid.UUID) -> list[Row[Any]]:
+        """Return per-member attendance rollups for a class."""
+
+        await self._require_class(class_id)
+        return await self.repo.member_summaries(class_id=class_id)
+
+    async def summaries_for_user(self, user_id: uuid.UUID) -> list[Row[Any]]:
+        """Return one user's attendance rollup in every class they were marked in."""
+
+        return await self.repo.member_summaries(user_id=user_id)
+
+    async def _require_class(self, class_id: uuid.UUID) -> None:
+        if await self.class_repo.get_snapshot(class_id) is None:
+            raise LookupError("Class not found")
@@ -1,17 +1,32 @@
 """Service layer for learning classes."""
 
 import uuid
+from collections.abc import AsyncIterator
+from typing import Any
 
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import (
+    CLASS_LIST_HEAD_TAG,
+    SESSION_LIST_TAG,
+    calendar_cache,
+    catalog_cache,
+    class_tag,
+)
 from app.models.class_ import LearningClass
+from app.repositories.attendance_repo import AttendanceRepository
 from app.repositories.class_repo import ClassRepository
+from app.schemas.class_ import ClassRead
+from app.schemas.common import page_json
+from app.utils.pagination import DEFAULT_PAGE_SIZE
 
 
 class ClassService:
     """Business logic for class management."""
 
     def __init__(self, session: AsyncSession) -> None:
+        self.attendance_repo = AttendanceRepository(session)
         self.repo = ClassRepository(session)
 
     async def create_class(
@@ -23,12 +38,35 @@ class ClassService:
     ) -> LearningClass:
         """Create a class."""
 
-        return await self.repo.create(title, description, is_published, created_by_id)
+        class_ = await self.repo.create(title, description, is_published, created_by_id)
+        catalog_cache.invalidate(CLASS_LIST_HEAD_TAG)
+        return class_
+
+    async def list_classes(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> bytes:
+        """Return one page of classes as serialized JSON, read through the catalog cache.
+
+        A page is tagged with the classes on it, so an update or delete only
+        evicts the pages showing that class; a new class only changes first pages.
+        """
+
+        async def render() -> tuple[bytes, list[str]]:
+            page = await self.repo.list_classes(limit=limit, cursor=cursor)
+            body = page_json(ClassRead, page.items, page.next_cursor)
+            tags = [class_tag(class_.id) for class_ in page.items]
+            if cursor is None:
+                tags.append(CLASS_LIST_HEAD_TAG)
+            return body, tags
+
+        return await catalog_cache.get_or_render(f"classes:{limit}:{cursor}", render)
 
-    async def list_classes(self) -> list[LearningClass]:
-        """List classes."""
+    def stream_classes(self) -> AsyncIterator[Row[Any]]:
+        """Stream every class for bulk export."""
 
-        return await self.repo.list_classes()
+        return self.repo.stream_classes()
 
     async def get_class(self, class_id: uuid.UUID) -> LearningClass:
         """Get class by id or raise error."""
@@ -42,10 +80,16 @@ class ClassService:
         """Update an existing class."""
 
         class_ = await self.get_class(class_id)
-        return await self.repo.update(class_, updates)
+        updated = await self.repo.update(class_, updates)
+        calendar_cache.invalidate(class_tag(class_id))
+        catalog_cache.invalidate(class_tag(class_id))
+        return updated
 
     async def delete_class(self, class_id: uuid.UUID) -> None:
         """Delete an existing class."""
 
         class_ = await self.get_class(class_id)
+        await self.attendance_repo.forget_class(class_id)
         await self.repo.delete(class_)
+        calendar_cache.invalidate(class_tag(class_id))
+        catalog_cache.invalidate(class_tag(class_id), SESSION_LIST_TAG)
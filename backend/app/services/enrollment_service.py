@@ -1,12 +1,20 @@
 """Service layer for class enrollment flows."""
 
 import uuid
+from collections.abc import AsyncIterator
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import calendar_cache, catalog_cache, class_tag, user_tag
 from app.models.enrollment import Enrollment
 from app.repositories.class_repo import ClassRepository
 from app.repositories.enrollment_repo import EnrollmentRepository
+from app.repositories.user_repo import UserRepository
+from app.schemas.enrollment import EnrollmentImportOutcome
+
+IMPORT_BATCH_SIZE = 500
+
+ImportOutcome = tuple[int, str | None, EnrollmentImportOutcome, uuid.UUID | None]
 
 
 class EnrollmentService:
@@ -14,12 +22,13 @@ class EnrollmentService:
 
     def __init__(self, session: AsyncSession) -> None:
         self.class_repo = ClassRepository(session)
+        self.user_repo = UserRepository(session)
         self.repo = EnrollmentRepository(session)
 
     async def enroll(self, user_id: uuid.UUID, class_id: uuid.UUID) -> Enrollment:
         """Enroll a user in a class unless already enrolled."""
 
-        class_ = await self.class_repo.get_by_id(class_id)
+        class_ = await self.class_repo.get_snapshot(class_id)
         if class_ is None:
             raise LookupError("Class not found")
 
@@ -27,7 +36,74 @@ class EnrollmentService:
         if existing is not None:
             raise ValueError("User is already enrolled in this class")
 
-        return await self.repo.create(user_id=user_id, class_id=class_id)
+        enrollment = await self.repo.create(user_id=user_id, class_id=class_id)
+        calendar_cache.invalidate(user_tag(user_id))
+        catalog_cache.invalidate(class_tag(class_id))
+        return enrollment
+
+    async def import_roster(
+        self,
+        class_id: uuid.UUID,
+        rows: AsyncIterator[tuple[int, str | None]],
+        batch_size: int = IMPORT_BATCH_SIZE,
+    ) -> AsyncIterator[ImportOutcome]:
+        """Validate the class and return an iterator of per-row import outcomes.
+
+        Rows are consumed lazily in batches: each batch resolves its emails in
+        one query and inserts its enrollments in one conflict-skipping
+        statement, so memory use does not depend on the roster size.
+        """
+
+        class_ = await self.class_repo.get_snapshot(class_id)
+        if class_ is None:
+            raise LookupError("Class not found")
+
+        return self._import_batches(class_id, rows, batch_size)
+
+    async def _import_batches(
+        self,
+        class_id: uuid.UUID,
+        rows: AsyncIterator[tuple[int, str | None]],
+        batch_size: int,
+    ) -> AsyncIterator[ImportOutcome]:
+        batch: list[tuple[int, str | None]] = []
+        async for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                for outcome in await self._import_batch(class_id, batch):
+                    yield outcome
+                batch = []
+
+        if batch:
+            for outcome in await self._import_batch(class_id, batch):
+                yield outcome
+
+    async def _import_batch(
+        self,
+        class_id: uuid.UUID,
+        batch: list[tuple[int, str | None]],
+    ) -> list[ImportOutcome]:
+        user_ids = await self.user_repo.get_ids_by_emails({email for _, email in batch if email})
+        inserted = await self.repo.create_many_skip_existing(class_id, set(user_ids.values()))
+        if inserted:
+            calendar_cache.invalidate(*(user_tag(user_id) for user_id in inserted))
+            catalog_cache.invalidate(class_tag(class_id))
+
+        outcomes: list[ImportOutcome] = []
+        for line, email in batch:
+            if email is None:
+                outcomes.append((line, email, "invalid", None))
+                continue
+
+            user_id = user_ids.get(email)
+            if user_id is None:
+                outcomes.append((line, email, "unknown_email", None))
+            elif user_id in inserted:
+                inserted.discard(user_id)
+                outcomes.append((line, email, "enrolled", user_id))
+            else:
+                outcomes.append((line, email, "already_enrolled", user_id))
+        return outcomes
 
     async def unenroll(self, user_id: uuid.UUID, class_id: uuid.UUID) -> None:
         """Remove an enrollment if it exists."""
@@ -37,6 +113,16 @@ class EnrollmentService:
             raise LookupError("Enrollment not found")
 
         await self.repo.delete(existing)
+        calendar_cache.invalidate(user_tag(user_id))
+        catalog_cache.invalidate(class_tag(class_id))
+
+    async def repair_counts(self) -> int:
+        """Recompute drifted class enrollment counters and return how many were fixed."""
+
+        repaired = await self.repo.repair_counts()
+        if repaired:
+            catalog_cache.invalidate(*(class_tag(class_id) for class_id in repaired))
+        return len(repaired)
 
     async def list_for_class(self, class_id: uuid.UUID) -> list[Enrollment]:
         """List enrollments for one class."""
@@ -1,11 +1,35 @@
 """Service layer for quarterly planning flows."""
 
 import uuid
+from collections.abc import AsyncIterator, Collection
+from typing import Any
 
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.exc import StaleDataError
 
+from app.core.cache import plan_export_cache, plan_tag
 from app.models.plan import QuarterlyPlan
 from app.repositories.plan_repo import PlanRepository
+from app.utils.json_patch import JsonPatchError, apply_patch
+from app.utils.pagination import DEFAULT_PAGE_SIZE, KeysetPage
+from app.utils.plan_export import (
+    PlanExportFormat,
+    csv_header,
+    plan_payload,
+    render_plan,
+)
+
+_OBJECTIVES = TypeAdapter(list[dict[str, str]])
+
+
+class PlanVersionMismatchError(Exception):
+    """Raised when a client edits a plan version that is no longer current."""
+
+
+class PlanWriteConflictError(Exception):
+    """Raised when another writer updated the plan while this write was in flight."""
 
 
 class PlanService:
@@ -24,10 +48,19 @@ class PlanService:
 
         return await self.repo.create(quarter=quarter, objectives=objectives, created_by_id=created_by_id)
 
-    async def list_plans(self) -> list[QuarterlyPlan]:
-        """List all plans."""
+    async def list_plans(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> KeysetPage[Row[Any]]:
+        """List one page of plans."""
+
+        return await self.repo.list_plans(limit=limit, cursor=cursor)
 
-        return await self.repo.list_plans()
+    def stream_plans(self) -> AsyncIterator[Row[Any]]:
+        """Stream every plan for bulk export."""
+
+        return self.repo.stream_plans()
 
     async def get_plan(self, plan_id: uuid.UUID) -> QuarterlyPlan:
         """Get one plan by id."""
@@ -41,23 +74,70 @@ class PlanService:
         """Update one plan by id."""
 
         plan = await self.get_plan(plan_id)
-        return await self.repo.update(plan, updates)
+        return await self._save(plan, updates)
+
+    async def patch_objectives(
+        self,
+        plan_id: uuid.UUID,
+        operations: list[dict[str, Any]],
+        expected_version: int,
+    ) -> QuarterlyPlan:
+        """Apply an RFC 6902 patch to a plan's objectives if it is still at ``expected_version``.
+
+        The patch is applied atomically to a copy; the result must still be a
+        list of string-valued objectives. The write itself is version-checked,
+        so a concurrent update between read and commit is rejected too.
+        """
+
+        plan = await self.get_plan(plan_id)
+        if plan.version != expected_version:
+            raise PlanVersionMismatchError(f"Plan is at version {plan.version}, not {expected_version}")
+
+        patched = apply_patch(plan.objectives, operations)
+        try:
+            objectives = _OBJECTIVES.validate_python(patched)
+        except ValidationError as exc:
+            raise JsonPatchError("Patched objectives must be a list of objects with string values") from exc
+        return await self._save(plan, {"objectives": objectives})
+
+    async def _save(self, plan: QuarterlyPlan, updates: dict[str, object]) -> QuarterlyPlan:
+        try:
+            updated = await self.repo.update(plan, updates)
+        except StaleDataError as exc:
+            raise PlanWriteConflictError("Plan was modified by another request; retry") from exc
+        plan_export_cache.invalidate(plan_tag(plan.id))
+        return updated
 
     async def delete_plan(self, plan_id: uuid.UUID) -> None:
         """Delete one plan by id."""
 
         plan = await self.get_plan(plan_id)
         await self.repo.delete(plan)
+        plan_export_cache.invalidate(plan_tag(plan_id))
 
     async def export_plan(self, plan_id: uuid.UUID) -> dict[str, object]:
         """Export one plan as JSON-serializable payload."""
 
-        plan = await self.get_plan(plan_id)
-        return {
-            "id": str(plan.id),
-            "quarter": plan.quarter,
-            "objectives": plan.objectives,
-            "created_by_id": str(plan.created_by_id),
-            "created_at": plan.created_at.isoformat(),
-            "updated_at": plan.updated_at.isoformat(),
-        }
+        return plan_payload(await self.get_plan(plan_id))
+
+    async def export_plans(
+        self,
+        export_format: PlanExportFormat,
+        quarters: Collection[str] | None = None,
+    ) -> AsyncIterator[str]:
+        """Yield plans rendered as CSV records or JSON lines, reading through a server-side cursor.
+
+        Each rendering is memoized by ``(plan id, updated_at, format)``, so an
+        unchanged plan is rendered once no matter how often it is exported.
+        """
+
+        if export_format == "csv":
+            yield csv_header()
+
+        async for plan in self.repo.stream_for_export(quarters):
+            key = f"{plan.id}:{plan.updated_at.isoformat()}:{export_format}"
+            line = plan_export_cache.get(key)
+            if line is None:
+                line = render_plan(plan, export_format)
+                plan_export_cache.set(key, line, [plan_tag(plan.id)])
+            yield line
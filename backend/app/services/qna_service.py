@@ -1,11 +1,17 @@
 """Service layer for community Q&A flows."""
 
 import uuid
+from collections.abc import AsyncIterator
+from typing import Any
 
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.events import event_hub, question_topic
 from app.models.qna import QnAQuestion, QnAReply
 from app.repositories.qna_repo import QnARepository
+from app.schemas.qna import QuestionSort, ReplyRead
+from app.utils.pagination import DEFAULT_PAGE_SIZE, KeysetPage
 
 
 class QnAService:
@@ -23,18 +29,46 @@ class QnAService:
     ) -> QnAQuestion:
         """Create a technical question."""
 
-        sanitized_tags = [tag.strip().lower() for tag in tags if tag.strip()]
+        sanitized_tags = list(dict.fromkeys(tag.strip().lower() for tag in tags if tag.strip()))
         return await self.repo.create_question(author_id, title, body, sanitized_tags)
 
     async def list_questions(
         self,
         search: str | None = None,
         tag: str | None = None,
-    ) -> list[QnAQuestion]:
-        """List questions with optional filters."""
+        unanswered: bool = False,
+        sort: QuestionSort = "newest",
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> KeysetPage[Row[Any]]:
+        """List one page of questions with optional filters."""
 
         normalized_tag = tag.strip().lower() if tag else None
-        return await self.repo.list_questions(search=search, tag=normalized_tag)
+        return await self.repo.list_questions(
+            search=search,
+            tag=normalized_tag,
+            unanswered=unanswered,
+            sort=sort,
+            limit=limit,
+            cursor=cursor,
+        )
+
+    def stream_questions(
+        self,
+        search: str | None = None,
+        tag: str | None = None,
+        unanswered: bool = False,
+        sort: QuestionSort = "newest",
+    ) -> AsyncIterator[Row[Any]]:
+        """Stream questions for bulk export with optional filters."""
+
+        normalized_tag = tag.strip().lower() if tag else None
+        return self.repo.stream_questions(
+            search=search,
+            tag=normalized_tag,
+            unanswered=unanswered,
+            sort=sort,
+        )
 
     async def reply_to_question(
         self,
@@ -42,22 +76,54 @@ class QnAService:
         author_id: uuid.UUID,
         body: str,
     ) -> QnAReply:
-        """Post a reply to an existing question."""
+        """Post a reply to an existing question and push it to the thread's subscribers."""
+
+        question = await self.repo.get_question_by_id(question_id)
+        if question is None or question.is_deleted:
+            raise LookupError("Question not found")
+
+        reply = await self.repo.create_reply(question_id=question_id, author_id=author_id, body=body)
+        event_hub.publish(
+            question_topic(question_id),
+            "reply",
+            ReplyRead.model_validate(reply).model_dump_json(),
+        )
+        return reply
+
+    async def require_live_questions(self, question_ids: list[uuid.UUID]) -> None:
+        """Raise ``LookupError`` unless every id names a question that is not deleted."""
+
+        missing = set(question_ids) - await self.repo.live_question_ids(question_ids)
+        if missing:
+            raise LookupError("Question not found")
+
+    async def list_replies(
+        self,
+        question_id: uuid.UUID,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> KeysetPage[Row[Any]]:
+        """List one page of replies for one question."""
 
         question = await self.repo.get_question_by_id(question_id)
         if question is None or question.is_deleted:
             raise LookupError("Question not found")
 
-        return await self.repo.create_reply(question_id=question_id, author_id=author_id, body=body)
+        return await self.repo.list_replies(question_id=question_id, limit=limit, cursor=cursor)
 
-    async def list_replies(self, question_id: uuid.UUID) -> list[QnAReply]:
-        """List replies for one question."""
+    async def stream_replies(self, question_id: uuid.UUID) -> AsyncIterator[Row[Any]]:
+        """Validate the question and return a stream of its replies for bulk export."""
 
         question = await self.repo.get_question_by_id(question_id)
         if question is None or question.is_deleted:
             raise LookupError("Question not found")
 
-        return await self.repo.list_replies(question_id=question_id)
+        return self.repo.stream_replies(question_id=question_id)
+
+    async def tag_counts(self, limit: int = DEFAULT_PAGE_SIZE) -> list[Row[str, int]]:
+        """Return the most used tags with their live question counts."""
+
+        return await self.repo.tag_counts(limit)
 
     async def delete_question(self, question_id: uuid.UUID) -> QnAQuestion:
         """Soft-delete a question."""
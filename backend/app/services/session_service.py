@@ -1,20 +1,39 @@
 """Service layer for class sessions."""
 
 import uuid
+from collections.abc import AsyncIterator
 from datetime import datetime
+from typing import Any
 
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import (
+    SESSION_LIST_TAG,
+    calendar_cache,
+    catalog_cache,
+    class_tag,
+    user_tag,
+)
 from app.models.session import ClassSession
+from app.repositories.attendance_repo import AttendanceRepository
 from app.repositories.class_repo import ClassRepository
+from app.repositories.enrollment_repo import EnrollmentRepository
 from app.repositories.session_repo import SessionRepository
+from app.schemas.common import page_json
+from app.schemas.session import SessionRead
+from app.utils.ics import render_calendar
+from app.utils.pagination import DEFAULT_PAGE_SIZE, KeysetPage
+from app.utils.time import to_naive_utc, utc_now
 
 
 class SessionService:
     """Business logic for session scheduling and management."""
 
     def __init__(self, session: AsyncSession) -> None:
+        self.attendance_repo = AttendanceRepository(session)
         self.class_repo = ClassRepository(session)
+        self.enrollment_repo = EnrollmentRepository(session)
         self.session_repo = SessionRepository(session)
 
     async def create_session(
@@ -31,11 +50,11 @@ class SessionService:
         if ends_at <= starts_at:
             raise ValueError("Session end time must be after start time")
 
-        class_ = await self.class_repo.get_by_id(class_id)
+        class_ = await self.class_repo.get_snapshot(class_id)
         if class_ is None:
             raise LookupError("Class not found")
 
-        return await self.session_repo.create(
+        session = await self.session_repo.create(
             class_id=class_id,
             title=title,
             description=description,
@@ -43,11 +62,96 @@ class SessionService:
             ends_at=ends_at,
             created_by_id=created_by_id,
         )
+        _invalidate_class_sessions(class_id)
+        return session
+
+    async def list_sessions(
+        self,
+        class_id: uuid.UUID | None = None,
+        starts_from: datetime | None = None,
+        starts_before: datetime | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> bytes:
+        """Return one page of sessions as serialized JSON, read through the catalog cache.
+
+        Pages of one class are dropped when that class's sessions change;
+        pages across all classes are dropped on any session change.
+        """
+
+        starts_from, starts_before = _window(starts_from, starts_before)
+
+        async def render() -> tuple[bytes, list[str]]:
+            page = await self.session_repo.list_sessions(
+                class_id=class_id,
+                starts_from=starts_from,
+                starts_before=starts_before,
+                limit=limit,
+                cursor=cursor,
+            )
+            body = page_json(SessionRead, page.items, page.next_cursor)
+            tag = class_tag(class_id) if class_id is not None else SESSION_LIST_TAG
+            return body, [tag]
+
+        key = f"sessions:{class_id}:{starts_from}:{starts_before}:{limit}:{cursor}"
+        return await catalog_cache.get_or_render(key, render)
+
+    def stream_sessions(
+        self,
+        class_id: uuid.UUID | None = None,
+        starts_from: datetime | None = None,
+        starts_before: datetime | None = None,
+    ) -> AsyncIterator[Row[Any]]:
+        """Stream sessions for bulk export, optionally by class and start window."""
+
+        starts_from, starts_before = _window(starts_from, starts_before)
+        return self.session_repo.stream_sessions(
+            class_id=class_id,
+            starts_from=starts_from,
+            starts_before=starts_before,
+        )
+
+    async def list_upcoming(
+        self,
+        user_id: uuid.UUID,
+        starts_before: datetime | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> KeysetPage[Row[Any]]:
+        """List one page of not-yet-started sessions in the user's enrolled classes."""
+
+        now = utc_now()
+        _, starts_before = _window(now, starts_before)
+        return await self.session_repo.list_upcoming_for_user(
+            user_id=user_id,
+            starts_from=to_naive_utc(now),
+            starts_before=starts_before,
+            limit=limit,
+            cursor=cursor,
+        )
+
+    async def class_calendar(self, class_id: uuid.UUID) -> str:
+        """Return the ICS feed for one class, rendered once per change to its sessions."""
 
-    async def list_sessions(self, class_id: uuid.UUID | None = None) -> list[ClassSession]:
-        """List sessions, optionally by class."""
+        async def render() -> tuple[str, list[str]]:
+            class_ = await self.class_repo.get_snapshot(class_id)
+            if class_ is None:
+                raise LookupError("Class not found")
+            sessions = await self.session_repo.list_for_classes([class_id])
+            return render_calendar(class_.title, sessions), [class_tag(class_id)]
 
-        return await self.session_repo.list_sessions(class_id=class_id)
+        return await calendar_cache.get_or_render(f"ics:class:{class_id}", render)
+
+    async def user_calendar(self, user_id: uuid.UUID) -> str:
+        """Return the ICS feed of sessions across a user's enrolled classes."""
+
+        async def render() -> tuple[str, list[str]]:
+            class_ids = await self.enrollment_repo.class_ids_for_user(user_id)
+            sessions = await self.session_repo.list_for_classes(class_ids)
+            tags = [user_tag(user_id), *(class_tag(class_id) for class_id in class_ids)]
+            return render_calendar("My sessions", sessions), tags
+
+        return await calendar_cache.get_or_render(f"ics:user:{user_id}", render)
 
     async def get_session(self, session_id: uuid.UUID) -> ClassSession:
         """Return one session by id."""
@@ -71,10 +175,37 @@ class SessionService:
         if isinstance(starts_at, datetime) and isinstance(ends_at, datetime) and ends_at <= starts_at:
             raise ValueError("Session end time must be after start time")
 
-        return await self.session_repo.update(session, updates)
+        updated = await self.session_repo.update(session, updates)
+        _invalidate_class_sessions(updated.class_id)
+        return updated
 
     async def delete_session(self, session_id: uuid.UUID) -> None:
         """Delete one session."""
 
         session = await self.get_session(session_id)
+        class_id = session.class_id
+        await self.attendance_repo.forget_session(session_id, class_id)
         await self.session_repo.delete(session)
+        _invalidate_class_sessions(class_id)
+
+
+def _invalidate_class_sessions(class_id: uuid.UUID) -> None:
+    """Drop cached calendars and session lists that include a class's sessions."""
+
+    calendar_cache.invalidate(class_tag(class_id))
+    catalog_cache.invalidate(class_tag(class_id), SESSION_LIST_TAG)
+
+
+def _window(
+    starts_from: datetime | None,
+    starts_before: datetime | None,
+) -> tuple[datetime | None, datetime | None]:
+    """Validate a start-time window and convert it to the naive UTC stored in ``sessions``."""
+
+    if starts_from is not None and starts_before is not None and starts_before <= starts_from:
+        raise ValueError("Window end must be after window start")
+
+    return (
+        to_naive_utc(starts_from) if starts_from is not None else None,
+        to_naive_utc(starts_before) if starts_before is not None else None,
+    )
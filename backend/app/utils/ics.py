@@ -0,0 +1,75 @@
+"""Minimal iCalendar (RFC 5545) rendering for session feeds."""
+
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from typing import Any
+
+PRODID = "-//Community Learning Platform//Sessions//EN"
+ICS_MEDIA_TYPE = "text/calendar"
+_MAX_LINE_OCTETS = 75
+
+
+def _escape(text: str) -> str:
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _timestamp(value: datetime) -> str:
+    """Format as UTC; naive values are stored as UTC already."""
+
+    if value.tzinfo is not None:
+        value = value.astimezone(UTC)
+    return value.strftime("%Y%m%dT%H%M%SZ")
+
+
+def _fold(line: str) -> str:
+    """Fold a content line at 75 octets without splitting UTF-8 sequences."""
+
+    encoded = line.encode("utf-8")
+    if len(encoded) <= _MAX_LINE_OCTETS:
+        return line
+
+    parts: list[str] = []
+    current = ""
+    limit = _MAX_LINE_OCTETS
+    for char in line:
+        if len((current + char).encode("utf-8")) > limit:
+            parts.append(current)
+            current = ""
+            limit = _MAX_LINE_OCTETS - 1
+        current += char
+    parts.append(current)
+    return "\r\n ".join(parts)
+
+
+def render_calendar(name: str, sessions: Iterable[Any]) -> str:
+    """Render sessions (rows or models with session columns) as a VCALENDAR document."""
+
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODID}",
+        "CALSCALE:GREGORIAN",
+        f"X-WR-CALNAME:{_escape(name)}",
+    ]
+    for session in sessions:
+        lines.extend(
+            [
+                "BEGIN:VEVENT",
+                f"UID:{session.id}@community-learning",
+                f"DTSTAMP:{_timestamp(session.updated_at)}",
+                f"DTSTART:{_timestamp(session.starts_at)}",
+                f"DTEND:{_timestamp(session.ends_at)}",
+                f"SUMMARY:{_escape(session.title)}",
+            ]
+        )
+        if session.description:
+            lines.append(f"DESCRIPTION:{_escape(session.description)}")
+        lines.append("END:VEVENT")
+    lines.append("END:VCALENDAR")
+    return "".join(f"{_fold(line)}\r\n" for line in lines)
@@ -0,0 +1,117 @@
+"""RFC 6902 JSON Patch application over plain JSON values."""
+
+import copy
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+
+class JsonPatchError(ValueError):
+    """Raised when a patch operation cannot be applied to the document."""
+
+
+def _parse_pointer(pointer: str) -> list[str]:
+    """Split an RFC 6901 JSON Pointer into unescaped reference tokens."""
+
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise JsonPatchError(f"Invalid JSON pointer: {pointer!r}")
+    return [token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")]
+
+
+def _list_index(container: list[Any], token: str, *, allow_end: bool) -> int:
+    if allow_end and token == "-":
+        return len(container)
+    if not (token.isascii() and token.isdigit()) or (token != "0" and token.startswith("0")):
+        raise JsonPatchError(f"Invalid array index: {token!r}")
+    index = int(token)
+    limit = len(container) if allow_end else len(container) - 1
+    if index > limit:
+        raise JsonPatchError(f"Array index out of range: {index}")
+    return index
+
+
+def _resolve(document: Any, tokens: list[str]) -> Any:
+    current = document
+    for token in tokens:
+        if isinstance(current, list):
+            current = current[_list_index(current, token, allow_end=False)]
+        elif isinstance(current, dict):
+            if token not in current:
+                raise JsonPatchError(f"Path not found: /{'/'.join(tokens)}")
+            current = current[token]
+        else:
+            raise JsonPatchError(f"Path not found: /{'/'.join(tokens)}")
+    return current
+
+
+def _add(document: Any, tokens: list[str], value: Any) -> Any:
+    if not tokens:
+        return value
+    parent = _resolve(document, tokens[:-1])
+    token = tokens[-1]
+    if isinstance(parent, list):
+        parent.insert(_list_index(parent, token, allow_end=True), value)
+    elif isinstance(parent, dict):
+        parent[token] = value
+    else:
+        raise JsonPatchError(f"Cannot add to a scalar at /{'/'.join(tokens[:-1])}")
+    return document
+
+
+def _remove(document: Any, tokens: list[str]) -> tuple[Any, Any]:
+    """Remove the target and return ``(document, removed value)``."""
+
+    if not tokens:
+        raise JsonPatchError("Cannot remove the document root")
+    parent = _resolve(document, tokens[:-1])
+    token = tokens[-1]
+    if isinstance(parent, list):
+        return document, parent.pop(_list_index(parent, token, allow_end=False))
+    if isinstance(parent, dict) and token in parent:
+        return document, parent.pop(token)
+    raise JsonPatchError(f"Path not found: /{'/'.join(tokens)}")
+
+
+def apply_patch(document: Any, operations: Iterable[Mapping[str, Any]]) -> Any:
+    """Apply patch operations to a deep copy of ``document`` and return the result.
+
+    Operations are applied in order and atomically: the input is never
+    modified, and any failing operation (including a failed ``test``) raises
+    ``JsonPatchError`` without a partial result.
+    """
+
+    result = copy.deepcopy(document)
+    for operation in operations:
+        op = operation.get("op")
+        tokens = _parse_pointer(operation.get("path", ""))
+
+        if op in {"add", "replace", "test"} and "value" not in operation:
+            raise JsonPatchError(f"Operation {op!r} requires a value")
+        if op in {"move", "copy"} and "from" not in operation:
+            raise JsonPatchError(f"Operation {op!r} requires a from pointer")
+
+        if op == "add":
+            result = _add(result, tokens, copy.deepcopy(operation["value"]))
+        elif op == "remove":
+            result, _ = _remove(result, tokens)
+        elif op == "replace":
+            _resolve(result, tokens)
+            if tokens:
+                result, _ = _remove(result, tokens)
+            result = _add(result, tokens, copy.deepcopy(operation["value"]))
+        elif op == "move":
+            source = _parse_pointer(operation["from"])
+            if tokens[: len(source)] == source and tokens != source:
+                raise JsonPatchError("Cannot move a value into one of its own children")
+            result, value = _remove(result, source)
+            result = _add(result, tokens, value)
+        elif op == "copy":
+            value = copy.deepcopy(_resolve(result, _parse_pointer(operation["from"])))
+            result = _add(result, tokens, value)
+        elif op == "test":
+            if _resolve(result, tokens) != operation["value"]:
+                raise JsonPatchError(f"Test failed at {operation['path']}")
+        else:
+            raise JsonPatchError(f"Unknown operation: {op!r}")
+    return result
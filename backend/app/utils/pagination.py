@@ -1,9 +1,24 @@
 """Pagination helper utilities."""
 
-from typing import TypeVar
+import base64
+import binascii
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Generic, TypeVar
+
+from sqlalchemy import ColumnElement, Select, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
 
 T = TypeVar("T")
 
+# Keyset columns: mapped attributes such as ``User.created_at`` or plain column expressions.
+KeyColumn = ColumnElement[Any] | InstrumentedAttribute[Any]
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
 
 def paginate(items: list[T], page: int = 1, page_size: int = 20) -> list[T]:
     """Return a page slice from a list of items."""
@@ -13,3 +28,90 @@ def paginate(items: list[T], page: int = 1, page_size: int = 20) -> list[T]:
     start = (normalized_page - 1) * normalized_page_size
     end = start + normalized_page_size
     return items[start:end]
+
+
+@dataclass(frozen=True, slots=True)
+class KeysetPage(Generic[T]):
+    """One page of keyset-paginated rows plus the cursor for the next page."""
+
+    items: list[T]
+    next_cursor: str | None
+
+
+def encode_cursor(sort_value: datetime, row_id: uuid.UUID, sort_key: str) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor.
+
+    ``sort_key`` names the column the page is ordered by, so a cursor cannot
+    seek through a listing sorted by a different column.
+    """
+
+    payload = json.dumps([sort_key, sort_value.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_key: str) -> tuple[datetime, uuid.UUID]:
+    """Decode an opaque cursor, raising ``ValueError`` when it is malformed or sorted by another key."""
+
+    padding = "=" * (-len(cursor) % 4)
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + padding))
+        if not isinstance(payload, list) or len(payload) != 3 or not all(isinstance(part, str) for part in payload):
+            raise ValueError("Cursor payload must be three strings")
+        key_raw, sort_raw, id_raw = payload
+        sort_value, row_id = datetime.fromisoformat(sort_raw), uuid.UUID(id_raw)
+    except (binascii.Error, TypeError, ValueError) as exc:
+        raise ValueError("Invalid pagination cursor") from exc
+    if key_raw != sort_key:
+        raise ValueError("Pagination cursor belongs to a different sort order")
+    return sort_value, row_id
+
+
+def keyset_paginate(
+    statement: Select[Any],
+    sort_column: KeyColumn,
+    id_column: KeyColumn,
+    limit: int,
+    cursor: str | None = None,
+    descending: bool = False,
+) -> Select[Any]:
+    """Order a statement by ``(sort_column, id_column)`` and seek past the cursor.
+
+    One extra row is fetched so callers can tell whether another page exists
+    without issuing a COUNT query.
+    """
+
+    if cursor is not None:
+        assert sort_column.key is not None, "keyset sort columns must be named"
+        sort_value, row_id = decode_cursor(cursor, sort_column.key)
+        key = tuple_(sort_column, id_column)
+        boundary = tuple_(sort_value, row_id)
+        statement = statement.where(key < boundary if descending else key > boundary)
+
+    return keyset_order(statement, sort_column, id_column, descending).limit(limit + 1)
+
+
+def keyset_order(
+    statement: Select[Any],
+    sort_column: KeyColumn,
+    id_column: KeyColumn,
+    descending: bool = False,
+) -> Select[Any]:
+    """Apply the ``(sort_column, id_column)`` ordering used by keyset pages."""
+
+    if descending:
+        return statement.order_by(sort_column.desc(), id_column.desc())
+    return statement.order_by(sort_column.asc(), id_column.asc())
+
+
+def keyset_page(rows: list[Any], limit: int, sort_attribute: str) -> KeysetPage[Any]:
+    """Trim the look-ahead row and build the cursor pointing past the last item."""
+
+    if len(rows) <= limit:
+        return KeysetPage(items=rows, next_cursor=None)
+
+    items = rows[:limit]
+    last = items[-1]
+    return KeysetPage(
+        items=items,
+        next_cursor=encode_cursor(getattr(last, sort_attribute), last.id, sort_attribute),
+    )
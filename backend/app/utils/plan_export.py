@@ -0,0 +1,53 @@
+"""Rendering of quarterly plans for bulk CSV and JSON Lines exports."""
+
+import csv
+import io
+import json
+from typing import Any, Literal
+
+PlanExportFormat = Literal["csv", "jsonl"]
+
+EXPORT_MEDIA_TYPES: dict[PlanExportFormat, str] = {
+    "csv": "text/csv",
+    "jsonl": "application/x-ndjson",
+}
+CSV_COLUMNS = ("id", "quarter", "objectives", "created_by_id", "created_at", "updated_at")
+
+
+def plan_payload(plan: Any) -> dict[str, object]:
+    """Return the JSON-serializable export payload of a plan row or model."""
+
+    return {
+        "id": str(plan.id),
+        "quarter": plan.quarter,
+        "objectives": plan.objectives,
+        "created_by_id": str(plan.created_by_id),
+        "created_at": plan.created_at.isoformat(),
+        "updated_at": plan.updated_at.isoformat(),
+    }
+
+
+def _csv_line(values: list[object]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(values)
+    return buffer.getvalue()
+
+
+def csv_header() -> str:
+    """Return the CSV header line."""
+
+    return _csv_line(list(CSV_COLUMNS))
+
+
+def render_plan(plan: Any, export_format: PlanExportFormat) -> str:
+    """Render one plan as a complete CSV record or JSON line, newline included.
+
+    In CSV the objectives list is embedded as a JSON document in one column.
+    """
+
+    payload = plan_payload(plan)
+    if export_format == "jsonl":
+        return json.dumps(payload, separators=(",", ":")) + "\n"
+
+    payload["objectives"] = json.dumps(payload["objectives"], separators=(",", ":"))
+    return _csv_line([payload[column] for column in CSV_COLUMNS])
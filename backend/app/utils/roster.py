@@ -0,0 +1,75 @@
+"""Incremental parsing of uploaded roster files."""
+
+import codecs
+import csv
+import json
+from collections.abc import AsyncIterator
+from typing import Literal
+
+from fastapi import UploadFile
+
+RosterFormat = Literal["csv", "jsonl"]
+
+_CHUNK_SIZE = 64 * 1024
+
+
+async def _iter_lines(upload: UploadFile) -> AsyncIterator[str]:
+    """Yield decoded text lines while reading the upload in fixed-size chunks."""
+
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    pending = ""
+    while chunk := await upload.read(_CHUNK_SIZE):
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+def _normalize_email(value: object) -> str | None:
+    if not isinstance(value, str):
+        return None
+    email = value.strip()
+    return email if "@" in email else None
+
+
+async def iter_roster_emails(
+    upload: UploadFile,
+    roster_format: RosterFormat,
+) -> AsyncIterator[tuple[int, str | None]]:
+    """Yield ``(line_number, email)`` pairs from a CSV or JSONL roster upload.
+
+    CSV rosters read the ``email`` column named in the header row, or the first
+    column when there is no header. JSONL rosters hold one ``{"email": ...}``
+    object per line. Blank lines are skipped and unparseable rows yield
+    ``None`` as the email.
+    """
+
+    email_index: int | None = None
+    line_number = 0
+    async for line in _iter_lines(upload):
+        line_number += 1
+        if not line.strip():
+            continue
+
+        if roster_format == "jsonl":
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                yield line_number, None
+                continue
+            yield line_number, _normalize_email(record.get("email") if isinstance(record, dict) else None)
+            continue
+
+        fields = next(csv.reader([line]), [])
+        if email_index is None:
+            header = [field.strip().lower() for field in fields]
+            if "email" in header:
+                email_index = header.index("email")
+                continue
+            email_index = 0
+
+        yield line_number, _normalize_email(fields[email_index] if email_index < len(fields) else None)
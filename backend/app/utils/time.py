@@ -1,9 +1,17 @@
 """Time utility helpers."""
 
-from datetime import datetime, timezone
+from datetime import UTC, datetime
 
 
 def utc_now() -> datetime:
     """Return timezone-aware UTC timestamp."""
 
-    return datetime.now(timezone.utc)
+    return datetime.now(UTC)
+
+
+def to_naive_utc(value: datetime) -> datetime:
+    """Convert to naive UTC for comparison with ``timezone=False`` columns."""
+
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(UTC).replace(tzinfo=None)
@@ -0,0 +1,462 @@
+"""In-process load test of the API with per-route latency percentiles and query counts.
+
+Usage::
+
+    python -m benchmarks.load
+    python -m benchmarks.load --scenario member_browsing --concurrency 50 --duration 60
+    python -m benchmarks.load --transport uvicorn --database-url postgresql+asyncpg://...
+
+The application is imported in this process and driven either through
+``httpx.ASGITransport`` (no sockets, measures the app itself) or a local
+uvicorn server on a free port (adds HTTP parsing and the event loop's
+socket handling). Without ``--database-url`` a temporary SQLite file is
+used. The target schema is created with ``create_all``, seeded through the
+service layer and dropped afterwards, so never point this at a database
+holding real data.
+
+Every scenario runs ``--concurrency`` virtual users, each looping over its
+steps until ``--duration`` elapses. The report groups requests by route
+template and shows p50/p95/p99 latency, throughput, error count and the
+mean number of SQL statements per request.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import contextvars
+import json
+import logging
+import os
+import random
+import tempfile
+import time
+import uuid
+from collections import defaultdict
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+import httpx
+from sqlalchemy import event
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+QUERY_COUNT_HEADER = "x-load-queries"
+
+_request_queries: contextvars.ContextVar[list[int] | None] = contextvars.ContextVar("request_queries", default=None)
+
+
+class QueryCountingApp:
+    """ASGI wrapper reporting the SQL statements each request executed in a response header.
+
+    The count lives in a context variable set before the app runs, so the
+    engine listener attributes statements to the request whose task (or a
+    task spawned from it) executed them.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        counter = [0]
+        token = _request_queries.set(counter)
+
+        async def send_with_count(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((QUERY_COUNT_HEADER.encode(), str(counter[0]).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_count)
+        finally:
+            _request_queries.reset(token)
+
+
+def _count_query(*_: Any) -> None:
+    counter = _request_queries.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+@dataclass(slots=True)
+class World:
+    """Identifiers of the seeded dataset that scenarios pick from."""
+
+    lead_id: uuid.UUID
+    member_ids: list[uuid.UUID]
+    class_ids: list[uuid.UUID]
+    sessions_by_class: dict[uuid.UUID, list[uuid.UUID]]
+    members_by_class: dict[uuid.UUID, list[uuid.UUID]]
+    classes_by_member: dict[uuid.UUID, list[uuid.UUID]]
+    question_ids: list[uuid.UUID]
+
+
+@dataclass(slots=True)
+class VirtualUser:
+    """One simulated client: its identity, random stream and the world it acts on."""
+
+    user_id: uuid.UUID
+    token: str
+    world: World
+    rng: random.Random
+
+    def any_class(self) -> uuid.UUID:
+        return self.rng.choice(self.world.classes_by_member.get(self.user_id) or self.world.class_ids)
+
+
+@dataclass(frozen=True, slots=True)
+class Step:
+    """One request of a scenario; callables derive its parameters from the virtual user."""
+
+    method: str
+    template: str
+    path: Callable[[VirtualUser], dict[str, object]] = lambda user: {}
+    params: Callable[[VirtualUser], dict[str, object]] = lambda user: {}
+    body: Callable[[VirtualUser], object] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class Scenario:
+    """A named request loop run by users of one role."""
+
+    name: str
+    role: str
+    steps: tuple[Step, ...]
+
+
+def _roll_call(user: VirtualUser) -> dict[str, object]:
+    class_id = user.rng.choice(user.world.class_ids)
+    session_id = user.rng.choice(user.world.sessions_by_class[class_id])
+    statuses = {
+        str(member_id): user.rng.choice(("present", "present", "present", "absent", "excused"))
+        for member_id in user.world.members_by_class[class_id]
+    }
+    return {"session_id": str(session_id), "statuses": statuses}
+
+
+def _question_id(user: VirtualUser) -> dict[str, object]:
+    return {"question_id": user.rng.choice(user.world.question_ids)}
+
+
+def _any_session(user: VirtualUser) -> dict[str, object]:
+    return {"session_id": user.rng.choice(user.world.sessions_by_class[user.any_class()])}
+
+
+SCENARIOS: dict[str, Scenario] = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario(
+            name="member_browsing",
+            role="member",
+            steps=(
+                Step("GET", "/classes"),
+                Step("GET", "/sessions", params=lambda user: {"class_id": user.any_class()}),
+                Step("GET", "/sessions/upcoming"),
+                Step("GET", "/announcements"),
+                Step("GET", "/qna/questions"),
+                Step("GET", "/enrollment"),
+                Step("GET", "/attendance/me"),
+            ),
+        ),
+        Scenario(
+            name="lead_attendance",
+            role="lead",
+            steps=(
+                Step("GET", "/sessions", params=lambda user: {"class_id": user.rng.choice(user.world.class_ids)}),
+                Step("POST", "/attendance/roll-call", body=_roll_call),
+                Step("GET", "/attendance/{session_id}", path=_any_session),
+                Step(
+                    "GET",
+                    "/attendance/classes/{class_id}/members",
+                    path=lambda user: {"class_id": user.rng.choice(user.world.class_ids)},
+                ),
+            ),
+        ),
+        Scenario(
+            name="qna_burst",
+            role="member",
+            steps=(
+                Step(
+                    "POST",
+                    "/qna/questions",
+                    body=lambda user: {
+                        "title": f"How do I tune {user.rng.choice(('postgres', 'docker', 'fastapi'))}?",
+                        "body": "Load test question body with enough text to be indexed for search.",
+                        "tags": [user.rng.choice(("python", "sql", "ops"))],
+                    },
+                ),
+                Step("GET", "/qna/questions", params=lambda user: {"search": "postgres"}),
+                Step(
+                    "POST",
+                    "/qna/questions/{question_id}/replies",
+                    path=_question_id,
+                    body=lambda user: {"body": "Try an index on the filtered columns."},
+                ),
+                Step("GET", "/qna/questions/{question_id}/replies", path=_question_id),
+                Step("GET", "/qna/tags"),
+            ),
+        ),
+    )
+}
+
+
+async def seed(members: int, classes: int, sessions_per_class: int, questions: int, seed_value: int) -> World:
+    """Create users, classes, sessions, enrollments and questions through the services."""
+
+    from app.core.security import hash_password
+    from app.db.session import get_session_maker
+    from app.models.user import UserRole
+    from app.repositories.user_repo import UserRepository
+    from app.services.class_service import ClassService
+    from app.services.enrollment_service import EnrollmentService
+    from app.services.qna_service import QnAService
+    from app.services.session_service import SessionService
+    from app.utils.time import utc_now
+
+    rng = random.Random(seed_value)
+    # One PBKDF2 hash for everyone; tokens are minted directly, so nobody logs in.
+    password_hash = hash_password("load-test-password")
+    async with get_session_maker()() as db:
+        users = UserRepository(db)
+        lead = await users.create("lead@load.test", password_hash, "Load Lead", UserRole.LEAD)
+        member_ids = [
+            (await users.create(f"member{number}@load.test", password_hash, None, UserRole.MEMBER)).id
+            for number in range(members)
+        ]
+
+        class_ids = [
+            (await ClassService(db).create_class(f"Class {number}", None, True, lead.id)).id for number in range(classes)
+        ]
+        now = utc_now()
+        sessions_by_class: dict[uuid.UUID, list[uuid.UUID]] = {}
+        for class_id in class_ids:
+            sessions_by_class[class_id] = []
+            for number in range(sessions_per_class):
+                starts_at = now + timedelta(days=number * 7 - sessions_per_class * 3, hours=rng.randrange(9, 18))
+                created = await SessionService(db).create_session(
+                    class_id, f"Session {number}", None, starts_at, starts_at + timedelta(hours=1), lead.id
+                )
+                sessions_by_class[class_id].append(created.id)
+
+        members_by_class: dict[uuid.UUID, list[uuid.UUID]] = defaultdict(list)
+        classes_by_member: dict[uuid.UUID, list[uuid.UUID]] = {}
+        for member_id in member_ids:
+            chosen = rng.sample(class_ids, k=min(3, len(class_ids)))
+            classes_by_member[member_id] = chosen
+            for class_id in chosen:
+                await EnrollmentService(db).enroll(member_id, class_id)
+                members_by_class[class_id].append(member_id)
+
+        question_ids = [
+            (
+                await QnAService(db).create_question(
+                    rng.choice(member_ids),
+                    f"Question {number} about {rng.choice(('postgres', 'docker', 'fastapi', 'pytest'))}",
+                    "Seeded question body for the load test.",
+                    [rng.choice(("python", "sql", "ops"))],
+                )
+            ).id
+            for number in range(questions)
+        ]
+
+    return World(
+        lead_id=lead.id,
+        member_ids=member_ids,
+        class_ids=class_ids,
+        sessions_by_class=sessions_by_class,
+        members_by_class=dict(members_by_class),
+        classes_by_member=classes_by_member,
+        question_ids=question_ids,
+    )
+
+
+@dataclass(slots=True)
+class RouteStats:
+    """Latencies, errors and query counts collected for one route template."""
+
+    latencies_ms: list[float] = field(default_factory=list)
+    errors: int = 0
+    queries: int = 0
+
+
+def percentile(sorted_values: list[float], percent: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+
+    rank = max(1, -(-len(sorted_values) * percent // 100))
+    return sorted_values[int(rank) - 1]
+
+
+async def _virtual_user(
+    client: httpx.AsyncClient,
+    prefix: str,
+    scenario: Scenario,
+    user: VirtualUser,
+    deadline: float,
+    stats: dict[str, RouteStats],
+) -> None:
+    headers = {"Authorization": f"Bearer {user.token}"}
+    while time.perf_counter() < deadline:
+        for step in scenario.steps:
+            if time.perf_counter() >= deadline:
+                return
+            url = prefix + step.template.format(**step.path(user))
+            started = time.perf_counter()
+            response = await client.request(
+                step.method,
+                url,
+                params={key: str(value) for key, value in step.params(user).items()},
+                json=step.body(user) if step.body is not None else None,
+                headers=headers,
+            )
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            route = stats[f"{step.method} {prefix}{step.template}"]
+            route.latencies_ms.append(elapsed_ms)
+            route.queries += int(response.headers.get(QUERY_COUNT_HEADER, 0))
+            if response.status_code >= 400:
+                route.errors += 1
+
+
+@contextlib.asynccontextmanager
+async def _client(app: ASGIApp, transport: str) -> AsyncIterator[httpx.AsyncClient]:
+    """Yield a client bound to ``app``, running its lifespan (and server) around it."""
+
+    if transport == "asgi":
+        from app.main import app as fastapi_app
+
+        async with fastapi_app.router.lifespan_context(fastapi_app):
+            asgi = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+            async with httpx.AsyncClient(transport=asgi, base_url="http://load.test") as client:
+                yield client
+        return
+
+    import uvicorn
+
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning"))
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        if serving.done():
+            serving.result()
+        await asyncio.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits) as client:
+            yield client
+    finally:
+        server.should_exit = True
+        await serving
+
+
+def report(stats: dict[str, RouteStats], elapsed_seconds: float) -> list[dict[str, Any]]:
+    """Summarize each route template; rows are sorted by route."""
+
+    rows = []
+    for route, route_stats in sorted(stats.items()):
+        latencies = sorted(route_stats.latencies_ms)
+        count = len(latencies)
+        rows.append(
+            {
+                "route": route,
+                "requests": count,
+                "errors": route_stats.errors,
+                "throughput_rps": round(count / elapsed_seconds, 2),
+                "p50_ms": round(percentile(latencies, 50), 2),
+                "p95_ms": round(percentile(latencies, 95), 2),
+                "p99_ms": round(percentile(latencies, 99), 2),
+                "queries_per_request": round(route_stats.queries / count, 2),
+            }
+        )
+    return rows
+
+
+def _print_report(rows: list[dict[str, Any]], elapsed_seconds: float) -> None:
+    print(
+        f"{'route':<52} {'reqs':>6} {'err':>5} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'q/req':>6}"
+    )
+    for row in rows:
+        print(
+            f"{row['route']:<52} {row['requests']:>6} {row['errors']:>5} {row['throughput_rps']:>8.1f} "
+            f"{row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f} {row['queries_per_request']:>6.1f}"
+        )
+    total = sum(row["requests"] for row in rows)
+    print(f"{total} requests in {elapsed_seconds:.1f}s ({total / elapsed_seconds:.1f} req/s overall)")
+
+
+async def run_load_test(args: argparse.Namespace) -> list[dict[str, Any]]:
+    """Seed the database, run the selected scenarios concurrently and return the report rows."""
+
+    from app.core.config import get_settings
+    from app.core.security import create_access_token
+    from app.db.init_db import create_all_tables, drop_all_tables
+    from app.db.session import dispose_engine, get_engine
+    from app.main import app
+
+    engine = get_engine()
+    await drop_all_tables(engine)
+    await create_all_tables(engine)
+    event.listen(engine.sync_engine, "before_cursor_execute", _count_query)
+    try:
+        started = time.perf_counter()
+        world = await seed(args.members, args.classes, args.sessions_per_class, args.questions, args.seed)
+        print(f"Seeded in {time.perf_counter() - started:.1f}s ({engine.dialect.name})")
+
+        stats: dict[str, RouteStats] = defaultdict(RouteStats)
+        prefix = get_settings().api_v1_prefix
+        async with _client(QueryCountingApp(app), args.transport) as client:
+            deadline = time.perf_counter() + args.duration
+            started = time.perf_counter()
+            users = []
+            for scenario_name in args.scenario or list(SCENARIOS):
+                scenario = SCENARIOS[scenario_name]
+                for number in range(args.concurrency):
+                    rng = random.Random(f"{args.seed}:{scenario_name}:{number}")
+                    user_id = world.lead_id if scenario.role == "lead" else rng.choice(world.member_ids)
+                    user = VirtualUser(user_id, create_access_token(str(user_id), scenario.role), world, rng)
+                    users.append(_virtual_user(client, prefix, scenario, user, deadline, stats))
+            await asyncio.gather(*users)
+            elapsed = time.perf_counter() - started
+
+        rows = report(stats, elapsed)
+        _print_report(rows, elapsed)
+        return rows
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _count_query)
+        await drop_all_tables(get_engine())
+        await dispose_engine()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--transport", choices=("asgi", "uvicorn"), default="asgi")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), default=None)
+    parser.add_argument("--concurrency", type=int, default=10, help="virtual users per scenario")
+    parser.add_argument("--duration", type=float, default=15.0, help="seconds of load")
+    parser.add_argument("--members", type=int, default=200)
+    parser.add_argument("--classes", type=int, default=10)
+    parser.add_argument("--sessions-per-class", type=int, default=6)
+    parser.add_argument("--questions", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, default=None, help="also write the report rows as JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Settings are read when the app is first imported, so configure it first.
+        os.environ["DATABASE_URL"] = args.database_url or f"sqlite+aiosqlite:///{Path(directory) / 'load.db'}"
+        os.environ.setdefault("DEBUG", "false")
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+        rows = asyncio.run(run_load_test(args))
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(rows, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
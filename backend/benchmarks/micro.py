@@ -0,0 +1,341 @@
+"""Microbenchmarks for core hot paths with JSON baselines and regression reports.
+
+Usage::
+
+    python -m benchmarks.micro run --output results.json
+    python -m benchmarks.micro run --compare --threshold 15
+    python -m benchmarks.micro run --output benchmarks/baselines/micro.json  # refresh the baseline
+    python -m benchmarks.micro compare old.json new.json --threshold 10
+
+Each case is timed with ``timeit``: the iteration count is auto-ranged to at
+least 0.2 s, then repeated and summarized as the median and minimum time per
+call. A comparison flags every case whose median grew by more than the
+threshold percentage and exits with status 1 if any did, so it can gate CI.
+Baselines are machine specific; compare results from the same host.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import timeit
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from pydantic import BaseModel
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message
+
+from app.core.middleware import RequestContextMiddleware
+from app.core.rate_limit import InMemoryRateLimiter
+from app.core.security import (
+    create_access_token,
+    decode_token,
+    hash_password,
+    verify_password,
+)
+from app.schemas.announcement import AnnouncementRead
+from app.schemas.attendance import (
+    AttendanceRead,
+    MemberAttendanceSummary,
+    SessionAttendanceSummary,
+)
+from app.schemas.cache import CacheStatsRead
+from app.schemas.class_ import ClassRead
+from app.schemas.enrollment import EnrollmentRead
+from app.schemas.plan import PlanRead
+from app.schemas.qna import QuestionRead, ReplyRead, TagCount
+from app.schemas.session import SessionRead
+from app.schemas.user import UserRead
+from app.utils.time import utc_now
+from benchmarks.samples import sample_rows
+
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "micro.json"
+DEFAULT_THRESHOLD_PERCENT = 10.0
+
+READ_SCHEMAS: tuple[type[BaseModel], ...] = (
+    AnnouncementRead,
+    AttendanceRead,
+    CacheStatsRead,
+    ClassRead,
+    EnrollmentRead,
+    MemberAttendanceSummary,
+    PlanRead,
+    QuestionRead,
+    ReplyRead,
+    SessionAttendanceSummary,
+    SessionRead,
+    TagCount,
+    UserRead,
+)
+
+# Case name -> factory doing the setup and returning the callable to time.
+CASES: dict[str, Callable[[], Callable[[], object]]] = {}
+
+
+def case(name: str) -> Callable[[Callable[[], Callable[[], object]]], Callable[[], Callable[[], object]]]:
+    """Register a benchmark case factory under ``name``."""
+
+    def register(factory: Callable[[], Callable[[], object]]) -> Callable[[], Callable[[], object]]:
+        CASES[name] = factory
+        return factory
+
+    return register
+
+
+def _http_scope(path: str) -> dict[str, Any]:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench"), (b"user-agent", b"benchmarks.micro")],
+        "client": ("203.0.113.7", 50000),
+        "server": ("bench", 80),
+    }
+
+
+def _asgi_get(app: ASGIApp, path: str) -> Callable[[], object]:
+    """Return a callable sending one GET request through ``app`` on a private event loop."""
+
+    loop = asyncio.new_event_loop()
+    scope = _http_scope(path)
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        return None
+
+    return lambda: loop.run_until_complete(app(scope, receive, send))
+
+
+def _ping_app(with_middleware: bool) -> FastAPI:
+    app = FastAPI()
+    if with_middleware:
+        app.add_middleware(RequestContextMiddleware)
+
+    @app.get("/ping")
+    async def ping() -> PlainTextResponse:
+        return PlainTextResponse("pong")
+
+    return app
+
+
+@case("security.hash_password")
+def _hash_password() -> Callable[[], object]:
+    return lambda: hash_password("correct horse battery staple")
+
+
+@case("security.verify_password")
+def _verify_password() -> Callable[[], object]:
+    hashed = hash_password("correct horse battery staple")
+    return lambda: verify_password("correct horse battery staple", hashed)
+
+
+@case("security.create_access_token")
+def _create_access_token() -> Callable[[], object]:
+    return lambda: create_access_token("3f2b9c1e-8d4a-4e5f-9a7b-1c2d3e4f5a6b", "member")
+
+
+@case("security.decode_token")
+def _decode_token() -> Callable[[], object]:
+    token = create_access_token("3f2b9c1e-8d4a-4e5f-9a7b-1c2d3e4f5a6b", "member")
+    return lambda: decode_token(token)
+
+
+@case("rate_limit.check")
+def _rate_limit_check() -> Callable[[], object]:
+    limiter = InMemoryRateLimiter()
+    request = Request(_http_scope("/auth/login"))
+    # A one-second window keeps the per-key deque pruning as it does in production.
+    return lambda: limiter.check(request, limit=10**9, window_seconds=1)
+
+
+@case("middleware.bare_app")
+def _bare_app() -> Callable[[], object]:
+    return _asgi_get(_ping_app(with_middleware=False), "/ping")
+
+
+@case("middleware.request_context")
+def _request_context() -> Callable[[], object]:
+    return _asgi_get(_ping_app(with_middleware=True), "/ping")
+
+
+def _model_validate_case(schema: type[BaseModel]) -> Callable[[], Callable[[], object]]:
+    def factory() -> Callable[[], object]:
+        row = sample_rows(schema, 1)[0]
+        return lambda: schema.model_validate(row, from_attributes=True)
+
+    return factory
+
+
+for _schema in READ_SCHEMAS:
+    case(f"schemas.{_schema.__name__}.model_validate")(_model_validate_case(_schema))
+
+
+def measure(function: Callable[[], object], repeats: int) -> dict[str, float | int]:
+    """Time ``function`` and return per-call median and minimum in microseconds."""
+
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    per_call = [total / number * 1_000_000 for total in timer.repeat(repeat=repeats, number=number)]
+    return {
+        "median_us": round(statistics.median(per_call), 3),
+        "min_us": round(min(per_call), 3),
+        "number": number,
+        "repeats": repeats,
+    }
+
+
+def run_benchmarks(name_filter: str | None = None, repeats: int = 5) -> dict[str, Any]:
+    """Run every registered case (optionally those containing ``name_filter``)."""
+
+    results: dict[str, dict[str, float | int]] = {}
+    for name, factory in CASES.items():
+        if name_filter and name_filter not in name:
+            continue
+        results[name] = measure(factory(), repeats)
+        print(f"  {name:<48} {results[name]['median_us']:>12.2f} us", file=sys.stderr)
+    return {
+        "metadata": {
+            "created_at": utc_now().isoformat(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+        },
+        "results": results,
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class Comparison:
+    """Baseline versus current median of one case; missing sides are ``None``."""
+
+    name: str
+    baseline_us: float | None
+    current_us: float | None
+
+    @property
+    def change_percent(self) -> float | None:
+        """Relative change of the median, positive when slower."""
+
+        if self.baseline_us is None or self.current_us is None or self.baseline_us == 0:
+            return None
+        return (self.current_us - self.baseline_us) / self.baseline_us * 100
+
+
+def compare_results(baseline: dict[str, Any], current: dict[str, Any]) -> list[Comparison]:
+    """Pair the cases of two result documents by name."""
+
+    before = baseline["results"]
+    after = current["results"]
+    return [
+        Comparison(
+            name=name,
+            baseline_us=before[name]["median_us"] if name in before else None,
+            current_us=after[name]["median_us"] if name in after else None,
+        )
+        for name in sorted(before.keys() | after.keys())
+    ]
+
+
+def regressions(comparisons: list[Comparison], threshold_percent: float) -> list[Comparison]:
+    """Return the cases whose median grew by more than ``threshold_percent``."""
+
+    return [
+        comparison
+        for comparison in comparisons
+        if comparison.change_percent is not None and comparison.change_percent > threshold_percent
+    ]
+
+
+def format_report(comparisons: list[Comparison], threshold_percent: float) -> str:
+    """Render a comparison table marking regressions and improvements past the threshold."""
+
+    def us(value: float | None) -> str:
+        return "-" if value is None else f"{value:.2f}"
+
+    lines = [f"{'case':<48} {'baseline us':>12} {'current us':>12} {'change':>9}  status"]
+    for comparison in comparisons:
+        change = comparison.change_percent
+        if change is None:
+            status = "new" if comparison.baseline_us is None else "missing"
+            shown = "-"
+        else:
+            shown = f"{change:+.1f}%"
+            if change > threshold_percent:
+                status = "REGRESSION"
+            elif change < -threshold_percent:
+                status = "improved"
+            else:
+                status = "ok"
+        lines.append(
+            f"{comparison.name:<48} {us(comparison.baseline_us):>12} {us(comparison.current_us):>12} "
+            f"{shown:>9}  {status}"
+        )
+    slower = regressions(comparisons, threshold_percent)
+    lines.append(f"{len(slower)} regression(s) above {threshold_percent:g}%")
+    return "\n".join(lines)
+
+
+def _load(path: Path) -> dict[str, Any]:
+    return json.loads(path.read_text())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the benchmarks")
+    run.add_argument("--filter", default=None, help="only run cases whose name contains this text")
+    run.add_argument("--repeats", type=int, default=5)
+    run.add_argument("--output", type=Path, default=None, help="write results as JSON to this path")
+    run.add_argument(
+        "--compare",
+        type=Path,
+        nargs="?",
+        const=DEFAULT_BASELINE,
+        default=None,
+        help="baseline JSON to compare against (default: the checked-in baseline)",
+    )
+    run.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD_PERCENT)
+
+    compare = commands.add_parser("compare", help="compare two result files")
+    compare.add_argument("baseline", type=Path)
+    compare.add_argument("current", type=Path)
+    compare.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD_PERCENT)
+
+    args = parser.parse_args()
+    if args.command == "run":
+        current = run_benchmarks(args.filter, args.repeats)
+        if args.output is not None:
+            args.output.parent.mkdir(parents=True, exist_ok=True)
+            args.output.write_text(json.dumps(current, indent=2, sort_keys=True) + "\n")
+        if args.compare is None:
+            return
+        baseline = _load(args.compare)
+    else:
+        baseline = _load(args.baseline)
+        current = _load(args.current)
+
+    comparisons = compare_results(baseline, current)
+    print(format_report(comparisons, args.threshold))
+    if regressions(comparisons, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Benchmark Q&A search: full-text index versus the old ILIKE scan.
+
+Usage::
+
+    python -m benchmarks.qna_search --questions 100000
+    python -m benchmarks.qna_search --database-url postgresql+asyncpg://... --questions 200000
+
+Without ``--database-url`` a temporary SQLite file is used. The target schema
+is created with ``create_all`` and dropped afterwards, so never point this at
+a database holding real data.
+"""
+
+import argparse
+import asyncio
+import itertools
+import random
+import statistics
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from app.db.init_db import create_all_tables, drop_all_tables
+from app.models import QnAQuestion, User
+from app.repositories.qna_repo import QnARepository
+from app.utils.time import utc_now
+
+TOPICS = (
+    "python async await postgres index query cursor session class fastapi pydantic "
+    "migration docker deploy container pool latency cache vacuum replica schema "
+    "testing fixture mock coverage logging metrics tracing queue worker retry "
+    "timeout socket thread process memory profile benchmark search ranking token"
+).split()
+FILLER = [f"w{number}" for number in range(20_000)]
+FILLER_CUM_WEIGHTS = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(FILLER))))
+SEARCHES = ("postgres", "docker deploy", "vacuum replica latency", "kubernetes")
+INSERT_BATCH_SIZE = 5_000
+
+
+def _sentence(rng: random.Random, words: int, topics: int) -> str:
+    """Zipf-distributed filler plus a few topic words, so searches stay selective."""
+
+    chosen = rng.choices(FILLER, cum_weights=FILLER_CUM_WEIGHTS, k=words) + rng.sample(TOPICS, topics)
+    rng.shuffle(chosen)
+    return " ".join(chosen)
+
+
+async def _seed(engine: AsyncEngine, questions: int, seed: int) -> None:
+    rng = random.Random(seed)
+    author_id = uuid.uuid4()
+    async with engine.begin() as connection:
+        await connection.execute(
+            insert(User),
+            [{"id": author_id, "email": "bench@example.com", "hashed_password": "x"}],
+        )
+        for start in range(0, questions, INSERT_BATCH_SIZE):
+            rows = [
+                {
+                    "id": uuid.uuid4(),
+                    "author_id": author_id,
+                    "title": _sentence(rng, 6, topics=1),
+                    "body": _sentence(rng, 60, topics=2),
+                    "tags": [],
+                    "created_at": utc_now(),
+                }
+                for _ in range(min(INSERT_BATCH_SIZE, questions - start))
+            ]
+            await connection.execute(insert(QnAQuestion), rows)
+
+
+async def _time(label: str, repeats: int, run) -> None:
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        count = await run()
+        timings.append((time.perf_counter() - started) * 1000)
+    print(
+        f"  {label:<10} median {statistics.median(timings):8.2f} ms  "
+        f"p95 {sorted(timings)[int(0.95 * (len(timings) - 1))]:8.2f} ms  rows {count}"
+    )
+
+
+async def run_benchmark(database_url: str, questions: int, repeats: int, limit: int) -> None:
+    """Seed ``questions`` rows, then time indexed and ILIKE searches for each term."""
+
+    engine = create_async_engine(database_url)
+    await drop_all_tables(engine)
+    await create_all_tables(engine)
+    started = time.perf_counter()
+    await _seed(engine, questions, seed=42)
+    print(f"Seeded {questions} questions in {time.perf_counter() - started:.1f}s ({engine.dialect.name})")
+
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    try:
+        async with session_maker() as session:
+            repo = QnARepository(session)
+            for term in SEARCHES:
+                print(f"search={term!r}")
+
+                async def indexed() -> int:
+                    return len((await repo.list_questions(search=term, limit=limit)).items)
+
+                async def ilike() -> int:
+                    like_value = f"%{term}%"
+                    statement = (
+                        select(QnAQuestion.id)
+                        .where(
+                            QnAQuestion.is_deleted.is_(False),
+                            QnAQuestion.title.ilike(like_value) | QnAQuestion.body.ilike(like_value),
+                        )
+                        .order_by(QnAQuestion.created_at.desc())
+                        .limit(limit)
+                    )
+                    return len((await session.execute(statement)).all())
+
+                await _time("full-text", repeats, indexed)
+                await _time("ilike", repeats, ilike)
+    finally:
+        await drop_all_tables(engine)
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--questions", type=int, default=100_000)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = args.database_url or f"sqlite+aiosqlite:///{Path(directory) / 'bench.db'}"
+        asyncio.run(run_benchmark(database_url, args.questions, args.repeats, args.limit))
+
+
+if __name__ == "__main__":
+    main()
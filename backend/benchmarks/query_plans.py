@@ -0,0 +1,830 @@
+"""Query-plan regression checks for every repository method on a seeded, analyzed dataset.
+
+Usage::
+
+    python -m benchmarks.query_plans check                      # scratch SQLite file, scale 0.05
+    python -m benchmarks.query_plans record                     # refresh the SQLite expectations
+    python -m benchmarks.query_plans record --database-url postgresql+asyncpg://.../scratch
+
+Each case calls one repository method against data from
+``scripts.seed_dataset`` after ``ANALYZE``, records every statement it sends
+and runs ``EXPLAIN`` on it. A plan is reduced to the indexes it uses, the
+tables it reads in full and its sort steps; the full plan text is kept for
+review. ``check`` fails when a case sends more statements than recorded, or
+a statement gains a full table scan or a sort. Other differences, such as
+a switch between indexes, are reported but pass.
+
+Expectations are per dialect in ``benchmarks/baselines``. ``--database-url``
+must name an empty scratch database: cases write to it, and every table is
+dropped afterwards.
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import sys
+import tempfile
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import event, exists, select
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+)
+
+from app.core.cache import caches
+from app.db.init_db import create_all_tables, drop_all_tables
+from app.models import (
+    Announcement,
+    Attendance,
+    ClassSession,
+    Enrollment,
+    LearningClass,
+    QnAQuestion,
+    QuarterlyPlan,
+    User,
+)
+from app.models.attendance import AttendanceStatus
+from app.models.user import UserRole
+from app.repositories.announcement_repo import AnnouncementRepository
+from app.repositories.attendance_repo import AttendanceRepository
+from app.repositories.class_repo import ClassRepository
+from app.repositories.enrollment_repo import EnrollmentRepository
+from app.repositories.plan_repo import PlanRepository
+from app.repositories.qna_repo import QnARepository
+from app.repositories.session_repo import SessionRepository
+from app.repositories.user_repo import UserRepository
+from app.utils.pagination import encode_cursor
+from app.utils.time import utc_now
+from scripts.seed_dataset import DatasetSize, seed_dataset
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+DEFAULT_SCALE = 0.05
+DEFAULT_SEED = 42
+
+_DML = re.compile(r"^\s*(SELECT|INSERT|UPDATE|DELETE|WITH)\b", re.IGNORECASE)
+
+# SQLite ``EXPLAIN QUERY PLAN`` details.
+_SQLITE_ACCESS = re.compile(r"^(SCAN|SEARCH) (\S+)(?: AS \S+)?(?: USING (?:COVERING )?INDEX (\S+))?")
+_SQLITE_AUTOMATIC_INDEX = "USING AUTOMATIC"
+_SQLITE_CONSTANT_ROWS = re.compile(r"^SCAN (?:\d+ )?CONSTANT ROWS?$")
+_SQLITE_SORT = re.compile(r"USE TEMP B-TREE FOR (?:RIGHT PART OF )?(?:ORDER BY|GROUP BY|DISTINCT)")
+_SQLITE_VIRTUAL = re.compile(r"^SCAN (\S+) VIRTUAL TABLE INDEX")
+
+# PostgreSQL ``EXPLAIN`` nodes.
+_POSTGRES_SEQ_SCAN = re.compile(r"Seq Scan on (\S+)")
+_POSTGRES_INDEX_SCAN = re.compile(r"Index (?:Only )?Scan(?: Backward)? using (\S+) on")
+_POSTGRES_BITMAP_SCAN = re.compile(r"Bitmap Index Scan on (\S+)")
+_POSTGRES_SORT = re.compile(r"^(?:->\s+)?(?:Incremental )?Sort\b")
+_POSTGRES_COSTS = re.compile(r"\s+\(cost=[^)]*\)")
+
+
+@dataclass(frozen=True, slots=True)
+class Sample:
+    """Ids of seeded rows the cases query and modify; ``spare_*`` rows are deleted."""
+
+    admin_id: uuid.UUID
+    member_id: uuid.UUID
+    member_email: str
+    outsider_id: uuid.UUID
+    class_id: uuid.UUID
+    spare_class_id: uuid.UUID
+    session_id: uuid.UUID
+    spare_session_id: uuid.UUID
+    question_id: uuid.UUID
+    spare_question_id: uuid.UUID
+    announcement_id: uuid.UUID
+    plan_id: uuid.UUID
+    quarter: str
+
+
+Case = Callable[[AsyncSession, Sample], Awaitable[object]]
+
+# Case name -> repository call; names are ``<Repository>.<method>[<variant>]``.
+# Reads come first so writes and deletes cannot change the rows they see.
+CASES: dict[str, Case] = {}
+
+
+def case(name: str) -> Callable[[Case], Case]:
+    """Register a plan case under ``name``."""
+
+    def register(call: Case) -> Case:
+        CASES[name] = call
+        return call
+
+    return register
+
+
+def _cursor(sort_key: str = "created_at") -> str:
+    return encode_cursor(utc_now() - timedelta(days=30), uuid.uuid4(), sort_key)
+
+
+async def _drain(rows: Any) -> None:
+    async for _ in rows:
+        pass
+
+
+@case("UserRepository.get_by_id")
+async def _user_get_by_id(session: AsyncSession, sample: Sample) -> object:
+    return await UserRepository(session).get_by_id(sample.member_id)
+
+
+@case("UserRepository.get_by_email")
+async def _user_get_by_email(session: AsyncSession, sample: Sample) -> object:
+    return await UserRepository(session).get_by_email(sample.member_email)
+
+
+@case("UserRepository.get_ids_by_emails")
+async def _user_get_ids_by_emails(session: AsyncSession, sample: Sample) -> object:
+    return await UserRepository(session).get_ids_by_emails([sample.member_email, "nobody@example.test"])
+
+
+@case("UserRepository.list_users")
+async def _list_users(session: AsyncSession, sample: Sample) -> object:
+    return await UserRepository(session).list_users()
+
+
+@case("UserRepository.list_users[next-page]")
+async def _list_users_next_page(session: AsyncSession, sample: Sample) -> object:
+    return await UserRepository(session).list_users(cursor=_cursor())
+
+
+@case("UserRepository.stream_users")
+async def _stream_users(session: AsyncSession, sample: Sample) -> object:
+    return await _drain(UserRepository(session).stream_users())
+
+
+@case("ClassRepository.get_by_id")
+async def _class_get_by_id(session: AsyncSession, sample: Sample) -> object:
+    return await ClassRepository(session).get_by_id(sample.class_id)
+
+
+@case("ClassRepository.get_snapshot")
+async def _class_get_snapshot(session: AsyncSession, sample: Sample) -> object:
+    return await ClassRepository(session).get_snapshot(sample.class_id)
+
+
+@case("ClassRepository.list_classes")
+async def _list_classes(session: AsyncSession, sample: Sample) -> object:
+    return await ClassRepository(session).list_classes()
+
+
+@case("ClassRepository.list_classes[next-page]")
+async def _list_classes_next_page(session: AsyncSession, sample: Sample) -> object:
+    return await ClassRepository(session).list_classes(cursor=_cursor())
+
+
+@case("ClassRepository.stream_classes")
+async def _stream_classes(session: AsyncSession, sample: Sample) -> object:
+    return await _drain(ClassRepository(session).stream_classes())
+
+
+@case("SessionRepository.get_by_id")
+async def _session_get_by_id(session: AsyncSession, sample: Sample) -> object:
+    return await SessionRepository(session).get_by_id(sample.session_id)
+
+
+@case("SessionRepository.get_snapshot")
+async def _session_get_snapshot(session: AsyncSession, sample: Sample) -> object:
+    return await SessionRepository(session).get_snapshot(sample.session_id)
+
+
+@case("SessionRepository.list_sessions")
+async def _list_sessions(session: AsyncSession, sample: Sample) -> object:
+    return await SessionRepository(session).list_sessions()
+
+
+@case("SessionRepository.list_sessions[class]")
+async def _list_sessions_for_class(session: AsyncSession, sample: Sample) -> object:
+    return await SessionRepository(session).list_sessions(class_id=sample.class_id, cursor=_cursor("starts_at"))
+
+
+@case("SessionRepository.list_sessions[window]")
+async def _list_sessions_in_window(session: AsyncSession, sample: Sample) -> object:
+    now = utc_now()
+    return await SessionRepository(session).list_sessions(starts_from=now, starts_before=now + timedelta(days=7))
+
+
+@case("SessionRepository.list_upcoming_for_user")
+async def _list_upcoming_for_user(session: AsyncSession, sample: Sample) -> object:
+    return await SessionRepository(session).list_upcoming_for_user(sample.member_id, utc_now() - timedelta(days=30))
+
+
+@case("SessionRepository.list_for_classes")
+async def _list_for_classes(session: AsyncSession, sample: Sample) -> object:
+    return await SessionRepository(session).list_for_classes([sample.class_id, sample.spare_class_id])
+
+
+@case("SessionRepository.stream_sessions")
+async def _stream_sessions(session: AsyncSession, sample: Sample) -> object:
+    return await _drain(SessionRepository(session).stream_sessions(class_id=sample.class_id))
+
+
+@case("EnrollmentRepository.get_existing")
+async def _enrollment_get_existing(session: AsyncSession, sample: Sample) -> object:
+    return await EnrollmentRepository(session).get_existing(sample.member_id, sample.class_id)
+
+
+@case("EnrollmentRepository.enrolled_user_ids")
+async def _enrolled_user_ids(session: AsyncSession, sample: Sample) -> object:
+    return await EnrollmentRepository(session).enrolled_user_ids(
+        sample.class_id, [sample.member_id, sample.outsider_id]
+    )
+
+
+@case("EnrollmentRepository.list_by_class")
+async def _enrollments_by_class(session: AsyncSession, sample: Sample) -> object:
+    return await EnrollmentRepository(session).list_by_class(sample.class_id)
+
+
+@case("EnrollmentRepository.list_by_user")
+async def _enrollments_by_user(session: AsyncSession, sample: Sample) -> object:
+    return await EnrollmentRepository(session).list_by_user(sample.member_id)
+
+
+@case("EnrollmentRepository.class_ids_for_user")
+async def _class_ids_for_user(session: AsyncSession, sample: Sample) -> object:
+    return await EnrollmentRepository(session).class_ids_for_user(sample.member_id)
+
+
+@case("AttendanceRepository.get_existing")
+async def _attendance_get_existing(session: AsyncSession, sample: Sample) -> object:
+    return await AttendanceRepository(session).get_existing(sample.session_id, sample.member_id)
+
+
+@case("AttendanceRepository.list_by_session")
+async def _attendance_by_session(session: AsyncSession, sample: Sample) -> object:
+    return await AttendanceRepository(session).list_by_session(sample.session_id)
+
+
+@case("AttendanceRepository.session_summaries_for_class")
+async def _session_summaries(session: AsyncSession, sample: Sample) -> object:
+    return await AttendanceRepository(session).session_summaries_for_class(sample.class_id)
+
+
+@case("AttendanceRepository.member_summaries[class]")
+async def _member_summaries_for_class(session: AsyncSession, sample: Sample) -> object:
+    return await AttendanceRepository(session).member_summaries(class_id=sample.class_id)
+
+
+@case("AttendanceRepository.member_summaries[user]")
+async def _member_summaries_for_user(session: AsyncSession, sample: Sample) -> object:
+    return await AttendanceRepository(session).member_summaries(user_id=sample.member_id)
+
+
+@case("AttendanceRepository.member_summaries[class-and-user]")
+async def _member_summary(session: AsyncSession, sample: Sample) -> object:
+    return await AttendanceRepository(session).member_summaries(class_id=sample.class_id, user_id=sample.member_id)
+
+
+@case("QnARepository.get_question_by_id")
+async def _question_get_by_id(session: AsyncSession, sample: Sample) -> object:
+    return await QnARepository(session).get_question_by_id(sample.question_id)
+
+
+@case("QnARepository.live_question_ids")
+async def _live_question_ids(session: AsyncSession, sample: Sample) -> object:
+    return await QnARepository(session).live_question_ids([sample.question_id, sample.spare_question_id])
+
+
+@case("QnARepository.list_questions[newest]")
+async def _questions_newest(session: AsyncSession, sample: Sample) -> object:
+    return await QnARepository(session).list_questions()
+
+
+@case("QnARepository.list_questions[newest-next-page]")
+async def _questions_newest_next_page(session: AsyncSession, sample: Sample) -> object:
+    return await QnARepository(session).list_questions(cursor=_cursor())
+
+
+@case("QnARepository.list_questions[activity]")
+async def _questions_activity(session: AsyncSession, sample: Sample) -> object:
+    return await QnARepository(session).list_questions(sort="activity", cursor=_cursor("last_activity_at"))
+
+
+@case("QnARepository.list_questions[unanswered]")
+async def _questions_unanswered(session: AsyncSession, sample: Sample) -> object:
+    return await QnARepository(session).list_questions(unanswered=True)
+
+
+@case("QnARepository.list_questions[tag]")
+async def _questions_tagged(session: AsyncSession, sample: Sample) -> object:
+    return await QnARepository(session).list_questions(tag="python")
+
+
+@case("QnARepository.list_questions[search]")
+async def _questions_search(session: AsyncSession, sample: Sample) -> object:
+    return await QnARepository(session).list_questions(search="cursor timeout")
+
+
+@case("QnARepository.stream_questions")
+async def _stream_questions(session: AsyncSession, sample: Sample) -> object:
+    return await _drain(QnARepository(session).stream_questions(tag="rust"))
+
+
+@case("QnARepository.tag_counts")
+async def _tag_counts(session: AsyncSession, sample: Sample) -> object:
+    return await QnARepository(session).tag_counts(limit=20)
+
+
+@case("QnARepository.list_replies")
+async def _list_replies(session: AsyncSession, sample: Sample) -> object:
+    return await QnARepository(session).list_replies(sample.question_id)
+
+
+@case("QnARepository.list_replies[next-page]")
+async def _list_replies_next_page(session: AsyncSession, sample: Sample) -> object:
+    return await QnARepository(session).list_replies(sample.question_id, cursor=_cursor())
+
+
+@case("QnARepository.stream_replies")
+async def _stream_replies(session: AsyncSession, sample: Sample) -> object:
+    return await _drain(QnARepository(session).stream_replies(sample.question_id))
+
+
+@case("AnnouncementRepository.get_by_id")
+async def _announcement_get_by_id(session: AsyncSession, sample: Sample) -> object:
+    return await AnnouncementRepository(session).get_by_id(sample.announcement_id)
+
+
+@case("AnnouncementRepository.list_announcements")
+async def _list_announcements(session: AsyncSession, sample: Sample) -> object:
+    return await AnnouncementRepository(session).list_announcements(cursor=_cursor())
+
+
+@case("AnnouncementRepository.stream_announcements")
+async def _stream_announcements(session: AsyncSession, sample: Sample) -> object:
+    return await _drain(AnnouncementRepository(session).stream_announcements())
+
+
+@case("PlanRepository.get_by_id")
+async def _plan_get_by_id(session: AsyncSession, sample: Sample) -> object:
+    return await PlanRepository(session).get_by_id(sample.plan_id)
+
+
+@case("PlanRepository.list_plans")
+async def _list_plans(session: AsyncSession, sample: Sample) -> object:
+    return await PlanRepository(session).list_plans()
+
+
+@case("PlanRepository.stream_plans")
+async def _stream_plans(session: AsyncSession, sample: Sample) -> object:
+    return await _drain(PlanRepository(session).stream_plans())
+
+
+@case("PlanRepository.stream_for_export")
+async def _stream_for_export(session: AsyncSession, sample: Sample) -> object:
+    return await _drain(PlanRepository(session).stream_for_export())
+
+
+@case("PlanRepository.stream_for_export[quarters]")
+async def _stream_for_export_quarters(session: AsyncSession, sample: Sample) -> object:
+    return await _drain(PlanRepository(session).stream_for_export([sample.quarter]))
+
+
+@case("UserRepository.create")
+async def _create_user(session: AsyncSession, sample: Sample) -> object:
+    return await UserRepository(session).create("plans@example.test", "not-a-hash", None, UserRole.MEMBER)
+
+
+@case("ClassRepository.create")
+async def _create_class(session: AsyncSession, sample: Sample) -> object:
+    return await ClassRepository(session).create("Query plans", None, True, sample.admin_id)
+
+
+@case("ClassRepository.update")
+async def _update_class(session: AsyncSession, sample: Sample) -> object:
+    repo = ClassRepository(session)
+    class_ = await repo.get_by_id(sample.class_id)
+    assert class_ is not None
+    return await repo.update(class_, {"title": "Query plans, revisited"})
+
+
+@case("SessionRepository.create")
+async def _create_session(session: AsyncSession, sample: Sample) -> object:
+    starts_at = utc_now() + timedelta(days=1)
+    return await SessionRepository(session).create(
+        sample.class_id, "Query plans", None, starts_at, starts_at + timedelta(hours=1), sample.admin_id
+    )
+
+
+@case("SessionRepository.update")
+async def _update_session(session: AsyncSession, sample: Sample) -> object:
+    repo = SessionRepository(session)
+    class_session = await repo.get_by_id(sample.session_id)
+    assert class_session is not None
+    return await repo.update(class_session, {"title": "Query plans, revisited"})
+
+
+@case("EnrollmentRepository.create")
+async def _create_enrollment(session: AsyncSession, sample: Sample) -> object:
+    return await EnrollmentRepository(session).create(sample.outsider_id, sample.class_id)
+
+
+@case("EnrollmentRepository.create_many_skip_existing")
+async def _create_enrollments(session: AsyncSession, sample: Sample) -> object:
+    return await EnrollmentRepository(session).create_many_skip_existing(
+        sample.spare_class_id, [sample.member_id, sample.outsider_id]
+    )
+
+
+@case("EnrollmentRepository.repair_counts")
+async def _repair_counts(session: AsyncSession, sample: Sample) -> object:
+    return await EnrollmentRepository(session).repair_counts()
+
+
+@case("EnrollmentRepository.delete")
+async def _delete_enrollment(session: AsyncSession, sample: Sample) -> object:
+    repo = EnrollmentRepository(session)
+    enrollment = await repo.get_existing(sample.outsider_id, sample.class_id)
+    assert enrollment is not None
+    return await repo.delete(enrollment)
+
+
+@case("AttendanceRepository.upsert")
+async def _upsert_attendance(session: AsyncSession, sample: Sample) -> object:
+    return await AttendanceRepository(session).upsert(
+        sample.session_id, sample.class_id, sample.member_id, sample.admin_id, AttendanceStatus.EXCUSED
+    )
+
+
+@case("AttendanceRepository.bulk_upsert")
+async def _bulk_upsert_attendance(session: AsyncSession, sample: Sample) -> object:
+    statuses = {sample.member_id: AttendanceStatus.PRESENT, sample.outsider_id: AttendanceStatus.ABSENT}
+    return await AttendanceRepository(session).bulk_upsert(
+        sample.session_id, sample.class_id, sample.admin_id, statuses
+    )
+
+
+@case("QnARepository.create_question")
+async def _create_question(session: AsyncSession, sample: Sample) -> object:
+    return await QnARepository(session).create_question(
+        sample.member_id, "Why is this a sequential scan?", "It used to be fast.", ["sql", "postgres"]
+    )
+
+
+@case("QnARepository.create_reply")
+async def _create_reply(session: AsyncSession, sample: Sample) -> object:
+    return await QnARepository(session).create_reply(sample.question_id, sample.admin_id, "Check the plan.")
+
+
+@case("QnARepository.soft_delete_question")
+async def _soft_delete_question(session: AsyncSession, sample: Sample) -> object:
+    repo = QnARepository(session)
+    question = await repo.get_question_by_id(sample.spare_question_id)
+    assert question is not None
+    return await repo.soft_delete_question(question)
+
+
+@case("AnnouncementRepository.create")
+async def _create_announcement(session: AsyncSession, sample: Sample) -> object:
+    return await AnnouncementRepository(session).create("Query plans", "Now checked.", sample.admin_id)
+
+
+@case("AnnouncementRepository.delete")
+async def _delete_announcement(session: AsyncSession, sample: Sample) -> object:
+    repo = AnnouncementRepository(session)
+    announcement = await repo.get_by_id(sample.announcement_id)
+    assert announcement is not None
+    return await repo.delete(announcement)
+
+
+@case("PlanRepository.create")
+async def _create_plan(session: AsyncSession, sample: Sample) -> object:
+    return await PlanRepository(session).create("2099-Q1", [{"title": "Keep plans fast"}], sample.admin_id)
+
+
+@case("PlanRepository.update")
+async def _update_plan(session: AsyncSession, sample: Sample) -> object:
+    repo = PlanRepository(session)
+    plan = await repo.get_by_id(sample.plan_id)
+    assert plan is not None
+    return await repo.update(plan, {"objectives": [{"title": "Keep plans fast"}]})
+
+
+@case("PlanRepository.delete")
+async def _delete_plan(session: AsyncSession, sample: Sample) -> object:
+    repo = PlanRepository(session)
+    plan = await repo.get_by_id(sample.plan_id)
+    assert plan is not None
+    return await repo.delete(plan)
+
+
+@case("AttendanceRepository.forget_session")
+async def _forget_session(session: AsyncSession, sample: Sample) -> object:
+    await AttendanceRepository(session).forget_session(sample.spare_session_id, sample.class_id)
+    return await session.commit()
+
+
+@case("SessionRepository.delete")
+async def _delete_session(session: AsyncSession, sample: Sample) -> object:
+    repo = SessionRepository(session)
+    class_session = await repo.get_by_id(sample.spare_session_id)
+    assert class_session is not None
+    return await repo.delete(class_session)
+
+
+@case("AttendanceRepository.forget_class")
+async def _forget_class(session: AsyncSession, sample: Sample) -> object:
+    await AttendanceRepository(session).forget_class(sample.spare_class_id)
+    return await session.commit()
+
+
+@case("ClassRepository.delete")
+async def _delete_class(session: AsyncSession, sample: Sample) -> object:
+    repo = ClassRepository(session)
+    class_ = await repo.get_by_id(sample.spare_class_id)
+    assert class_ is not None
+    return await repo.delete(class_)
+
+
+@dataclass(frozen=True, slots=True)
+class StatementPlan:
+    """What one statement's plan touches, plus the plan text for review."""
+
+    statement: str
+    indexes: tuple[str, ...]
+    full_scans: tuple[str, ...]
+    sorts: int
+    plan: tuple[str, ...]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "statement": self.statement,
+            "indexes": list(self.indexes),
+            "full_scans": list(self.full_scans),
+            "sorts": self.sorts,
+            "plan": list(self.plan),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "StatementPlan":
+        return cls(
+            statement=data["statement"],
+            indexes=tuple(data["indexes"]),
+            full_scans=tuple(data["full_scans"]),
+            sorts=data["sorts"],
+            plan=tuple(data["plan"]),
+        )
+
+
+def summarize(dialect: str, statement: str, lines: list[str]) -> StatementPlan:
+    """Reduce ``EXPLAIN`` output of either dialect to indexes, full scans and sorts."""
+
+    indexes: set[str] = set()
+    full_scans: set[str] = set()
+    sorts = 0
+    plan: list[str] = []
+    for line in lines:
+        if dialect == "postgresql":
+            line = _POSTGRES_COSTS.sub("", line)
+            node = line.strip()
+            if match := _POSTGRES_SEQ_SCAN.search(node):
+                full_scans.add(match.group(1))
+            for pattern in (_POSTGRES_INDEX_SCAN, _POSTGRES_BITMAP_SCAN):
+                if match := pattern.search(node):
+                    indexes.add(match.group(1))
+            if _POSTGRES_SORT.match(node):
+                sorts += 1
+        elif _SQLITE_CONSTANT_ROWS.match(line):
+            pass
+        elif match := _SQLITE_VIRTUAL.match(line):
+            indexes.add(match.group(1))
+        elif match := _SQLITE_ACCESS.match(line):
+            table, index = match.group(2), match.group(3)
+            if table.startswith("("):
+                pass
+            elif _SQLITE_AUTOMATIC_INDEX in line or (match.group(1) == "SCAN" and index is None):
+                full_scans.add(table)
+            elif index is not None:
+                indexes.add(index)
+        elif _SQLITE_SORT.search(line):
+            sorts += 1
+        plan.append(line)
+    return StatementPlan(
+        statement=" ".join(statement.split())[:160],
+        indexes=tuple(sorted(indexes)),
+        full_scans=tuple(sorted(full_scans)),
+        sorts=sorts,
+        plan=tuple(plan),
+    )
+
+
+async def capture(engine: AsyncEngine, call: Case, sample: Sample) -> list[tuple[str, Any]]:
+    """Run one case and return every DML statement and parameter set it sent to the driver."""
+
+    captured: list[tuple[str, Any]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        if _DML.match(statement):
+            captured.append((statement, parameters[0] if executemany else parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            await call(session, sample)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", record)
+    return captured
+
+
+async def explain(connection: AsyncConnection, statement: str, parameters: Any) -> list[str]:
+    """Return the plan of a driver-level statement as text lines."""
+
+    if connection.dialect.name == "postgresql":
+        result = await connection.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+    else:
+        result = await connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+    return [str(row[-1]) for row in result]
+
+
+async def _sample(connection: AsyncConnection) -> Sample:
+    """Pick deterministic seeded rows for the cases to use."""
+
+    async def first(statement: Any) -> Any:
+        return (await connection.execute(statement.limit(1))).first()
+
+    admin_id = (await first(select(User.id).where(User.role == UserRole.ADMIN).order_by(User.id))).id
+    member_id, class_id = await first(select(Enrollment.user_id, Enrollment.class_id).order_by(Enrollment.id))
+    enrolled = exists().where(Enrollment.class_id == class_id, Enrollment.user_id == User.id)
+    session_id = (
+        await first(
+            select(Attendance.session_id)
+            .join(ClassSession, ClassSession.id == Attendance.session_id)
+            .where(ClassSession.class_id == class_id)
+            .order_by(Attendance.id)
+        )
+    ).session_id
+    questions = select(QnAQuestion.id).where(QnAQuestion.is_deleted.is_(False)).order_by(QnAQuestion.id)
+    question_id = (await first(questions.where(QnAQuestion.reply_count > 0))).id
+    plan = await first(select(QuarterlyPlan.id, QuarterlyPlan.quarter).order_by(QuarterlyPlan.id))
+    return Sample(
+        admin_id=admin_id,
+        member_id=member_id,
+        member_email=(await first(select(User.email).where(User.id == member_id))).email,
+        outsider_id=(await first(select(User.id).where(~enrolled).order_by(User.id))).id,
+        class_id=class_id,
+        spare_class_id=(
+            await first(select(LearningClass.id).where(LearningClass.id != class_id).order_by(LearningClass.id))
+        ).id,
+        session_id=session_id,
+        spare_session_id=(
+            await first(
+                select(ClassSession.id)
+                .where(ClassSession.class_id == class_id, ClassSession.id != session_id)
+                .order_by(ClassSession.id)
+            )
+        ).id,
+        question_id=question_id,
+        spare_question_id=(await first(questions.where(QnAQuestion.id != question_id))).id,
+        announcement_id=(await first(select(Announcement.id).order_by(Announcement.id))).id,
+        plan_id=plan.id,
+        quarter=plan.quarter,
+    )
+
+
+async def collect_plans(engine: AsyncEngine, scale: float = DEFAULT_SCALE, seed: int = DEFAULT_SEED) -> dict[str, Any]:
+    """Seed an empty database, run every case and return their plans; drops all tables afterwards."""
+
+    await create_all_tables(engine)
+    try:
+        await seed_dataset(engine, DatasetSize().scaled(scale), seed)
+        async with engine.begin() as connection:
+            await connection.exec_driver_sql("ANALYZE")
+            sample = await _sample(connection)
+
+        plans: dict[str, list[dict[str, Any]]] = {}
+        for name, call in CASES.items():
+            for cache in caches.values():
+                cache.clear()
+            statements = await capture(engine, call, sample)
+            async with engine.connect() as connection:
+                plans[name] = [
+                    summarize(
+                        engine.dialect.name, statement, await explain(connection, statement, parameters)
+                    ).to_dict()
+                    for statement, parameters in statements
+                ]
+    finally:
+        for cache in caches.values():
+            cache.clear()
+        await drop_all_tables(engine)
+
+    return {
+        "metadata": {
+            "created_at": utc_now().isoformat(),
+            "dialect": engine.dialect.name,
+            "scale": scale,
+            "seed": seed,
+        },
+        "plans": plans,
+    }
+
+
+def expectation_path(dialect: str) -> Path:
+    """Checked-in expectations for one dialect."""
+
+    return BASELINE_DIR / f"query_plans.{dialect}.json"
+
+
+def degradations(expected: list[dict[str, Any]] | None, actual: list[dict[str, Any]]) -> list[str]:
+    """Describe how one case's plans got worse than expected; empty when none did."""
+
+    if expected is None:
+        return ["no recorded expectation; record one with `python -m benchmarks.query_plans record`"]
+
+    problems = []
+    if len(actual) > len(expected):
+        problems.append(f"sends {len(actual)} statements, expected {len(expected)}")
+    for number, (before, after) in enumerate(zip(expected, actual, strict=False), start=1):
+        was, now = StatementPlan.from_dict(before), StatementPlan.from_dict(after)
+        if new_scans := sorted(set(now.full_scans) - set(was.full_scans)):
+            problems.append(f"statement {number} now scans {', '.join(new_scans)} in full: {now.statement}")
+        if now.sorts > was.sorts:
+            problems.append(f"statement {number} sorts {now.sorts} time(s), expected {was.sorts}: {now.statement}")
+    return problems
+
+
+def differences(expected: list[dict[str, Any]], actual: list[dict[str, Any]]) -> list[str]:
+    """Describe every index, scan or statement count change of one case, good or bad."""
+
+    changes = []
+    if len(actual) != len(expected):
+        changes.append(f"{len(expected)} -> {len(actual)} statements")
+    for number, (before, after) in enumerate(zip(expected, actual, strict=False), start=1):
+        for key in ("indexes", "full_scans", "sorts"):
+            if before[key] != after[key]:
+                changes.append(f"statement {number} {key}: {before[key]} -> {after[key]}")
+    return changes
+
+
+def _load(path: Path) -> dict[str, Any]:
+    return json.loads(path.read_text())
+
+
+async def _collect(database_url: str | None, scale: float, seed: int) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_async_engine(database_url or f"sqlite+aiosqlite:///{directory}/query_plans.db")
+        try:
+            return await collect_plans(engine, scale, seed)
+        finally:
+            await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("command", choices=("check", "record"))
+    parser.add_argument(
+        "--database-url", default=None, help="empty scratch database (default: a temporary SQLite file)"
+    )
+    parser.add_argument(
+        "--scale", type=float, default=None, help=f"dataset scale (default: recorded, or {DEFAULT_SCALE})"
+    )
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--output", type=Path, default=None, help="expectation file (default: per dialect)")
+    args = parser.parse_args()
+
+    dialect = "postgresql" if args.database_url and args.database_url.startswith("postgresql") else "sqlite"
+    path = args.output or expectation_path(dialect)
+    expected = _load(path) if args.command == "check" else None
+    scale = args.scale or (expected["metadata"]["scale"] if expected else DEFAULT_SCALE)
+    current = asyncio.run(_collect(args.database_url, scale, args.seed))
+
+    if expected is None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(current, indent=2, sort_keys=True) + "\n")
+        print(f"Recorded {len(current['plans'])} cases to {path}")
+        return
+
+    failed = False
+    for name in sorted(CASES.keys() | expected["plans"].keys()):
+        if name not in CASES:
+            print(f"{name}: STALE (no such case; record again)")
+            failed = True
+            continue
+        actual = current["plans"][name]
+        problems = degradations(expected["plans"].get(name), actual)
+        if problems:
+            failed = True
+            print(f"{name}: DEGRADED")
+            for problem in problems:
+                print(f"  {problem}")
+        elif changes := differences(expected["plans"][name], actual):
+            print(f"{name}: changed")
+            for change in changes:
+                print(f"  {change}")
+    print(f"{len(CASES)} cases checked against {path}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Synthetic rows shaped like repository results, shared by the benchmarks."""
+
+import enum
+import types
+import typing
+import uuid
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel
+
+from app.utils.time import utc_now
+
+
+def _sample(annotation: Any, now: datetime) -> Any:
+    """Return a representative value for a schema field annotation."""
+
+    args = typing.get_args(annotation)
+    origin = typing.get_origin(annotation)
+    if origin in (typing.Union, types.UnionType):
+        return _sample(next(arg for arg in args if arg is not type(None)), now)
+    if origin is list:
+        return [_sample(args[0], now) for _ in range(3)]
+    if origin is dict:
+        return {"title": "Ship the release", "status": "in_progress"}
+    if isinstance(annotation, type) and issubclass(annotation, enum.Enum):
+        return next(iter(annotation))
+    samples = {
+        uuid.UUID: uuid.uuid4(),
+        datetime: now,
+        str: "Lorem ipsum dolor sit amet, consectetur adipiscing elit",
+        int: 7,
+        float: 0.5,
+        bool: True,
+    }
+    return samples[annotation]
+
+
+def sample_rows(schema: type[BaseModel], count: int) -> list[types.SimpleNamespace]:
+    """Attribute-access rows shaped like the ORM objects the repositories return."""
+
+    now = utc_now()
+    return [
+        types.SimpleNamespace(**{name: _sample(field.annotation, now) for name, field in schema.model_fields.items()})
+        for _ in range(count)
+    ]
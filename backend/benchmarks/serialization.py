@@ -0,0 +1,117 @@
+"""Benchmark list response serialization: per-item ``model_validate`` versus ``page_json``.
+
+Usage::
+
+    python -m benchmarks.serialization
+    python -m benchmarks.serialization --rows 1000 10000 --endpoint /qna/questions
+
+For every list endpoint a throwaway FastAPI app serves the same in-memory
+rows twice: the old way (``Schema.model_validate`` per row, then FastAPI
+validates and serializes the result again through ``response_model``) and
+the single-pass way (a cached ``TypeAdapter`` returning JSON bytes). Both
+are called through ASGI, so routing and response overhead are included
+and the database is not. Paginated endpoints cap real pages at
+``MAX_PAGE_SIZE``; larger sizes show how each path scales.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any
+
+import httpx
+from fastapi import FastAPI, Response
+from pydantic import BaseModel
+
+from app.schemas.announcement import AnnouncementRead
+from app.schemas.attendance import (
+    AttendanceRead,
+    MemberAttendanceSummary,
+    SessionAttendanceSummary,
+)
+from app.schemas.class_ import ClassRead
+from app.schemas.common import Page, list_json, page_json
+from app.schemas.enrollment import EnrollmentRead
+from app.schemas.plan import PlanRead
+from app.schemas.qna import QuestionRead, ReplyRead, TagCount
+from app.schemas.session import SessionRead
+from app.schemas.user import UserRead
+from benchmarks.samples import sample_rows
+
+# Endpoint path -> (schema, whether the endpoint returns a cursor page).
+ENDPOINTS: dict[str, tuple[type[BaseModel], bool]] = {
+    "/users": (UserRead, True),
+    "/announcements": (AnnouncementRead, True),
+    "/classes": (ClassRead, True),
+    "/sessions": (SessionRead, True),
+    "/sessions/upcoming": (SessionRead, True),
+    "/plans": (PlanRead, True),
+    "/qna/questions": (QuestionRead, True),
+    "/qna/questions/{id}/replies": (ReplyRead, True),
+    "/qna/tags": (TagCount, False),
+    "/enrollment": (EnrollmentRead, False),
+    "/attendance/{session_id}": (AttendanceRead, False),
+    "/attendance/me": (MemberAttendanceSummary, False),
+    "/attendance/classes/{id}/members": (MemberAttendanceSummary, False),
+    "/attendance/classes/{id}/sessions": (SessionAttendanceSummary, False),
+}
+
+
+def _app(schema: type[BaseModel], paged: bool, rows: list[Any]) -> FastAPI:
+    app = FastAPI()
+    response_model = Page[schema] if paged else list[schema]  # type: ignore[valid-type]
+
+    @app.get("/before", response_model=response_model)
+    async def before() -> Any:
+        items = [schema.model_validate(row, from_attributes=True) for row in rows]
+        return Page[schema](items=items, next_cursor=None) if paged else items  # type: ignore[valid-type]
+
+    @app.get("/after", response_model=response_model)
+    async def after() -> Response:
+        body = page_json(schema, rows, None) if paged else list_json(schema, rows)
+        return Response(content=body, media_type="application/json")
+
+    return app
+
+
+async def _time(client: httpx.AsyncClient, path: str, repeats: int) -> tuple[float, int]:
+    timings = []
+    size = 0
+    for _ in range(repeats):
+        started = time.perf_counter()
+        response = await client.get(path)
+        timings.append((time.perf_counter() - started) * 1000)
+        response.raise_for_status()
+        size = len(response.content)
+    return statistics.median(timings), size
+
+
+async def run_benchmark(endpoints: list[str], sizes: list[int], repeats: int) -> None:
+    """Time both serialization paths for every endpoint and row count."""
+
+    print(f"{'endpoint':<36} {'rows':>7} {'before ms':>10} {'after ms':>10} {'speedup':>8}")
+    for endpoint in endpoints:
+        schema, paged = ENDPOINTS[endpoint]
+        for size in sizes:
+            app = _app(schema, paged, sample_rows(schema, size))
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                before, before_bytes = await _time(client, "/before", repeats)
+                after, after_bytes = await _time(client, "/after", repeats)
+            assert before_bytes == after_bytes, f"{endpoint}: response bodies differ in size"
+            print(f"{endpoint:<36} {size:>7} {before:>10.1f} {after:>10.1f} {before / after:>7.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--endpoint", action="append", choices=sorted(ENDPOINTS), default=None)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(run_benchmark(args.endpoint or list(ENDPOINTS), args.rows, args.repeats))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Operational maintenance jobs run against the configured database."""
@@ -0,0 +1,32 @@
+"""Recompute ``classes.enrollment_count`` from the enrollments table.
+
+Usage::
+
+    python -m scripts.repair_enrollment_counts
+
+Counters are kept in step by every enrollment write, so this only finds
+drift left by manual edits or restored backups. It is safe to run at any
+time; classes whose count is already correct are not rewritten.
+"""
+
+import asyncio
+
+from app.db.session import dispose_engine, get_session_maker
+from app.services.enrollment_service import EnrollmentService
+
+
+async def run() -> int:
+    try:
+        async with get_session_maker()() as session:
+            return await EnrollmentService(session).repair_counts()
+    finally:
+        await dispose_engine()
+
+
+def main() -> None:
+    repaired = asyncio.run(run())
+    print(f"repaired enrollment_count on {repaired} class(es)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,532 @@
+"""Generate a large, referentially valid synthetic dataset for scale testing.
+
+Usage::
+
+    python -m scripts.seed_dataset                      # production-sized, into DATABASE_URL
+    python -m scripts.seed_dataset --scale 0.01 --database-url sqlite+aiosqlite:///scale.db
+    python -m scripts.seed_dataset --reset --seed 7
+
+Rows are generated in memory from a fixed random seed and bulk-loaded
+straight into the tables: multi-row ``INSERT`` statements on SQLite and
+``COPY`` on PostgreSQL. Values go through each column type's bind
+processor, so they are stored exactly as ORM writes would store them.
+Derived data is computed alongside the rows: enrollment counts, reply
+counts and last activity, question tag rows and both attendance rollups.
+
+Every user shares one precomputed PBKDF2 hash of ``--password``, so no
+per-user hashing is needed. Tables are created when missing; the load
+refuses to run on a database that already holds users unless ``--reset``
+drops and recreates every table first.
+"""
+
+import argparse
+import asyncio
+import itertools
+import random
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, fields, replace
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import Table, func, select
+from sqlalchemy.engine import Dialect
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+
+from app.core.config import get_settings
+from app.core.security import hash_password
+from app.db.init_db import create_all_tables, drop_all_tables
+from app.models import (
+    Announcement,
+    Attendance,
+    AttendanceMemberSummary,
+    AttendanceSessionSummary,
+    ClassSession,
+    Enrollment,
+    LearningClass,
+    QnAQuestion,
+    QnAReply,
+    QuarterlyPlan,
+    QuestionTag,
+    User,
+)
+from app.models.attendance import AttendanceStatus
+from app.models.user import UserRole
+from app.utils.time import utc_now
+
+DEFAULT_PASSWORD = "Password123!"
+# SQLite binds at most 32766 parameters per statement.
+SQLITE_MAX_PARAMETERS = 32_766
+POSTGRES_COPY_BATCH_SIZE = 50_000
+
+TOPICS = (
+    "python", "postgres", "docker", "fastapi", "pytest", "kubernetes", "react", "typescript",
+    "linux", "networking", "security", "testing", "caching", "async", "sql", "rust",
+)  # fmt: skip
+LEVELS = ("Foundations", "Intermediate", "Advanced", "Workshop", "Study Group")
+FIRST_NAMES = ("Ada", "Alan", "Grace", "Linus", "Margaret", "Dennis", "Barbara", "Ken", "Frances", "Edsger")
+LAST_NAMES = ("Lovelace", "Turing", "Hopper", "Torvalds", "Hamilton", "Ritchie", "Liskov", "Thompson", "Allen")
+WORDS = (
+    "index query cursor session deploy container pool latency cache vacuum replica schema fixture "
+    "mock coverage logging metrics tracing queue worker retry timeout socket thread process memory "
+    "profile benchmark search ranking token migration release config secret build pipeline review"
+).split()
+STATUS_WEIGHTS = ((AttendanceStatus.PRESENT, 0.8), (AttendanceStatus.ABSENT, 0.15), (AttendanceStatus.EXCUSED, 0.05))
+
+
+@dataclass(frozen=True, slots=True)
+class DatasetSize:
+    """Row counts of the generated dataset; defaults approximate production."""
+
+    users: int = 100_000
+    classes: int = 2_000
+    sessions_per_class: int = 12
+    classes_per_member: int = 3
+    questions: int = 100_000
+    max_replies_per_question: int = 6
+    announcements: int = 1_000
+    plans: int = 40
+    attendance_rate: float = 0.85
+
+    def scaled(self, factor: float) -> "DatasetSize":
+        """Multiply every table size by ``factor``, keeping at least one row of each."""
+
+        return replace(
+            self,
+            users=max(2, round(self.users * factor)),
+            classes=max(1, round(self.classes * factor)),
+            questions=max(1, round(self.questions * factor)),
+            announcements=max(1, round(self.announcements * factor)),
+            plans=max(1, round(self.plans * factor)),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class TableLoad:
+    """Rows written to one table and how long it took."""
+
+    table: str
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else float("inf")
+
+
+class _Loader(ABC):
+    """Bulk writer for one backend; values are bound with the dialect's type processors."""
+
+    def __init__(self, connection: AsyncConnection) -> None:
+        self.connection = connection
+        self.dialect: Dialect = connection.dialect
+
+    def _processors(self, table: Table, columns: tuple[str, ...]) -> list[Any]:
+        return [table.c[name].type.dialect_impl(self.dialect).bind_processor(self.dialect) for name in columns]
+
+    def _bound(
+        self, table: Table, columns: tuple[str, ...], rows: Iterable[tuple[Any, ...]]
+    ) -> Iterator[tuple[Any, ...]]:
+        processors = self._processors(table, columns)
+        for row in rows:
+            yield tuple(
+                value if processor is None or value is None else processor(value)
+                for processor, value in zip(processors, row, strict=True)
+            )
+
+    @abstractmethod
+    async def load(self, table: Table, columns: tuple[str, ...], rows: Iterable[tuple[Any, ...]]) -> int:
+        """Insert ``rows`` into ``columns`` of ``table`` and return how many were written."""
+
+
+class _SqliteLoader(_Loader):
+    """Multi-row ``INSERT ... VALUES (...), (...)`` batches sized to SQLite's parameter limit."""
+
+    async def load(self, table: Table, columns: tuple[str, ...], rows: Iterable[tuple[Any, ...]]) -> int:
+        batch_size = SQLITE_MAX_PARAMETERS // len(columns)
+        placeholders = "(" + ", ".join("?" for _ in columns) + ")"
+        prefix = f"INSERT INTO {table.name} ({', '.join(columns)}) VALUES "
+        full_statement = prefix + ", ".join(itertools.repeat(placeholders, batch_size))
+        count = 0
+        bound = self._bound(table, columns, rows)
+        while batch := list(itertools.islice(bound, batch_size)):
+            statement = full_statement if len(batch) == batch_size else prefix + ", ".join([placeholders] * len(batch))
+            await self.connection.exec_driver_sql(statement, tuple(itertools.chain.from_iterable(batch)))
+            count += len(batch)
+        return count
+
+
+class _PostgresLoader(_Loader):
+    """Binary ``COPY`` through asyncpg on the connection's open transaction."""
+
+    async def load(self, table: Table, columns: tuple[str, ...], rows: Iterable[tuple[Any, ...]]) -> int:
+        raw = await self.connection.get_raw_connection()
+        driver = raw.driver_connection
+        assert driver is not None
+        count = 0
+        bound = self._bound(table, columns, rows)
+        while batch := list(itertools.islice(bound, POSTGRES_COPY_BATCH_SIZE)):
+            await driver.copy_records_to_table(table.name, records=batch, columns=list(columns))
+            count += len(batch)
+        return count
+
+
+class _Generator:
+    """Deterministic row factories; later tables read ids and counters kept by earlier ones."""
+
+    def __init__(self, size: DatasetSize, seed: int, password_hash: str) -> None:
+        self.size = size
+        self.rng = random.Random(seed)
+        self.now = utc_now().replace(minute=0, second=0, microsecond=0)
+        self.password_hash = password_hash
+
+        self.user_ids: list[uuid.UUID] = []
+        self.lead_ids: list[uuid.UUID] = []
+        self.member_ids: list[uuid.UUID] = []
+        self.class_ids: list[uuid.UUID] = []
+        self.class_creators: list[uuid.UUID] = []
+        self.members_by_class: list[list[uuid.UUID]] = []
+        self.sessions: list[tuple[uuid.UUID, int, datetime, datetime]] = []
+        self.session_counts: dict[uuid.UUID, list[int]] = {}
+        self.member_counts: dict[tuple[int, uuid.UUID], list[int]] = {}
+        self.replies: list[tuple[uuid.UUID, uuid.UUID, datetime]] = []
+
+    def _uuid(self) -> uuid.UUID:
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def _past(self, days: int) -> datetime:
+        return self.now - timedelta(seconds=self.rng.randrange(days * 86_400))
+
+    def _text(self, words: int) -> str:
+        return " ".join(self.rng.choices(WORDS, k=words))
+
+    def users(self) -> Iterator[tuple[Any, ...]]:
+        leads = max(1, self.size.users // 100)
+        for number in range(self.size.users):
+            user_id = self._uuid()
+            if number == 0:
+                role = UserRole.ADMIN
+            elif number <= leads:
+                role = UserRole.LEAD
+                self.lead_ids.append(user_id)
+            else:
+                role = UserRole.MEMBER
+                self.member_ids.append(user_id)
+            self.user_ids.append(user_id)
+            created_at = self._past(730)
+            yield (
+                user_id,
+                f"user{number}@example.test",
+                f"{self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)}",
+                self.password_hash,
+                role,
+                self.rng.random() > 0.01,
+                created_at,
+                created_at,
+            )
+        if not self.lead_ids:
+            self.lead_ids.append(self.user_ids[0])
+
+    def _enroll_members(self) -> None:
+        """Pick each member's classes with a skewed popularity, so some classes are large."""
+
+        classes = self.size.classes
+        self.members_by_class = [[] for _ in range(classes)]
+        cum_weights = list(itertools.accumulate(1 / (rank + 1) ** 0.8 for rank in range(classes)))
+        per_member = min(self.size.classes_per_member, classes)
+        for member_id in self.member_ids:
+            chosen: set[int] = set()
+            while len(chosen) < per_member:
+                chosen.update(self.rng.choices(range(classes), cum_weights=cum_weights, k=per_member - len(chosen)))
+            for index in chosen:
+                self.members_by_class[index].append(member_id)
+
+    def classes(self) -> Iterator[tuple[Any, ...]]:
+        self._enroll_members()
+        for index in range(self.size.classes):
+            class_id = self._uuid()
+            creator = self.rng.choice(self.lead_ids)
+            self.class_ids.append(class_id)
+            self.class_creators.append(creator)
+            created_at = self._past(365)
+            yield (
+                class_id,
+                f"{self.rng.choice(TOPICS).title()} {self.rng.choice(LEVELS)} {index}",
+                self._text(20),
+                self.rng.random() > 0.1,
+                creator,
+                len(self.members_by_class[index]),
+                created_at,
+                created_at,
+            )
+
+    def class_sessions(self) -> Iterator[tuple[Any, ...]]:
+        for index, class_id in enumerate(self.class_ids):
+            first = (self.now - timedelta(days=self.rng.randrange(300))).replace(hour=self.rng.randrange(9, 19))
+            for number in range(self.size.sessions_per_class):
+                session_id = self._uuid()
+                starts_at = first + timedelta(weeks=number)
+                ends_at = starts_at + timedelta(minutes=self.rng.choice((60, 90, 120)))
+                self.sessions.append((session_id, index, starts_at, ends_at))
+                created_at = first - timedelta(days=7)
+                yield (
+                    session_id,
+                    class_id,
+                    f"Session {number + 1}",
+                    self._text(12),
+                    starts_at,
+                    ends_at,
+                    self.class_creators[index],
+                    created_at,
+                    created_at,
+                )
+
+    def enrollments(self) -> Iterator[tuple[Any, ...]]:
+        for index, class_id in enumerate(self.class_ids):
+            for member_id in self.members_by_class[index]:
+                created_at = self._past(365)
+                yield (self._uuid(), member_id, class_id, created_at, created_at)
+
+    def attendance(self) -> Iterator[tuple[Any, ...]]:
+        statuses = [status for status, _ in STATUS_WEIGHTS]
+        cum_weights = list(itertools.accumulate(weight for _, weight in STATUS_WEIGHTS))
+        for session_id, index, _, ends_at in self.sessions:
+            if ends_at > self.now:
+                continue
+            for member_id in self.members_by_class[index]:
+                if self.rng.random() > self.size.attendance_rate:
+                    continue
+                status = self.rng.choices(statuses, cum_weights=cum_weights)[0]
+                position = statuses.index(status)
+                self.session_counts.setdefault(session_id, [0, 0, 0])[position] += 1
+                self.member_counts.setdefault((index, member_id), [0, 0, 0])[position] += 1
+                marked_at = ends_at + timedelta(minutes=self.rng.randrange(1, 120))
+                yield (
+                    self._uuid(),
+                    session_id,
+                    member_id,
+                    self.class_creators[index],
+                    status,
+                    None,
+                    marked_at,
+                    marked_at,
+                )
+
+    def session_summaries(self) -> Iterator[tuple[Any, ...]]:
+        class_by_session = {session_id: self.class_ids[index] for session_id, index, _, _ in self.sessions}
+        for session_id, (present, absent, excused) in self.session_counts.items():
+            yield (session_id, class_by_session[session_id], present, absent, excused)
+
+    def member_summaries(self) -> Iterator[tuple[Any, ...]]:
+        for (index, user_id), (present, absent, excused) in self.member_counts.items():
+            yield (self.class_ids[index], user_id, present, absent, excused)
+
+    def questions(self) -> Iterator[tuple[Any, ...]]:
+        authors = self.member_ids or self.user_ids
+        for _ in range(self.size.questions):
+            question_id = self._uuid()
+            created_at = self._past(730)
+            # About a third of the archive stays unanswered.
+            replies = 0 if self.rng.random() < 0.35 else self.rng.randint(1, max(1, self.size.max_replies_per_question))
+            last_activity_at = created_at
+            for _ in range(replies):
+                last_activity_at = min(self.now, last_activity_at + timedelta(minutes=self.rng.randrange(5, 4_320)))
+                self.replies.append((question_id, self.rng.choice(authors), last_activity_at))
+            topic = self.rng.choice(TOPICS)
+            tags = sorted({topic, *self.rng.sample(TOPICS, self.rng.randrange(3))})
+            yield (
+                question_id,
+                self.rng.choice(authors),
+                f"How do I handle {self._text(3)} with {topic}?",
+                self._text(self.rng.randrange(30, 120)),
+                tags,
+                self.rng.random() < 0.01,
+                replies,
+                last_activity_at,
+                created_at,
+                created_at,
+            )
+
+    def question_tags(self, questions: list[tuple[Any, ...]]) -> Iterator[tuple[Any, ...]]:
+        for row in questions:
+            for tag in row[4]:
+                yield (row[0], tag, row[8])
+
+    def question_replies(self) -> Iterator[tuple[Any, ...]]:
+        for question_id, author_id, created_at in self.replies:
+            yield (
+                self._uuid(),
+                question_id,
+                author_id,
+                self._text(self.rng.randrange(10, 60)),
+                False,
+                created_at,
+                created_at,
+            )
+
+    def announcements(self) -> Iterator[tuple[Any, ...]]:
+        for number in range(self.size.announcements):
+            created_at = self._past(730)
+            yield (
+                self._uuid(),
+                f"Announcement {number}: {self._text(4)}",
+                self._text(80),
+                self.rng.choice(self.lead_ids),
+                created_at,
+                created_at,
+            )
+
+    def plans(self) -> Iterator[tuple[Any, ...]]:
+        for number in range(self.size.plans):
+            year, quarter = divmod(number, 4)
+            objectives = [
+                {
+                    "title": f"Grow {self.rng.choice(TOPICS)} track",
+                    "status": self.rng.choice(("planned", "active", "done")),
+                }
+                for _ in range(self.rng.randint(1, 5))
+            ]
+            created_at = self._past(730)
+            yield (
+                self._uuid(),
+                f"{2020 + year}-Q{quarter + 1}",
+                objectives,
+                self.rng.choice(self.lead_ids),
+                1,
+                created_at,
+                created_at,
+            )
+
+
+def _columns(table: Table, *names: str) -> tuple[str, ...]:
+    missing = set(names) - set(table.c.keys())
+    assert not missing, f"{table.name} has no column(s) {sorted(missing)}"
+    return names
+
+
+async def seed_dataset(
+    engine: AsyncEngine,
+    size: DatasetSize = DatasetSize(),
+    seed: int = 42,
+    password: str = DEFAULT_PASSWORD,
+) -> list[TableLoad]:
+    """Bulk-load a generated dataset into empty tables in one transaction."""
+
+    generator = _Generator(size, seed, hash_password(password))
+    loads: list[TableLoad] = []
+
+    async with engine.begin() as connection:
+        loader: _Loader
+        if connection.dialect.name == "postgresql":
+            # COPY runs on the driver connection; a first statement opens the
+            # transaction it joins, so the whole load commits or fails together.
+            await connection.execute(select(1))
+            loader = _PostgresLoader(connection)
+        else:
+            loader = _SqliteLoader(connection)
+
+        async def load(model: Any, columns: tuple[str, ...], rows: Iterable[tuple[Any, ...]]) -> None:
+            table: Table = model.__table__
+            started = time.perf_counter()
+            count = await loader.load(table, _columns(table, *columns), rows)
+            loads.append(TableLoad(table.name, count, time.perf_counter() - started))
+
+        timestamps = ("created_at", "updated_at")
+        await load(
+            User, ("id", "email", "full_name", "hashed_password", "role", "is_active", *timestamps), generator.users()
+        )
+        await load(
+            LearningClass,
+            ("id", "title", "description", "is_published", "created_by_id", "enrollment_count", *timestamps),
+            generator.classes(),
+        )
+        await load(
+            ClassSession,
+            ("id", "class_id", "title", "description", "starts_at", "ends_at", "created_by_id", *timestamps),
+            generator.class_sessions(),
+        )
+        await load(Enrollment, ("id", "user_id", "class_id", *timestamps), generator.enrollments())
+        await load(
+            Attendance,
+            ("id", "session_id", "user_id", "marked_by_id", "status", "previous_status", *timestamps),
+            generator.attendance(),
+        )
+        counts = ("present_count", "absent_count", "excused_count")
+        await load(AttendanceSessionSummary, ("session_id", "class_id", *counts), generator.session_summaries())
+        await load(AttendanceMemberSummary, ("class_id", "user_id", *counts), generator.member_summaries())
+
+        questions = list(generator.questions())
+        await load(
+            QnAQuestion,
+            ("id", "author_id", "title", "body", "tags", "is_deleted", "reply_count", "last_activity_at", *timestamps),
+            questions,
+        )
+        await load(QuestionTag, ("question_id", "tag", "created_at"), generator.question_tags(questions))
+        await load(
+            QnAReply,
+            ("id", "question_id", "author_id", "body", "is_deleted", *timestamps),
+            generator.question_replies(),
+        )
+        await load(Announcement, ("id", "title", "body", "created_by_id", *timestamps), generator.announcements())
+        await load(
+            QuarterlyPlan,
+            ("id", "quarter", "objectives", "created_by_id", "version", *timestamps),
+            generator.plans(),
+        )
+
+    return loads
+
+
+async def run(args: argparse.Namespace) -> list[TableLoad]:
+    size = DatasetSize().scaled(args.scale)
+    overrides = {
+        field.name: getattr(args, field.name)
+        for field in fields(DatasetSize)
+        if getattr(args, field.name, None) is not None
+    }
+    size = replace(size, **overrides)
+
+    engine = create_async_engine(args.database_url or get_settings().database_url)
+    try:
+        if args.reset:
+            await drop_all_tables(engine)
+        await create_all_tables(engine)
+        async with engine.connect() as connection:
+            existing = (await connection.execute(select(func.count()).select_from(User))).scalar_one()
+        if existing:
+            raise SystemExit(
+                f"Refusing to seed: the database already has {existing} user(s); pass --reset to replace it"
+            )
+        return await seed_dataset(engine, size, args.seed, args.password)
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=None, help="defaults to DATABASE_URL")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every table size")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--password", default=DEFAULT_PASSWORD, help="password shared by every user")
+    parser.add_argument("--reset", action="store_true", help="drop and recreate all tables first")
+    for size_field in fields(DatasetSize):
+        parser.add_argument(f"--{size_field.name.replace('_', '-')}", type=type(size_field.default), default=None)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    loads = asyncio.run(run(args))
+    elapsed = time.perf_counter() - started
+
+    print(f"{'table':<32} {'rows':>10} {'seconds':>9} {'rows/s':>10}")
+    for table_load in loads:
+        print(
+            f"{table_load.table:<32} {table_load.rows:>10} {table_load.seconds:>9.2f} {table_load.rows_per_second:>10.0f}"
+        )
+    total = sum(table_load.rows for table_load in loads)
+    print(f"{total} rows in {elapsed:.1f}s ({total / elapsed:.0f} rows/s overall)")
+
+
+if __name__ == "__main__":
+    main()
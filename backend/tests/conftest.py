@@ -3,12 +3,23 @@
 import asyncio
 from collections.abc import Generator
 import importlib.util
+import os
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.pool import StaticPool
 
+# The application engine is never used by tests; skip its start-up warm-up.
+os.environ.setdefault("DB_WARMUP_CONNECTIONS", "0")
+
+from app.core.cache import caches
+from app.core.events import event_hub
 from app.core.rate_limit import rate_limiter
 from app.db.base import Base
 from app.db.session import get_db
@@ -52,8 +63,14 @@ def prepare_test_db() -> Generator[None, None, None]:
     if HAS_AIOSQLITE:
         asyncio.run(_create_all_tables())
     rate_limiter._events.clear()
+    for cache in caches.values():
+        cache.clear()
+    event_hub.clear()
     yield
     rate_limiter._events.clear()
+    for cache in caches.values():
+        cache.clear()
+    event_hub.clear()
     if HAS_AIOSQLITE:
         asyncio.run(_drop_all_tables())
 
@@ -116,3 +133,11 @@ def require_db_driver() -> None:
 
     if not HAS_AIOSQLITE:
         pytest.skip("aiosqlite is not installed; skipping DB-backed tests")
+
+
+@pytest.fixture
+def db_engine(require_db_driver) -> AsyncEngine:
+    """Return the async engine backing the test database."""
+
+    assert engine is not None
+    return engine
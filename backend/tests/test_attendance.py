@@ -0,0 +1,154 @@
+"""Attendance endpoint tests."""
+
+import uuid
+
+from fastapi.testclient import TestClient
+
+from app.models.attendance import AttendanceMemberSummary
+from app.models.user import UserRole
+from app.repositories.attendance_repo import _in_lock_order
+
+
+def _create_session(client: TestClient, headers: dict[str, str]) -> str:
+    class_response = client.post(
+        "/api/v1/classes",
+        json={"title": "Web Basics", "description": "HTML and CSS", "is_published": True},
+        headers=headers,
+    )
+    session_response = client.post(
+        "/api/v1/sessions",
+        json={
+            "class_id": class_response.json()["id"],
+            "title": "Week 1",
+            "starts_at": "2026-03-01T18:00:00",
+            "ends_at": "2026-03-01T20:00:00",
+        },
+        headers=headers,
+    )
+    return session_response.json()["id"]
+
+
+def test_marking_attendance_twice_updates_single_record(
+    client: TestClient,
+    require_db_driver,
+    create_user,
+) -> None:
+    """Repeated marks for the same member upsert one attendance row."""
+
+    lead_headers = create_user("lead3@example.com", role=UserRole.LEAD)
+    member_id = client.get(
+        "/api/v1/users/me",
+        headers=create_user("member8@example.com", role=UserRole.MEMBER),
+    ).json()["id"]
+    session_id = _create_session(client, lead_headers)
+
+    first = client.post(
+        "/api/v1/attendance",
+        json={"session_id": session_id, "user_id": member_id, "status": "absent"},
+        headers=lead_headers,
+    )
+    assert first.status_code == 201
+
+    second = client.post(
+        "/api/v1/attendance",
+        json={"session_id": session_id, "user_id": member_id, "status": "present"},
+        headers=lead_headers,
+    )
+    assert second.status_code == 201
+    assert second.json()["id"] == first.json()["id"]
+    assert second.json()["status"] == "present"
+
+    records = client.get(f"/api/v1/attendance/{session_id}", headers=lead_headers).json()
+    assert [record["status"] for record in records] == ["present"]
+
+
+def test_roll_call_marks_enrolled_members_and_reports_others(
+    client: TestClient,
+    require_db_driver,
+    create_user,
+) -> None:
+    """Roll-call upserts enrolled members and flags members outside the class."""
+
+    lead_headers = create_user("lead4@example.com", role=UserRole.LEAD)
+    enrolled_headers = create_user("member9@example.com", role=UserRole.MEMBER)
+    outsider_headers = create_user("member10@example.com", role=UserRole.MEMBER)
+    enrolled_id = client.get("/api/v1/users/me", headers=enrolled_headers).json()["id"]
+    outsider_id = client.get("/api/v1/users/me", headers=outsider_headers).json()["id"]
+
+    session_id = _create_session(client, lead_headers)
+    class_id = client.get(f"/api/v1/sessions/{session_id}", headers=lead_headers).json()["class_id"]
+    client.post("/api/v1/enrollment", json={"class_id": class_id}, headers=enrolled_headers)
+
+    response = client.post(
+        "/api/v1/attendance/roll-call",
+        json={
+            "session_id": session_id,
+            "statuses": {enrolled_id: "present", outsider_id: "absent"},
+        },
+        headers=lead_headers,
+    )
+
+    assert response.status_code == 200
+    results = {item["user_id"]: item for item in response.json()["results"]}
+    assert results[enrolled_id]["outcome"] == "marked"
+    assert results[enrolled_id]["attendance"]["status"] == "present"
+    assert results[outsider_id]["outcome"] == "not_enrolled"
+    assert results[outsider_id]["attendance"] is None
+
+
+def test_attendance_rollups_track_status_transitions(
+    client: TestClient,
+    require_db_driver,
+    create_user,
+) -> None:
+    """Session and member rollups follow inserts, status changes and session deletion."""
+
+    lead_headers = create_user("lead5@example.com", role=UserRole.LEAD)
+    member_headers = create_user("member11@example.com", role=UserRole.MEMBER)
+    other_headers = create_user("member12@example.com", role=UserRole.MEMBER)
+    member_id = client.get("/api/v1/users/me", headers=member_headers).json()["id"]
+    other_id = client.get("/api/v1/users/me", headers=other_headers).json()["id"]
+    session_id = _create_session(client, lead_headers)
+    class_id = client.get(f"/api/v1/sessions/{session_id}", headers=lead_headers).json()["class_id"]
+
+    for user_id, status in ((member_id, "absent"), (member_id, "present"), (other_id, "excused")):
+        client.post(
+            "/api/v1/attendance",
+            json={"session_id": session_id, "user_id": user_id, "status": status},
+            headers=lead_headers,
+        )
+
+    [session_summary] = client.get(
+        f"/api/v1/attendance/classes/{class_id}/sessions",
+        headers=lead_headers,
+    ).json()
+    assert session_summary["session_id"] == session_id
+    assert (session_summary["present_count"], session_summary["absent_count"]) == (1, 0)
+    assert session_summary["excused_count"] == 1
+    assert session_summary["attendance_rate"] == 1.0
+
+    members = client.get(f"/api/v1/attendance/classes/{class_id}/members", headers=lead_headers).json()
+    by_user = {item["user_id"]: item for item in members}
+    assert by_user[member_id]["present_count"] == 1
+    assert by_user[member_id]["absent_count"] == 0
+    assert by_user[other_id]["attendance_rate"] is None
+
+    [mine] = client.get("/api/v1/attendance/me", headers=member_headers).json()
+    assert mine["class_id"] == class_id
+    assert mine["attendance_rate"] == 1.0
+
+    client.delete(f"/api/v1/sessions/{session_id}", headers=lead_headers)
+    assert client.get(f"/api/v1/attendance/classes/{class_id}/sessions", headers=lead_headers).json() == []
+    [after_delete] = client.get("/api/v1/attendance/me", headers=member_headers).json()
+    assert after_delete["present_count"] == 0
+
+
+def test_upsert_rows_are_sorted_by_conflict_key() -> None:
+    """Rows reach ``ON CONFLICT`` in key order whatever order the request listed them."""
+
+    class_id = uuid.uuid4()
+    user_ids = sorted(uuid.uuid4() for _ in range(5))
+    rows: list[dict[str, object]] = [{"class_id": class_id, "user_id": user_id} for user_id in reversed(user_ids)]
+
+    ordered = _in_lock_order(rows, [AttendanceMemberSummary.class_id, AttendanceMemberSummary.user_id])
+    assert [row["user_id"] for row in ordered] == user_ids
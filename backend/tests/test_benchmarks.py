@@ -0,0 +1,65 @@
+"""Benchmark tooling tests: baseline comparison and load-test accounting."""
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.main import app
+from benchmarks.load import (
+    QUERY_COUNT_HEADER,
+    QueryCountingApp,
+    _count_query,
+    percentile,
+)
+from benchmarks.micro import CASES, compare_results, format_report, regressions
+
+
+def _results(**medians: float) -> dict[str, object]:
+    return {"metadata": {}, "results": {name: {"median_us": value} for name, value in medians.items()}}
+
+
+def test_comparison_flags_only_regressions_above_threshold() -> None:
+    """Slower-than-threshold cases regress; faster, new and missing cases do not."""
+
+    comparisons = compare_results(
+        _results(decode=10.0, validate=4.0, removed=1.0),
+        _results(decode=12.5, validate=4.2, added=3.0),
+    )
+
+    assert [comparison.name for comparison in regressions(comparisons, 20)] == ["decode"]
+    assert regressions(comparisons, 30) == []
+    report = format_report(comparisons, 20)
+    assert "REGRESSION" in report and "new" in report and "missing" in report
+    assert report.endswith("1 regression(s) above 20%")
+
+
+def test_registered_cases_run() -> None:
+    """Every case sets up and completes one call, so the suite cannot rot unnoticed."""
+
+    for factory in CASES.values():
+        factory()()
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    """Percentiles pick an observed value, never an interpolation."""
+
+    values = [float(value) for value in range(1, 101)]
+
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([7.0], 95) == 7
+
+
+def test_query_counting_app_reports_statements_per_request(client, create_user, db_engine) -> None:
+    """Each response carries the number of SQL statements its request executed."""
+
+    headers = create_user("member@example.com")
+    event.listen(db_engine.sync_engine, "before_cursor_execute", _count_query)
+    try:
+        with TestClient(QueryCountingApp(app)) as counting_client:
+            first = counting_client.get("/api/v1/classes", headers=headers)
+            cached = counting_client.get("/api/v1/classes", headers=headers)
+    finally:
+        event.remove(db_engine.sync_engine, "before_cursor_execute", _count_query)
+
+    assert first.status_code == 200
+    assert int(first.headers[QUERY_COUNT_HEADER]) > int(cached.headers[QUERY_COUNT_HEADER]) >= 1
@@ -0,0 +1,137 @@
+"""In-process cache tests."""
+
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.core.cache import SnapshotCache, TaggedCache
+from app.models.user import UserRole
+from app.repositories.class_repo import ClassRepository
+from app.repositories.user_repo import UserRepository
+
+
+def test_tagged_cache_invalidates_by_tag_and_evicts_lru() -> None:
+    """Invalidation drops only tagged entries; the oldest entry goes when full."""
+
+    cache: TaggedCache[str] = TaggedCache(max_entries=2)
+    cache.set("a", "A", ["class:1"])
+    cache.set("b", "B", ["class:2", "user:1"])
+
+    cache.invalidate("class:1")
+    assert cache.get("a") is None
+    assert cache.get("b") == "B"
+
+    cache.set("c", "C", [])
+    cache.set("d", "D", [])
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+
+def test_get_or_render_skips_store_when_invalidated_mid_render() -> None:
+    """A render that overlaps an invalidation is returned but not cached."""
+
+    cache: TaggedCache[str] = TaggedCache()
+
+    async def stale_render() -> tuple[str, list[str]]:
+        cache.invalidate("class:1")
+        return "stale", ["class:1"]
+
+    async def fresh_render() -> tuple[str, list[str]]:
+        return "fresh", ["class:1"]
+
+    assert asyncio.run(cache.get_or_render("feed", stale_render)) == "stale"
+    assert asyncio.run(cache.get_or_render("feed", fresh_render)) == "fresh"
+    assert cache.get("feed") == "fresh"
+
+
+def test_cache_expires_entries_after_ttl_and_counts_lookups() -> None:
+    """Expired entries miss, and stats report hits, misses, expirations and evictions."""
+
+    now = [0.0]
+    cache: TaggedCache[bytes] = TaggedCache(max_entries=1, ttl_seconds=10, clock=lambda: now[0])
+    cache.set("a", b"A", [])
+    assert cache.get("a") == b"A"
+
+    now[0] = 10.0
+    assert cache.get("a") is None
+    cache.set("b", b"B", [])
+    cache.set("c", b"C", [])
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.expirations, stats.evictions) == (1, 1, 1, 1)
+    assert stats.hit_rate == 0.5
+
+
+def test_snapshot_cache_drops_rows_on_write_and_skips_racing_loads() -> None:
+    """Every write drops its snapshot, even within the same clock second, and racing loads are not stored."""
+
+    cache = SnapshotCache(max_entries=8)
+    v1 = SimpleNamespace(id=1, parent=7, updated_at=datetime(2026, 1, 1))
+    # Same ``updated_at``: SQLite's CURRENT_TIMESTAMP has one-second resolution.
+    v2 = SimpleNamespace(id=1, parent=7, updated_at=datetime(2026, 1, 1))
+    loads: list[object] = []
+
+    async def load(row: object) -> object:
+        loads.append(row)
+        return row
+
+    def parent(row: SimpleNamespace) -> list[str]:
+        return [f"parent:{row.parent}"]
+
+    async def run() -> None:
+        assert await cache.get_or_load("row:1", lambda: load(v1), parent) is v1
+        assert await cache.get_or_load("row:1", lambda: load(v2), parent) is v1
+        cache.invalidate_row("row:1")
+        assert await cache.get_or_load("row:1", lambda: load(v2), parent) is v2
+        cache.invalidate("parent:7")
+        assert len(cache) == 0
+
+        async def racing_load() -> object:
+            cache.invalidate_row("row:1")
+            return v1
+
+        assert await cache.get_or_load("row:1", racing_load) is v1
+        assert len(cache) == 0
+
+    asyncio.run(run())
+    assert loads == [v1, v2]
+
+
+def test_deleted_class_snapshot_is_not_served(client: TestClient, require_db_driver, create_user) -> None:
+    """Enrollment existence checks stop finding a class as soon as it is deleted."""
+
+    lead_headers = create_user("lead-snapshot@example.com", role=UserRole.LEAD)
+    first = create_user("snapshot1@example.com")
+    second = create_user("snapshot2@example.com")
+    class_id = client.post(
+        "/api/v1/classes",
+        json={"title": "Snapshot class", "is_published": True},
+        headers=lead_headers,
+    ).json()["id"]
+
+    assert client.post("/api/v1/enrollment", json={"class_id": class_id}, headers=first).status_code == 201
+    client.delete(f"/api/v1/classes/{class_id}", headers=lead_headers)
+    assert client.post("/api/v1/enrollment", json={"class_id": class_id}, headers=second).status_code == 404
+
+
+def test_updated_class_snapshot_is_not_served(db_engine: AsyncEngine, create_user) -> None:
+    """A write in this process drops its snapshot even when ``updated_at`` has not moved."""
+
+    create_user("lead-update-snapshot@example.com", role=UserRole.LEAD)
+
+    async def run() -> str:
+        async with AsyncSession(db_engine, expire_on_commit=False) as session:
+            repo = ClassRepository(session)
+            lead = await UserRepository(session).get_by_email("lead-update-snapshot@example.com")
+            assert lead is not None
+            class_ = await repo.create("Old title", None, True, lead.id)
+            assert (await repo.get_snapshot(class_.id)).title == "Old title"
+            await repo.update(class_, {"title": "New title"})
+            snapshot = await repo.get_snapshot(class_.id)
+            assert snapshot is not None
+            return snapshot.title
+
+    assert asyncio.run(run()) == "New title"
@@ -1,5 +1,8 @@
 """Class management endpoint tests."""
 
+import base64
+import json
+
 from fastapi.testclient import TestClient
 
 from app.models.user import UserRole
@@ -28,8 +31,8 @@ def test_lead_can_create_and_member_can_list_classes(
 
     list_response = client.get("/api/v1/classes", headers=member_headers)
     assert list_response.status_code == 200
-    assert len(list_response.json()) == 1
-    assert list_response.json()[0]["title"] == "Intro to Python"
+    assert len(list_response.json()["items"]) == 1
+    assert list_response.json()["items"][0]["title"] == "Intro to Python"
 
 
 def test_member_cannot_create_class(client: TestClient, require_db_driver, create_user) -> None:
@@ -44,3 +47,112 @@ def test_member_cannot_create_class(client: TestClient, require_db_driver, creat
     )
 
     assert response.status_code == 403
+
+
+def test_list_classes_pages_with_cursor(client: TestClient, require_db_driver, create_user) -> None:
+    """Cursor pages cover every class exactly once, newest first."""
+
+    lead_headers = create_user("lead6@example.com", role=UserRole.LEAD)
+    for title in ("Class One", "Class Two", "Class Three"):
+        client.post(
+            "/api/v1/classes",
+            json={"title": title, "description": None, "is_published": True},
+            headers=lead_headers,
+        )
+
+    first_page = client.get("/api/v1/classes", params={"limit": 2}, headers=lead_headers).json()
+    assert [item["title"] for item in first_page["items"]] == ["Class Three", "Class Two"]
+    assert first_page["next_cursor"] is not None
+
+    second_page = client.get(
+        "/api/v1/classes",
+        params={"limit": 2, "cursor": first_page["next_cursor"]},
+        headers=lead_headers,
+    ).json()
+    assert [item["title"] for item in second_page["items"]] == ["Class One"]
+    assert second_page["next_cursor"] is None
+
+    invalid = client.get("/api/v1/classes", params={"cursor": "not-a-cursor"}, headers=lead_headers)
+    assert invalid.status_code == 400
+
+    for payload in (["created_at", "2020-01-01T00:00:00", 5], {"id": "x"}, ["created_at"]):
+        cursor = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+        malformed = client.get("/api/v1/classes", params={"cursor": cursor}, headers=lead_headers)
+        assert malformed.status_code == 400
+
+
+def test_list_classes_streams_ndjson_on_request(
+    client: TestClient,
+    require_db_driver,
+    create_user,
+) -> None:
+    """Clients accepting NDJSON receive every class as one JSON line, without paging."""
+
+    lead_headers = create_user("lead7@example.com", role=UserRole.LEAD)
+    for title in ("Stream One", "Stream Two", "Stream Three"):
+        client.post(
+            "/api/v1/classes",
+            json={"title": title, "description": None, "is_published": True},
+            headers=lead_headers,
+        )
+
+    response = client.get(
+        "/api/v1/classes",
+        params={"limit": 1},
+        headers={**lead_headers, "Accept": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["title"] for line in lines] == ["Stream Three", "Stream Two", "Stream One"]
+
+
+def test_class_and_session_lists_are_cached_and_invalidated_on_writes(
+    client: TestClient,
+    require_db_driver,
+    create_user,
+) -> None:
+    """Repeated list reads hit the catalog cache; writes evict exactly what they change."""
+
+    admin_headers = create_user("admin-catalog@example.com", role=UserRole.ADMIN)
+    member_headers = create_user("member-catalog@example.com", role=UserRole.MEMBER)
+
+    def titles() -> list[str]:
+        return [item["title"] for item in client.get("/api/v1/classes", headers=admin_headers).json()["items"]]
+
+    class_id = client.post(
+        "/api/v1/classes",
+        json={"title": "Cached class", "description": None, "is_published": True},
+        headers=admin_headers,
+    ).json()["id"]
+    assert titles() == ["Cached class"]
+    assert titles() == ["Cached class"]
+
+    client.post("/api/v1/classes", json={"title": "Newer class", "is_published": True}, headers=admin_headers)
+    assert titles() == ["Newer class", "Cached class"]
+    client.patch(f"/api/v1/classes/{class_id}", json={"title": "Renamed class"}, headers=admin_headers)
+    assert titles() == ["Newer class", "Renamed class"]
+
+    client.post("/api/v1/enrollment", json={"class_id": class_id}, headers=member_headers)
+    items = client.get("/api/v1/classes", headers=admin_headers).json()["items"]
+    assert items[1]["enrollment_count"] == 1
+
+    sessions_url = "/api/v1/sessions"
+    assert client.get(sessions_url, headers=admin_headers).json()["items"] == []
+    client.post(
+        sessions_url,
+        json={
+            "class_id": class_id,
+            "title": "Kickoff",
+            "starts_at": "2026-05-01T18:00:00",
+            "ends_at": "2026-05-01T20:00:00",
+        },
+        headers=admin_headers,
+    )
+    assert [item["title"] for item in client.get(sessions_url, headers=admin_headers).json()["items"]] == ["Kickoff"]
+
+    stats = client.get("/api/v1/cache/stats", headers=admin_headers).json()["catalog"]
+    assert stats["hits"] == 1
+    assert stats["misses"] == 6
+    assert client.get("/api/v1/cache/stats", headers=member_headers).status_code == 403
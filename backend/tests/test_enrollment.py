@@ -1,8 +1,15 @@
 """Enrollment endpoint tests."""
 
+import asyncio
+import json
+
 from fastapi.testclient import TestClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
+from app.models.class_ import LearningClass
 from app.models.user import UserRole
+from app.services.enrollment_service import EnrollmentService
 
 
 def test_enroll_and_prevent_duplicate_enrollment(
@@ -35,3 +42,89 @@ def test_enroll_and_prevent_duplicate_enrollment(
         headers=member_headers,
     )
     assert duplicate_enroll.status_code == 409
+
+
+def test_roster_import_streams_per_row_outcomes(
+    client: TestClient,
+    require_db_driver,
+    create_user,
+) -> None:
+    """Lead imports a CSV roster and receives one NDJSON outcome per row."""
+
+    lead_headers = create_user("lead5@example.com", role=UserRole.LEAD)
+    create_user("roster1@example.com", role=UserRole.MEMBER)
+    enrolled_headers = create_user("roster2@example.com", role=UserRole.MEMBER)
+
+    class_id = client.post(
+        "/api/v1/classes",
+        json={"title": "Git Basics", "description": "Version control", "is_published": True},
+        headers=lead_headers,
+    ).json()["id"]
+    client.post("/api/v1/enrollment", json={"class_id": class_id}, headers=enrolled_headers)
+
+    roster = "name,email\nOne,roster1@example.com\nTwo,roster2@example.com\nGhost,ghost@example.com\nBad,\n"
+    response = client.post(
+        "/api/v1/enrollment/import",
+        params={"class_id": class_id},
+        files={"file": ("roster.csv", roster, "text/csv")},
+        headers=lead_headers,
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    outcomes = [json.loads(line)["outcome"] for line in response.text.splitlines()]
+    assert outcomes == ["enrolled", "already_enrolled", "unknown_email", "invalid"]
+
+    enrollments = client.get(
+        "/api/v1/enrollment",
+        params={"class_id": class_id},
+        headers=lead_headers,
+    ).json()
+    assert len(enrollments) == 2
+
+
+def test_enrollment_count_tracks_writes_and_repairs_drift(
+    client: TestClient,
+    db_engine: AsyncEngine,
+    create_user,
+) -> None:
+    """Enroll, import and unenroll keep the class counter exact; repair fixes drift."""
+
+    lead_headers = create_user("lead6@example.com", role=UserRole.LEAD)
+    member_headers = create_user("count1@example.com", role=UserRole.MEMBER)
+    create_user("count2@example.com", role=UserRole.MEMBER)
+
+    class_id = client.post(
+        "/api/v1/classes",
+        json={"title": "SQL Basics", "description": None, "is_published": True},
+        headers=lead_headers,
+    ).json()["id"]
+
+    def enrollment_count() -> int:
+        return client.get(f"/api/v1/classes/{class_id}", headers=lead_headers).json()["enrollment_count"]
+
+    assert enrollment_count() == 0
+    client.post("/api/v1/enrollment", json={"class_id": class_id}, headers=member_headers)
+    client.post(
+        "/api/v1/enrollment/import",
+        params={"class_id": class_id},
+        files={"file": ("roster.csv", "email\ncount1@example.com\ncount2@example.com\n", "text/csv")},
+        headers=lead_headers,
+    )
+    assert enrollment_count() == 2
+    assert client.get("/api/v1/classes", headers=lead_headers).json()["items"][0]["enrollment_count"] == 2
+
+    assert client.delete(f"/api/v1/enrollment/{class_id}", headers=member_headers).status_code == 204
+    assert enrollment_count() == 1
+
+    async def corrupt_and_repair() -> tuple[int, int]:
+        sessions = async_sessionmaker(bind=db_engine, class_=AsyncSession, expire_on_commit=False)
+        async with sessions() as session:
+            await session.execute(update(LearningClass).values(enrollment_count=7))
+            await session.commit()
+            first = await EnrollmentService(session).repair_counts()
+            second = await EnrollmentService(session).repair_counts()
+        return first, second
+
+    assert asyncio.run(corrupt_and_repair()) == (1, 0)
+    assert enrollment_count() == 1
@@ -0,0 +1,106 @@
+"""Server-Sent Events hub and endpoint tests."""
+
+import asyncio
+import json
+
+from fastapi.testclient import TestClient
+
+from app.api.streaming import sse_frames
+from app.core.events import ANNOUNCEMENTS_TOPIC, EventHub, event_hub, question_topic
+from app.models.user import UserRole
+
+
+def test_hub_filters_topics_resumes_and_evicts_slow_consumers() -> None:
+    """Subscribers get only their topics, resume from history and are evicted when full."""
+
+    async def run() -> None:
+        hub = EventHub(queue_size=2, history_size=3)
+        first = hub.publish(ANNOUNCEMENTS_TOPIC, "announcement", '{"n": 1}')
+
+        subscription = hub.subscribe([ANNOUNCEMENTS_TOPIC])
+        hub.publish(question_topic("q1"), "reply", "{}")
+        second = hub.publish(ANNOUNCEMENTS_TOPIC, "announcement", '{"n": 2}')
+        assert subscription.queue.get_nowait() == second
+        assert subscription.queue.empty()
+
+        resumed = hub.subscribe([ANNOUNCEMENTS_TOPIC], last_event_id=first.id)
+        assert resumed.backlog == [second]
+        assert not resumed.reset
+        assert hub.subscribe([ANNOUNCEMENTS_TOPIC], last_event_id="other-1").reset
+        stream = first.id.rpartition("-")[0]
+        assert hub.subscribe([ANNOUNCEMENTS_TOPIC], last_event_id=f"{stream}-\u00b2").reset
+
+        for number in range(3):
+            hub.publish(ANNOUNCEMENTS_TOPIC, "announcement", str(number))
+        assert hub.subscribe([ANNOUNCEMENTS_TOPIC], last_event_id=first.id).reset
+        assert subscription.evicted
+        assert subscription.queue.get_nowait() is None
+
+    asyncio.run(run())
+
+
+def test_sse_frames_replay_live_events_and_end_on_eviction() -> None:
+    """The stream replays the backlog, sends heartbeats while idle and ends when evicted."""
+
+    async def run() -> list[bytes]:
+        hub = EventHub(queue_size=1)
+        first = hub.publish(ANNOUNCEMENTS_TOPIC, "announcement", '{"n": 1}')
+        hub.publish(ANNOUNCEMENTS_TOPIC, "announcement", '{"n": 2}')
+        subscription = hub.subscribe([ANNOUNCEMENTS_TOPIC], last_event_id=first.id)
+
+        frames = sse_frames(hub, subscription, heartbeat_seconds=0.01)
+        received = [await anext(frames), await anext(frames), await anext(frames)]
+        hub.publish(ANNOUNCEMENTS_TOPIC, "announcement", '{"n": 3}')
+        hub.publish(ANNOUNCEMENTS_TOPIC, "announcement", '{"n": 4}')
+        received.extend([frame async for frame in frames])
+        assert hub.subscriber_count == 0
+        return received
+
+    retry, replayed, heartbeat, *rest = asyncio.run(run())
+    assert retry.startswith(b"retry:")
+    assert replayed.endswith(b'event: announcement\ndata: {"n": 2}\n\n')
+    assert heartbeat == b": keepalive\n\n"
+    assert rest == []
+
+
+def test_events_endpoint_validates_topics_and_services_publish(
+    client: TestClient,
+    require_db_driver,
+    create_user,
+) -> None:
+    """The endpoint rejects empty or unknown subscriptions; new content is published."""
+
+    lead_headers = create_user("lead-events@example.com", role=UserRole.LEAD)
+    member_headers = create_user("member-events@example.com", role=UserRole.MEMBER)
+
+    assert client.get("/api/v1/events", headers=member_headers).status_code == 400
+    unknown = client.get(
+        "/api/v1/events",
+        params={"question_id": "00000000-0000-0000-0000-000000000000"},
+        headers=member_headers,
+    )
+    assert unknown.status_code == 404
+
+    question_id = client.post(
+        "/api/v1/qna/questions",
+        json={"title": "How do SSE streams work?", "body": "Details please", "tags": []},
+        headers=member_headers,
+    ).json()["id"]
+    marker = event_hub.publish("test", "marker", "{}")
+    client.post(
+        "/api/v1/announcements",
+        json={"title": "Welcome", "body": "Hello everyone"},
+        headers=lead_headers,
+    )
+    client.post(
+        f"/api/v1/qna/questions/{question_id}/replies",
+        json={"body": "They push events"},
+        headers=lead_headers,
+    )
+
+    subscription = event_hub.subscribe(
+        [ANNOUNCEMENTS_TOPIC, question_topic(question_id)],
+        last_event_id=marker.id,
+    )
+    assert [event.name for event in subscription.backlog] == ["announcement", "reply"]
+    assert json.loads(subscription.backlog[1].data)["body"] == "They push events"
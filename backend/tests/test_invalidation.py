@@ -0,0 +1,117 @@
+"""Cross-process cache invalidation bus tests."""
+
+import asyncio
+import os
+import socket
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.engine import make_url
+
+from app.core.cache import SnapshotCache, TaggedCache
+from app.core.invalidation import (
+    InMemoryBus,
+    InMemoryNetwork,
+    InvalidationBus,
+    PostgresBus,
+    UnixSocketBus,
+)
+
+POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+
+
+def _worker() -> dict[str, TaggedCache]:
+    """Caches of one simulated worker process."""
+
+    return {"catalog": TaggedCache(), "snapshots": SnapshotCache()}
+
+
+async def _eventually(condition, timeout: float = 2.0) -> bool:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            return False
+        await asyncio.sleep(0.01)
+    return True
+
+
+async def _exercise(first: InvalidationBus, second: InvalidationBus) -> None:
+    """Invalidations cross to the peer and leave unrelated entries warm."""
+
+    worker_a, worker_b = _worker(), _worker()
+    await first.start(worker_a)
+    await second.start(worker_b)
+    try:
+        for worker in (worker_a, worker_b):
+            worker["catalog"].set("classes:page", b"[]", ["class:1"])
+            worker["catalog"].set("sessions:page", b"[]", ["sessions"])
+        snapshot = SimpleNamespace(updated_at=datetime(2026, 1, 2))
+        worker_b["snapshots"].set("snapshot:class:1", snapshot, ["snapshot:class:1"])
+        worker_b["snapshots"].set("snapshot:class:2", snapshot, ["snapshot:class:2"])
+
+        worker_a["catalog"].invalidate("class:1")
+        assert await _eventually(lambda: worker_b["catalog"].get("classes:page") is None)
+        assert worker_b["catalog"].get("sessions:page") == b"[]"
+
+        worker_a["snapshots"].invalidate_row("snapshot:class:1")
+        assert await _eventually(lambda: worker_b["snapshots"].get("snapshot:class:1") is None)
+        assert worker_b["snapshots"].get("snapshot:class:2") is snapshot
+    finally:
+        await first.stop()
+        await second.stop()
+
+
+def test_in_memory_bus_delivers_to_peers() -> None:
+    """Buses on one in-memory network behave like separate worker processes."""
+
+    network = InMemoryNetwork()
+    asyncio.run(_exercise(InMemoryBus(network), InMemoryBus(network)))
+
+
+def test_unix_socket_bus_delivers_and_removes_dead_peers(tmp_path: Path) -> None:
+    """Datagrams reach live peers; sockets of exited processes are cleaned up."""
+
+    dead = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    dead.bind(str(tmp_path / "dead.sock"))
+    dead.close()
+
+    asyncio.run(_exercise(UnixSocketBus(tmp_path), UnixSocketBus(tmp_path)))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_unix_socket_bus_clears_peer_that_missed_invalidations(tmp_path: Path) -> None:
+    """A peer whose queue overflowed is told to drop its caches once it reads again."""
+
+    async def run() -> None:
+        sender, receiver = UnixSocketBus(tmp_path), UnixSocketBus(tmp_path)
+        worker = _worker()
+        await sender.start(_worker())
+        await receiver.start(worker)
+        try:
+            worker["catalog"].set("sessions:page", b"[]", ["sessions"])
+            # The receiver cannot read while this loop holds the event loop.
+            for _ in range(100_000):
+                sender.publish("catalog", ("class:1",))
+                if sender._lagging:
+                    break
+            assert sender._lagging == {str(receiver.path)}
+            assert worker["catalog"].get("sessions:page") == b"[]"
+
+            assert await _eventually(lambda: worker["catalog"].get("sessions:page") is None)
+            assert await _eventually(lambda: not sender._lagging)
+        finally:
+            await sender.stop()
+            await receiver.stop()
+
+    asyncio.run(run())
+
+
+@pytest.mark.skipif(not POSTGRES_URL, reason="TEST_POSTGRES_URL is not set")
+def test_postgres_bus_delivers_over_listen_notify() -> None:
+    """NOTIFY payloads reach a bus listening on another connection."""
+
+    assert POSTGRES_URL is not None
+    dsn = make_url(POSTGRES_URL).set(drivername="postgresql").render_as_string(hide_password=False)
+    asyncio.run(_exercise(PostgresBus(dsn), PostgresBus(dsn)))
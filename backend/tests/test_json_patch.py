@@ -0,0 +1,34 @@
+"""RFC 6902 JSON Patch tests."""
+
+import pytest
+
+from app.utils.json_patch import JsonPatchError, apply_patch
+
+
+def test_apply_patch_follows_rfc6902_and_is_atomic() -> None:
+    """Every operation type applies in order; a failing patch leaves the input untouched."""
+
+    document = {"foo": ["bar", "baz"], "a/b": {"~c": 1}}
+    patched = apply_patch(
+        document,
+        [
+            {"op": "add", "path": "/foo/1", "value": "qux"},
+            {"op": "remove", "path": "/foo/0"},
+            {"op": "replace", "path": "/a~1b/~0c", "value": 2},
+            {"op": "copy", "from": "/foo/0", "path": "/first"},
+            {"op": "move", "from": "/foo/1", "path": "/foo/-"},
+            {"op": "test", "path": "/first", "value": "qux"},
+            {"op": "add", "path": "/nothing", "value": None},
+        ],
+    )
+    assert patched == {"foo": ["qux", "baz"], "a/b": {"~c": 2}, "first": "qux", "nothing": None}
+
+    with pytest.raises(JsonPatchError):
+        apply_patch(document, [{"op": "remove", "path": "/foo/0"}, {"op": "test", "path": "/foo/0", "value": "x"}])
+    with pytest.raises(JsonPatchError):
+        apply_patch(document, [{"op": "add", "path": "/foo/5", "value": 1}])
+    with pytest.raises(JsonPatchError):
+        apply_patch(document, [{"op": "move", "from": "/a~1b", "path": "/a~1b/child"}])
+    with pytest.raises(JsonPatchError):
+        apply_patch(document, [{"op": "remove", "path": "/foo/\u00b2"}])
+    assert document == {"foo": ["bar", "baz"], "a/b": {"~c": 1}}
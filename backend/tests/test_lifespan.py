@@ -0,0 +1,30 @@
+"""Application lifespan and warm-up tests."""
+
+import asyncio
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.db.warmup import warm_up_engine
+from app.main import app
+
+
+def test_startup_builds_openapi_schema(client: TestClient) -> None:
+    """OpenAPI schema is generated before the first request is served."""
+
+    assert app.openapi_schema is not None
+    assert "/api/v1/classes" in app.openapi_schema["paths"]
+
+
+def test_warm_up_engine_primes_pooled_connections(
+    db_engine: AsyncEngine,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Warm-up opens connections and probes every mapped table without errors."""
+
+    with caplog.at_level(logging.INFO, logger="app.db.warmup"):
+        asyncio.run(warm_up_engine(db_engine, connections=2))
+
+    assert "Database pool warmed with 2 connection(s)" in caplog.text
@@ -0,0 +1,116 @@
+"""Quarterly plan endpoint tests."""
+
+import csv
+import io
+import json
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from app.api.routes.plans import _parse_if_match
+from app.models.user import UserRole
+from app.services import plan_service
+
+
+def test_export_streams_csv_and_jsonl_filtered_by_quarter_with_memoized_rendering(
+    client: TestClient,
+    require_db_driver,
+    create_user,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Exports filter by quarter, and unchanged plans are only rendered once per format."""
+
+    lead_headers = create_user("lead-plans@example.com", role=UserRole.LEAD)
+    for quarter, objective in (("2026-Q1", "Launch"), ("2026-Q2", "Grow"), ("2026-Q3", "Scale")):
+        client.post(
+            "/api/v1/plans",
+            json={"quarter": quarter, "objectives": [{"title": objective}]},
+            headers=lead_headers,
+        )
+
+    rendered: list[str] = []
+
+    def counting_render(plan, export_format):
+        rendered.append(plan.quarter)
+        return original_render(plan, export_format)
+
+    original_render = plan_service.render_plan
+    monkeypatch.setattr(plan_service, "render_plan", counting_render)
+
+    response = client.get(
+        "/api/v1/plans/export",
+        params={"format": "csv", "quarter": ["2026-Q1", "2026-Q2"]},
+        headers=lead_headers,
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="plans.csv"' in response.headers["content-disposition"]
+    records = list(csv.DictReader(io.StringIO(response.text)))
+    assert [record["quarter"] for record in records] == ["2026-Q1", "2026-Q2"]
+    assert json.loads(records[0]["objectives"]) == [{"title": "Launch"}]
+
+    repeated = client.get(
+        "/api/v1/plans/export",
+        params={"format": "csv", "quarter": ["2026-Q1", "2026-Q2"]},
+        headers=lead_headers,
+    )
+    assert repeated.text == response.text
+    assert rendered == ["2026-Q1", "2026-Q2"]
+
+    lines = client.get("/api/v1/plans/export", params={"format": "jsonl"}, headers=lead_headers).text.splitlines()
+    assert [json.loads(line)["quarter"] for line in lines] == ["2026-Q1", "2026-Q2", "2026-Q3"]
+
+
+def test_json_patch_edits_objectives_under_if_match_version_check(
+    client: TestClient,
+    require_db_driver,
+    create_user,
+) -> None:
+    """Patches need the current ETag, apply atomically and bump the version."""
+
+    lead_headers = create_user("lead-patch@example.com", role=UserRole.LEAD)
+    plan = client.post(
+        "/api/v1/plans",
+        json={"quarter": "2026-Q4", "objectives": [{"title": "Ship", "status": "todo"}]},
+        headers=lead_headers,
+    ).json()
+    assert plan["version"] == 1
+    url = f"/api/v1/plans/{plan['id']}/objectives"
+    patch_headers = {**lead_headers, "Content-Type": "application/json-patch+json"}
+    edit = [
+        {"op": "test", "path": "/0/status", "value": "todo"},
+        {"op": "replace", "path": "/0/status", "value": "done"},
+        {"op": "add", "path": "/-", "value": {"title": "Hire"}},
+    ]
+
+    assert client.patch(url, content=json.dumps(edit), headers=patch_headers).status_code == 428
+
+    response = client.patch(url, content=json.dumps(edit), headers={**patch_headers, "If-Match": '"1"'})
+    assert response.status_code == 200
+    assert response.headers["etag"] == '"2"'
+    assert response.json()["objectives"] == [{"title": "Ship", "status": "done"}, {"title": "Hire"}]
+
+    stale = client.patch(url, content=json.dumps(edit), headers={**patch_headers, "If-Match": '"1"'})
+    assert stale.status_code == 412
+
+    failed_test = client.patch(url, content=json.dumps(edit), headers={**patch_headers, "If-Match": '"2"'})
+    assert failed_test.status_code == 409
+    invalid_value = client.patch(
+        url,
+        content=json.dumps([{"op": "replace", "path": "/0/status", "value": 3}]),
+        headers={**patch_headers, "If-Match": '"2"'},
+    )
+    assert invalid_value.status_code == 409
+
+    export = client.get(f"/api/v1/plans/{plan['id']}/export", headers=lead_headers).json()
+    assert export["objectives"] == [{"title": "Ship", "status": "done"}, {"title": "Hire"}]
+
+
+def test_if_match_rejects_non_ascii_digits() -> None:
+    """Unicode digits that ``int`` cannot parse are a bad request, not a server error."""
+
+    assert _parse_if_match('W/"7"') == 7
+    with pytest.raises(HTTPException) as excinfo:
+        _parse_if_match('"\u00b2"')
+    assert excinfo.value.status_code == 400
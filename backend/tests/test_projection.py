@@ -0,0 +1,56 @@
+"""Column projection tests."""
+
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.db.base import Base
+from app.db.projection import project
+from app.models.announcement import Announcement
+from app.models.class_ import LearningClass
+from app.models.plan import QuarterlyPlan
+from app.models.qna import QnAQuestion, QnAReply
+from app.models.session import ClassSession
+from app.models.user import User
+from app.schemas.announcement import AnnouncementRead
+from app.schemas.class_ import ClassRead
+from app.schemas.plan import PlanRead
+from app.schemas.qna import QuestionRead, ReplyRead
+from app.schemas.session import SessionRead
+from app.schemas.user import UserRead
+
+
+@pytest.mark.parametrize(
+    ("model", "schema"),
+    [
+        (Announcement, AnnouncementRead),
+        (LearningClass, ClassRead),
+        (QuarterlyPlan, PlanRead),
+        (QnAQuestion, QuestionRead),
+        (QnAReply, ReplyRead),
+        (ClassSession, SessionRead),
+        (User, UserRead),
+    ],
+)
+def test_projection_selects_schema_fields(model: type[Base], schema: type[BaseModel]) -> None:
+    """The projection selects exactly the schema's fields, in declaration order."""
+
+    assert [column.key for column in project(model, schema).selected_columns] == list(schema.model_fields)
+
+
+def test_projected_row_validates_into_schema(db_engine: AsyncEngine, create_user) -> None:
+    """A projected row validates into its read schema without loading the entity."""
+
+    create_user("projected@example.com")
+
+    async def run() -> UserRead:
+        async with AsyncSession(db_engine) as session:
+            statement = project(User, UserRead).where(User.email == "projected@example.com")
+            row = (await session.execute(statement)).one()
+            return UserRead.model_validate(row, from_attributes=True)
+
+    user = asyncio.run(run())
+    assert user.email == "projected@example.com"
+    assert user.full_name == "Test User"
@@ -1,6 +1,9 @@
 """Q&A endpoint tests."""
 
+import asyncio
+
 from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncEngine
 
 from app.models.user import UserRole
 
@@ -31,4 +34,175 @@ def test_create_question_and_reply(client: TestClient, require_db_driver, create
 
     list_response = client.get("/api/v1/qna/questions", headers=member_headers)
     assert list_response.status_code == 200
-    assert len(list_response.json()) == 1
+    assert len(list_response.json()["items"]) == 1
+
+
+def test_search_ranks_title_matches_first(client: TestClient, require_db_driver, create_user) -> None:
+    """Search uses the full-text index, ranks title hits first and hides deleted questions."""
+
+    member_headers = create_user("member8@example.com", role=UserRole.MEMBER)
+    lead_headers = create_user("lead8@example.com", role=UserRole.LEAD)
+    questions = [
+        ("Deploying containers", "How do I tune the connection pool for postgres?", []),
+        ("Postgres connection pooling", "Which pooler should we run in production?", []),
+        ("Unrelated question", "Nothing to see here.", []),
+        ("Postgres vacuum", "Autovacuum keeps running.", []),
+    ]
+    ids = []
+    for title, body, tags in questions:
+        response = client.post(
+            "/api/v1/qna/questions",
+            json={"title": title, "body": body, "tags": tags},
+            headers=member_headers,
+        )
+        ids.append(response.json()["id"])
+    client.delete(f"/api/v1/qna/questions/{ids[3]}", headers=lead_headers)
+
+    response = client.get(
+        "/api/v1/qna/questions",
+        params={"search": "postgres pools"},
+        headers=member_headers,
+    )
+
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()["items"]] == [ids[1], ids[0]]
+    assert response.json()["next_cursor"] is None
+
+    paged = client.get(
+        "/api/v1/qna/questions",
+        params={"search": "postgres", "cursor": "abc"},
+        headers=member_headers,
+    )
+    assert paged.status_code == 400
+
+
+def test_tag_filter_and_facet_counts(client: TestClient, require_db_driver, create_user) -> None:
+    """Tags are normalized into rows that back the filter and the facet counts."""
+
+    member_headers = create_user("member9@example.com", role=UserRole.MEMBER)
+    lead_headers = create_user("lead9@example.com", role=UserRole.LEAD)
+    ids = []
+    for tags in (["Python", "asyncio", "python"], ["python"], ["sql"], ["sql", "python"]):
+        response = client.post(
+            "/api/v1/qna/questions",
+            json={"title": "Tagged question", "body": "Body text", "tags": tags},
+            headers=member_headers,
+        )
+        assert response.status_code == 201
+        ids.append(response.json()["id"])
+    client.delete(f"/api/v1/qna/questions/{ids[3]}", headers=lead_headers)
+
+    filtered = client.get("/api/v1/qna/questions", params={"tag": " PYTHON "}, headers=member_headers)
+    assert {item["id"] for item in filtered.json()["items"]} == {ids[0], ids[1]}
+
+    facets = client.get("/api/v1/qna/tags", headers=member_headers)
+    assert facets.status_code == 200
+    assert facets.json() == [
+        {"tag": "python", "count": 2},
+        {"tag": "asyncio", "count": 1},
+        {"tag": "sql", "count": 1},
+    ]
+
+
+def test_tag_filter_pages_newest_first(client: TestClient, require_db_driver, create_user) -> None:
+    """Tag listings page newest first along the tag rows' copied creation times."""
+
+    member_headers = create_user("member-tag-pages@example.com", role=UserRole.MEMBER)
+    ids = []
+    for tags in (["python"], ["sql"], ["python"], ["python", "sql"]):
+        response = client.post(
+            "/api/v1/qna/questions",
+            json={"title": "Tagged question", "body": "Body text", "tags": tags},
+            headers=member_headers,
+        )
+        ids.append(response.json()["id"])
+
+    first = client.get("/api/v1/qna/questions", params={"tag": "python", "limit": 2}, headers=member_headers).json()
+    assert [item["id"] for item in first["items"]] == [ids[3], ids[2]]
+
+    second = client.get(
+        "/api/v1/qna/questions",
+        params={"tag": "python", "limit": 2, "cursor": first["next_cursor"]},
+        headers=member_headers,
+    ).json()
+    assert [item["id"] for item in second["items"]] == [ids[0]]
+    assert second["next_cursor"] is None
+
+
+def test_reply_counts_drive_unanswered_and_activity_sort(
+    client: TestClient,
+    require_db_driver,
+    create_user,
+) -> None:
+    """Replies bump the denormalized count and activity used by filters and sorting."""
+
+    member_headers = create_user("member10@example.com", role=UserRole.MEMBER)
+    ids = []
+    for title in ("First question", "Second question", "Third question"):
+        response = client.post(
+            "/api/v1/qna/questions",
+            json={"title": title, "body": "Body text", "tags": []},
+            headers=member_headers,
+        )
+        ids.append(response.json()["id"])
+    for _ in range(2):
+        client.post(
+            f"/api/v1/qna/questions/{ids[0]}/replies",
+            json={"body": "An answer"},
+            headers=member_headers,
+        )
+
+    unanswered = client.get(
+        "/api/v1/qna/questions",
+        params={"unanswered": "true"},
+        headers=member_headers,
+    ).json()
+    assert [item["id"] for item in unanswered["items"]] == [ids[2], ids[1]]
+    assert all(item["reply_count"] == 0 for item in unanswered["items"])
+
+    by_activity = client.get(
+        "/api/v1/qna/questions",
+        params={"sort": "activity", "limit": 2},
+        headers=member_headers,
+    ).json()
+    assert [item["id"] for item in by_activity["items"]] == [ids[0], ids[2]]
+    assert by_activity["items"][0]["reply_count"] == 2
+
+    next_page = client.get(
+        "/api/v1/qna/questions",
+        params={"sort": "activity", "limit": 2, "cursor": by_activity["next_cursor"]},
+        headers=member_headers,
+    ).json()
+    assert [item["id"] for item in next_page["items"]] == [ids[1]]
+
+    newest = client.get("/api/v1/qna/questions", params={"limit": 2}, headers=member_headers).json()
+    mismatched = client.get(
+        "/api/v1/qna/questions",
+        params={"sort": "activity", "cursor": newest["next_cursor"]},
+        headers=member_headers,
+    )
+    assert mismatched.status_code == 400
+
+
+def test_search_survives_rowid_renumbering(client: TestClient, db_engine: AsyncEngine, create_user) -> None:
+    """SQLite search never relies on implicit rowids, which ``VACUUM`` and table rebuilds may renumber."""
+
+    member_headers = create_user("member-rowid@example.com", role=UserRole.MEMBER)
+    ids = [
+        client.post(
+            "/api/v1/qna/questions",
+            json={"title": title, "body": "Body text.", "tags": []},
+            headers=member_headers,
+        ).json()["id"]
+        for title in ("Kafka consumer lag", "Redis eviction policy")
+    ]
+
+    async def renumber() -> None:
+        async with db_engine.begin() as connection:
+            await connection.exec_driver_sql("UPDATE qna_questions SET rowid = rowid + 100")
+
+    asyncio.run(renumber())
+
+    for search, expected in (("kafka", [ids[0]]), ("redis", [ids[1]])):
+        response = client.get("/api/v1/qna/questions", params={"search": search}, headers=member_headers)
+        assert [item["id"] for item in response.json()["items"]] == expected
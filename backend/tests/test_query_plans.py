@@ -0,0 +1,248 @@
+"""Query-plan tests for repository statements.
+
+The hot Q&A list queries are checked against their partial indexes on empty
+tables. Set ``TEST_QUERY_PLANS_AT_SCALE=1`` to also seed a dataset at the
+recorded scale and compare the plan of every repository method with the
+expectations in ``benchmarks/baselines`` (see ``benchmarks.query_plans``).
+
+SQLite runs by default. Set ``TEST_POSTGRES_URL`` to an empty scratch
+PostgreSQL database (``postgresql+asyncpg://...``) to check PostgreSQL too.
+"""
+
+import asyncio
+import importlib
+import inspect
+import json
+import os
+import pkgutil
+import uuid
+from collections.abc import Awaitable, Callable, Generator
+from typing import Any
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+import app.repositories
+from app.db.init_db import create_all_tables, drop_all_tables
+from app.repositories.qna_repo import QnARepository
+from app.utils.pagination import encode_cursor
+from app.utils.time import utc_now
+from benchmarks.query_plans import (
+    CASES,
+    collect_plans,
+    degradations,
+    expectation_path,
+    summarize,
+)
+
+POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+AT_SCALE = os.environ.get("TEST_QUERY_PLANS_AT_SCALE") == "1"
+
+RepoCall = Callable[[QnARepository], Awaitable[Any]]
+
+HOT_QUERIES: list[tuple[str, RepoCall, tuple[str, ...]]] = [
+    (
+        "questions-newest",
+        lambda repo: repo.list_questions(),
+        ("ix_qna_questions_live_created_at_id",),
+    ),
+    (
+        "questions-newest-next-page",
+        lambda repo: repo.list_questions(cursor=encode_cursor(utc_now(), uuid.uuid4(), "created_at")),
+        ("ix_qna_questions_live_created_at_id",),
+    ),
+    (
+        "questions-activity",
+        lambda repo: repo.list_questions(sort="activity"),
+        ("ix_qna_questions_live_last_activity_at_id",),
+    ),
+    (
+        "questions-unanswered",
+        lambda repo: repo.list_questions(unanswered=True),
+        # Without statistics the planner may prefer the wider live-row index;
+        # either one avoids the sort and never visits deleted rows.
+        ("ix_qna_questions_unanswered", "ix_qna_questions_live_created_at_id"),
+    ),
+    (
+        "replies",
+        lambda repo: repo.list_replies(uuid.uuid4()),
+        ("ix_qna_replies_live_question_id_created_at_id",),
+    ),
+]
+
+
+@pytest.fixture(params=["sqlite", "postgresql"])
+def plan_engine(request: pytest.FixtureRequest) -> Generator[AsyncEngine, None, None]:
+    """Yield an engine with the full schema for each dialect under test."""
+
+    if request.param == "sqlite":
+        yield request.getfixturevalue("db_engine")
+        return
+
+    if not POSTGRES_URL:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+    engine = create_async_engine(POSTGRES_URL)
+    asyncio.run(create_all_tables(engine))
+    yield engine
+    asyncio.run(drop_all_tables(engine))
+    asyncio.run(engine.dispose())
+
+
+async def _capture(engine: AsyncEngine, call: RepoCall) -> tuple[str, Any]:
+    """Run a repository call and return the SQL and parameters it sent to the driver."""
+
+    captured: list[tuple[str, Any]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        captured.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        async with AsyncSession(engine) as session:
+            await call(QnARepository(session))
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+    assert len(captured) == 1
+    return captured[0]
+
+
+async def _explain(engine: AsyncEngine, statement: str, parameters: Any) -> str:
+    async with engine.connect() as connection:
+        if engine.dialect.name == "postgresql":
+            # Empty tables make a sequential scan the cheapest plan; rule it out
+            # so the test checks that a matching index exists and is usable.
+            await connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+            result = await connection.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+        else:
+            result = await connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        return "\n".join(str(row[-1]) for row in result)
+
+
+@pytest.mark.parametrize(
+    ("call", "index_names"),
+    [pytest.param(call, index_names, id=name) for name, call, index_names in HOT_QUERIES],
+)
+def test_hot_qna_queries_use_partial_indexes(
+    plan_engine: AsyncEngine,
+    call: RepoCall,
+    index_names: tuple[str, ...],
+) -> None:
+    """Each hot list query is answered from its live-row index without a sort step."""
+
+    async def run() -> str:
+        statement, parameters = await _capture(plan_engine, call)
+        return await _explain(plan_engine, statement, parameters)
+
+    plan = asyncio.run(run())
+
+    assert any(index_name in plan for index_name in index_names), plan
+    assert "TEMP B-TREE" not in plan
+    assert "Sort" not in plan
+
+
+def _repository_methods() -> set[str]:
+    methods = set()
+    for module_info in pkgutil.iter_modules(app.repositories.__path__):
+        module = importlib.import_module(f"app.repositories.{module_info.name}")
+        for class_name, repository in inspect.getmembers(module, inspect.isclass):
+            if repository.__module__ != module.__name__ or not class_name.endswith("Repository"):
+                continue
+            methods.update(
+                f"{class_name}.{name}"
+                for name, _ in inspect.getmembers(repository, inspect.isfunction)
+                if not name.startswith("_")
+            )
+    return methods
+
+
+def test_every_repository_method_has_a_plan_case() -> None:
+    """New repository methods cannot skip the scale plan checks."""
+
+    covered = {name.split("[")[0] for name in CASES}
+    assert _repository_methods() - covered == set()
+
+
+@pytest.mark.parametrize("dialect", ["sqlite", "postgresql"])
+def test_plan_expectations_match_the_cases(dialect: str) -> None:
+    """Checked-in expectations are re-recorded whenever cases are added or removed."""
+
+    path = expectation_path(dialect)
+    if not path.exists():
+        pytest.skip(f"no {dialect} expectations recorded")
+    assert set(json.loads(path.read_text())["plans"]) == set(CASES)
+
+
+def test_plan_degradations_flag_new_scans_sorts_and_statements() -> None:
+    """Only full scans, sorts and extra statements count as degradations."""
+
+    indexed = summarize(
+        "sqlite",
+        "SELECT * FROM users ORDER BY created_at DESC",
+        ["SCAN users USING INDEX ix_users_created_at_id"],
+    ).to_dict()
+    scanned = summarize(
+        "sqlite",
+        "SELECT * FROM users ORDER BY created_at DESC",
+        ["SCAN users", "USE TEMP B-TREE FOR ORDER BY"],
+    ).to_dict()
+    postgres = summarize(
+        "postgresql",
+        "SELECT * FROM users ORDER BY created_at DESC",
+        [
+            "Limit  (cost=0.29..1.52 rows=50 width=96)",
+            "  ->  Sort  (cost=0.29..1.52 rows=100 width=96)",
+            "        ->  Seq Scan on users  (cost=0.00..1.00 rows=100 width=96)",
+        ],
+    )
+
+    assert scanned["full_scans"] == ["users"] and scanned["sorts"] == 1
+    assert (postgres.full_scans, postgres.sorts) == (("users",), 1)
+    assert "cost=" not in "".join(postgres.plan)
+    assert degradations([indexed], [indexed]) == []
+    assert degradations([scanned], [indexed]) == []
+    assert len(degradations([indexed], [scanned])) == 2
+    assert degradations([indexed], [indexed, indexed]) == ["sends 2 statements, expected 1"]
+    assert degradations(None, [indexed])
+
+
+@pytest.fixture(scope="module", params=["sqlite", "postgresql"])
+def plans_at_scale(
+    request: pytest.FixtureRequest,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Seed a dialect at its recorded scale once and return its expected and actual plans."""
+
+    if not AT_SCALE:
+        pytest.skip("TEST_QUERY_PLANS_AT_SCALE is not set")
+    path = expectation_path(request.param)
+    if not path.exists():
+        pytest.skip(f"no {request.param} expectations recorded; run `python -m benchmarks.query_plans record`")
+    if request.param == "sqlite":
+        url = f"sqlite+aiosqlite:///{tmp_path_factory.mktemp('query_plans') / 'plans.db'}"
+    elif POSTGRES_URL:
+        url = POSTGRES_URL
+    else:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+
+    expected = json.loads(path.read_text())
+    metadata = expected["metadata"]
+
+    async def run() -> dict[str, Any]:
+        engine = create_async_engine(url)
+        try:
+            return await collect_plans(engine, metadata["scale"], metadata["seed"])
+        finally:
+            await engine.dispose()
+
+    return expected, asyncio.run(run())
+
+
+@pytest.mark.parametrize("name", list(CASES))
+def test_repository_query_plans_at_scale(plans_at_scale: tuple[dict[str, Any], dict[str, Any]], name: str) -> None:
+    """No repository statement gains a full scan, a sort or a sibling statement at scale."""
+
+    expected, actual = plans_at_scale
+    problems = degradations(expected["plans"].get(name), actual["plans"][name])
+    assert not problems, "\n".join(problems)
@@ -0,0 +1,40 @@
+"""Single-pass list serialization tests."""
+
+import json
+import uuid
+from types import SimpleNamespace
+
+from app.schemas.common import Page, _page_adapter, list_json, page_json
+from app.schemas.qna import QuestionRead, TagCount
+from app.utils.time import utc_now
+
+
+def test_page_json_matches_response_model_output() -> None:
+    """The bytes equal what FastAPI produced from validated models, and adapters are reused."""
+
+    now = utc_now()
+    rows = [
+        SimpleNamespace(
+            id=uuid.uuid4(),
+            author_id=uuid.uuid4(),
+            title=f"Question {number}",
+            body="Why?",
+            tags=["python"],
+            reply_count=number,
+            last_activity_at=now,
+            created_at=now,
+            updated_at=now,
+        )
+        for number in range(3)
+    ]
+
+    body = page_json(QuestionRead, rows, "next")
+    expected = Page[QuestionRead](
+        items=[QuestionRead.model_validate(row) for row in rows],
+        next_cursor="next",
+    ).model_dump_json()
+    assert body == expected.encode()
+    assert _page_adapter(QuestionRead) is _page_adapter(QuestionRead)
+
+    tags = [SimpleNamespace(tag="python", count=2), SimpleNamespace(tag="sql", count=1)]
+    assert json.loads(list_json(TagCount, tags)) == [{"tag": "python", "count": 2}, {"tag": "sql", "count": 1}]
@@ -0,0 +1,114 @@
+"""Session endpoint tests."""
+
+from datetime import timedelta
+
+from fastapi.testclient import TestClient
+
+from app.models.user import UserRole
+from app.utils.time import utc_now
+
+
+def _create_class(client: TestClient, headers: dict[str, str], title: str) -> str:
+    response = client.post(
+        "/api/v1/classes",
+        json={"title": title, "description": None, "is_published": True},
+        headers=headers,
+    )
+    return response.json()["id"]
+
+
+def _create_session(
+    client: TestClient,
+    headers: dict[str, str],
+    class_id: str,
+    title: str,
+    starts_at: str,
+) -> str:
+    response = client.post(
+        "/api/v1/sessions",
+        json={
+            "class_id": class_id,
+            "title": title,
+            "starts_at": starts_at,
+            "ends_at": starts_at.replace("T18", "T20"),
+        },
+        headers=headers,
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def test_list_sessions_filters_by_start_window(
+    client: TestClient,
+    require_db_driver,
+    create_user,
+) -> None:
+    """``from`` is inclusive, ``to`` is exclusive, and an inverted window is rejected."""
+
+    lead_headers = create_user("lead11@example.com", role=UserRole.LEAD)
+    class_id = _create_class(client, lead_headers, "Windowed class")
+    for day in ("01", "08", "15"):
+        _create_session(client, lead_headers, class_id, f"Day {day}", f"2026-03-{day}T18:00:00")
+
+    response = client.get(
+        "/api/v1/sessions",
+        params={"class_id": class_id, "from": "2026-03-08T18:00:00", "to": "2026-03-15T18:00:00"},
+        headers=lead_headers,
+    )
+    assert response.status_code == 200
+    assert [item["title"] for item in response.json()["items"]] == ["Day 08"]
+
+    inverted = client.get(
+        "/api/v1/sessions",
+        params={"from": "2026-03-15T00:00:00", "to": "2026-03-01T00:00:00"},
+        headers=lead_headers,
+    )
+    assert inverted.status_code == 400
+
+
+def test_upcoming_sessions_and_cached_calendar_feeds(
+    client: TestClient,
+    require_db_driver,
+    create_user,
+) -> None:
+    """Upcoming sessions follow enrollments; ICS feeds refresh when their sessions change."""
+
+    lead_headers = create_user("lead12@example.com", role=UserRole.LEAD)
+    member_headers = create_user("member12@example.com", role=UserRole.MEMBER)
+    enrolled_class = _create_class(client, lead_headers, "Enrolled class")
+    other_class = _create_class(client, lead_headers, "Other class")
+    client.post("/api/v1/enrollment", json={"class_id": enrolled_class}, headers=member_headers)
+
+    tomorrow = (utc_now() + timedelta(days=1)).strftime("%Y-%m-%dT18:00:00")
+    yesterday = (utc_now() - timedelta(days=1)).strftime("%Y-%m-%dT18:00:00")
+    _create_session(client, lead_headers, enrolled_class, "Past session", yesterday)
+    _create_session(client, lead_headers, enrolled_class, "Next session", tomorrow)
+    _create_session(client, lead_headers, other_class, "Not mine", tomorrow)
+
+    upcoming = client.get("/api/v1/sessions/upcoming", headers=member_headers)
+    assert upcoming.status_code == 200
+    assert [item["title"] for item in upcoming.json()["items"]] == ["Next session"]
+
+    feed = client.get("/api/v1/sessions/calendar/me.ics", headers=member_headers)
+    assert feed.status_code == 200
+    assert feed.headers["content-type"].startswith("text/calendar")
+    assert feed.text.startswith("BEGIN:VCALENDAR\r\n")
+    assert "SUMMARY:Next session" in feed.text
+    assert "SUMMARY:Past session" in feed.text
+    assert "Not mine" not in feed.text
+
+    class_feed = client.get(
+        f"/api/v1/sessions/calendar/classes/{other_class}.ics",
+        headers=member_headers,
+    )
+    assert "X-WR-CALNAME:Other class" in class_feed.text
+
+    _create_session(client, lead_headers, enrolled_class, "Added later, with commas", tomorrow)
+    refreshed = client.get("/api/v1/sessions/calendar/me.ics", headers=member_headers)
+    assert "SUMMARY:Added later\\, with commas" in refreshed.text
+
+    missing = client.get(
+        "/api/v1/sessions/calendar/classes/00000000-0000-0000-0000-000000000000.ics",
+        headers=member_headers,
+    )
+    assert missing.status_code == 404